@@ -3,12 +3,21 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from app.routes.admin import admin_router
 from app.routes.auth import auth_router
+from app.routes.report import report_router
 from app.routes.task import task_router
 from app.routes.user import user_router
+from app.utilities.archive import archiver
+from app.utilities.backup import backups
 from app.utilities.config import Config
 from app.utilities.database import init_table
 from app.utilities.logger import get_logger
+from app.utilities.maintenance import maintainer
+from app.utilities.principal_cache import principal_cache
+from app.utilities.serializer import FastJSONResponse
+from app.utilities.shard import init_shards
+from app.utilities.write_batch import stop_coordinators
 
 logger = get_logger(__name__)
 
@@ -18,11 +27,19 @@ async def lifespan(app: FastAPI):  # noqa
     # Startup
     logger.info("Starting up...")
     init_table()
+    init_shards()
+    principal_cache.clear()
+    archiver.start()
+    maintainer.start()
 
     yield
 
     # Shutdown
     logger.info("Shutting down...")
+    maintainer.stop()
+    archiver.stop()
+    backups.stop()
+    stop_coordinators()
 
 
 app = FastAPI(
@@ -30,6 +47,7 @@ app = FastAPI(
     description=Config.DESCRIPTION,
     version=Config.VERSION,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -51,3 +69,5 @@ async def root():
 app.include_router(auth_router, prefix="/auth", tags=["Auth"])
 app.include_router(task_router, prefix="/task", tags=["Tasks"])
 app.include_router(user_router, prefix="/user", tags=["Users"])
+app.include_router(report_router, prefix="/report", tags=["Reports"])
+app.include_router(admin_router, prefix="/admin", tags=["Admin"])
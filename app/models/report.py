@@ -0,0 +1,40 @@
+from datetime import date
+from enum import Enum
+
+from sqlmodel import Field, SQLModel
+
+from app.models.task import TaskStatus
+
+
+class RollupBucket(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+
+
+class TaskRollup(SQLModel, table=True):
+    """
+    Tasks created and closed per owner and period; weeks start on Monday (UTC).
+    """
+
+    __tablename__ = "task_rollups"
+
+    owner_id: int = Field(primary_key=True)
+    bucket: RollupBucket = Field(primary_key=True)
+    period_start: date = Field(primary_key=True)
+    created: int = Field(default=0)
+    closed: int = Field(default=0)
+
+
+class TaskTransitionRollup(SQLModel, table=True):
+    """
+    Status transitions per owner and period.
+    """
+
+    __tablename__ = "task_transition_rollups"
+
+    owner_id: int = Field(primary_key=True)
+    bucket: RollupBucket = Field(primary_key=True)
+    period_start: date = Field(primary_key=True)
+    from_status: TaskStatus = Field(primary_key=True)
+    to_status: TaskStatus = Field(primary_key=True)
+    count: int = Field(default=0)
@@ -2,8 +2,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import JSON, Column, Index, text
 from sqlmodel import SQLModel, Field, Relationship
 
+from app.models.types import EpochMicros
 from app.utilities.helper import get_utc_now
 
 
@@ -17,20 +19,98 @@ class TaskStatus(str, Enum):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Owner-scoped delta sync walks (updated_at, id) in order
+        Index("ix_tasks_owner_id_updated_at", "owner_id", "updated_at", "id"),
+        # Active task listings skip soft-deleted rows entirely
+        Index(
+            "ix_tasks_active_owner_id",
+            "owner_id",
+            "id",
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(index=True)
     description: Optional[str] = None
     note: Optional[str] = None
     status: TaskStatus = Field(default=TaskStatus.OPEN, index=True)
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
 
-    is_active: bool = Field(default=True, index=True)
+    is_active: bool = Field(default=True)
     created_at: datetime = Field(
-        default_factory=get_utc_now, alias="created_at", index=True
+        default_factory=get_utc_now, alias="created_at", index=True, sa_type=EpochMicros
     )
     updated_at: datetime = Field(
-        default_factory=get_utc_now, alias="updated_at", index=True
+        default_factory=get_utc_now, alias="updated_at", index=True, sa_type=EpochMicros
     )
 
     owner_id: int = Field(foreign_key="users.id", index=True)
     owner: Optional["User"] = Relationship()  # noqa
+
+
+class TaskArchive(SQLModel, table=True):
+    """
+    Tasks soft-deleted long enough ago to be moved out of `tasks`, restorable by an admin.
+    """
+
+    __tablename__ = "tasks_archive"
+
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    title: str
+    description: Optional[str] = None
+    note: Optional[str] = None
+    status: TaskStatus
+    version: int
+    is_active: bool
+    created_at: datetime = Field(sa_type=EpochMicros)
+    updated_at: datetime = Field(sa_type=EpochMicros)
+    owner_id: int = Field(index=True)
+    archived_at: datetime = Field(
+        default_factory=get_utc_now, index=True, sa_type=EpochMicros
+    )
+
+
+class TaskIdSequence(SQLModel, table=True):
+    """
+    Per-shard task id counter, so ids stay unique across shard files.
+    """
+
+    __tablename__ = "task_id_sequence"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    value: int = Field(default=0)
+
+
+class TaskCounter(SQLModel, table=True):
+    """
+    Per-owner task counts by status and activity, kept in sync by triggers on `tasks`.
+    """
+
+    __tablename__ = "task_counters"
+
+    owner_id: int = Field(primary_key=True)
+    status: TaskStatus = Field(primary_key=True)
+    is_active: bool = Field(primary_key=True)
+    count: int = Field(default=0)
+
+
+class TaskEvent(SQLModel, table=True):
+    """
+    Append-only change log of a task: one row per mutation with its field diffs.
+    """
+
+    __tablename__ = "task_events"
+    __table_args__ = (
+        # History pages walk a single task's events in order
+        Index("ix_task_events_task_id_seq", "task_id", "seq"),
+    )
+
+    seq: Optional[int] = Field(default=None, primary_key=True)
+    task_id: int
+    owner_id: int = Field(index=True)
+    version: int
+    type: str
+    changes: dict = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    created_at: datetime = Field(default_factory=get_utc_now, sa_type=EpochMicros)
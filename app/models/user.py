@@ -3,9 +3,11 @@ from enum import Enum
 from typing import Optional
 
 from pydantic import EmailStr
+from sqlalchemy import Index, text
 from sqlmodel import Field
 from sqlmodel import SQLModel
 
+from app.models.types import EpochMicros
 from app.utilities.helper import get_utc_now
 
 
@@ -16,6 +18,10 @@ class UserRole(str, Enum):
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        # Active user listings skip soft-deleted rows entirely
+        Index("ix_users_active_id", "id", sqlite_where=text("is_active = 1")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     full_name: str
@@ -23,11 +29,14 @@ class User(SQLModel, table=True):
     phone_no: Optional[str] = None
     hashed_password: str
     role: UserRole = Field(default=UserRole.USER, index=True)
+    token_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    shard: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
 
-    is_active: bool = Field(default=True, index=True)
+    is_active: bool = Field(default=True)
     created_at: datetime = Field(
-        default_factory=get_utc_now, alias="created_at", index=True
+        default_factory=get_utc_now, alias="created_at", index=True, sa_type=EpochMicros
     )
     updated_at: datetime = Field(
-        default_factory=get_utc_now, alias="updated_at", index=True
+        default_factory=get_utc_now, alias="updated_at", index=True, sa_type=EpochMicros
     )
@@ -0,0 +1,96 @@
+from fastapi import Depends, HTTPException, APIRouter, Response
+
+from app.schemas.backup import BackupJob, BackupSnapshot
+from app.schemas.maintenance import MaintenanceStatus
+from app.utilities.backup import backups, list_backups
+from app.utilities.logger import get_logger
+from app.utilities.maintenance import database_file, maintainer
+from app.utilities.security import has_admin_role
+from app.utilities.shard import Shard, scatter_gather
+
+admin_router = APIRouter()
+logger = get_logger(__name__)
+
+
+@admin_router.get("/maintenance", response_model=MaintenanceStatus, status_code=200)
+def get_maintenance_status(
+    is_admin: bool = Depends(has_admin_role),
+) -> MaintenanceStatus:
+    """
+    Page count, free list and WAL size of every shard's database file,
+    with the shard's last maintenance pass (admin only).
+    """
+    try:
+
+        def stats(shard: Shard):
+            return database_file(shard, maintainer.last_runs.get(shard.index))
+
+        files = scatter_gather(stats)
+        logger.info(f"Maintenance status for {len(files)} database files")
+        return MaintenanceStatus(files=files)
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during maintenance status")
+        raise HTTPException(status_code=500, detail="Failed to read maintenance status")
+
+
+@admin_router.post("/backup", response_model=BackupJob, status_code=202)
+def create_database_backup(
+    response: Response,
+    is_admin: bool = Depends(has_admin_role),
+) -> BackupJob:
+    """
+    Start a snapshot of every shard's database in the background while the
+    app keeps serving (admin only). Poll `GET /admin/backup` (the `Location`
+    header) for its state. Older snapshots beyond `BACKUP_KEEP` are removed.
+    """
+    try:
+        job = backups.start()
+        if job is None:
+            raise HTTPException(status_code=409, detail="A backup is already running")
+
+        logger.info("Backup started")
+        response.headers["Location"] = "/admin/backup"
+        return job
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during database backup")
+        raise HTTPException(
+            status_code=500, detail="Failed to start the database backup"
+        )
+
+
+@admin_router.get("/backup", response_model=BackupJob, status_code=200)
+def get_database_backup(
+    is_admin: bool = Depends(has_admin_role),
+) -> BackupJob:
+    """
+    State of the running backup job, or of the last one to finish (admin only).
+    """
+    job = backups.job
+    if job is None:
+        raise HTTPException(status_code=404, detail="No backup has been started")
+    return job
+
+
+@admin_router.get("/backups", response_model=list[BackupSnapshot], status_code=200)
+def list_database_backups(
+    is_admin: bool = Depends(has_admin_role),
+) -> list[BackupSnapshot]:
+    """
+    Completed backups with their files' checksums, newest first (admin only).
+    """
+    try:
+        snapshots = list_backups()
+        logger.info(f"Total backups: {len(snapshots)}")
+        return snapshots
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during backup listing")
+        raise HTTPException(status_code=500, detail="Failed to list backups")
@@ -1,46 +1,67 @@
 from datetime import timedelta
 
 from fastapi import Depends, HTTPException, APIRouter
-from sqlmodel import Session, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
 
 from app.models.user import User
 from app.schemas.auth import UserSignup, UserLogin, UserToken
 from app.schemas.user import ReadUser
+from app.utilities.cache import user_cache
 from app.utilities.config import Config
-from app.utilities.database import get_db_session
+from app.utilities.database import get_db_session, get_read_db_session
 from app.utilities.logger import get_logger
 from app.utilities.security import hash_password, verify_password, create_token
+from app.utilities.shard import shard_router
+from app.utilities.statements import user_by_email
 
 auth_router = APIRouter()
 logger = get_logger(__name__)
 
 
 @auth_router.post("/signup", response_model=ReadUser, status_code=201)
-def signup(user: UserSignup, db_session: Session = Depends(get_db_session)) -> ReadUser:
+def signup(
+    user: UserSignup,
+    db_session: Session = Depends(get_db_session),
+    read_session: Session = Depends(get_read_db_session),
+) -> ReadUser:
     try:
         # Normalize email
         email_normalized = str(user.email_id).lower()
+        detail = f"User with email {email_normalized} already exists."
 
         # Check if user already exists
-        existing_user = db_session.exec(
-            select(User).where(User.email_id == email_normalized)
-        ).first()
+        existing_user = (
+            read_session.exec(user_by_email(email_normalized)).scalars().first()
+        )
 
         if existing_user:
-            detail = f"User with email {email_normalized} already exists."
             logger.warning(detail)
             raise HTTPException(status_code=409, detail=detail)
 
+        # Hash before touching the writer: its single connection would be held for the hash
+        hashed_password = hash_password(user.password)
+
         # Create new user
         new_user = User(
             full_name=user.full_name.strip(),
             email_id=email_normalized,
             phone_no=user.phone_no,
-            hashed_password=hash_password(user.password),
+            hashed_password=hashed_password,
         )
 
-        db_session.add(new_user)
+        try:
+            db_session.add(new_user)
+            db_session.flush()
+        except IntegrityError:
+            # Signed up concurrently since the check above
+            db_session.rollback()
+            logger.warning(detail)
+            raise HTTPException(status_code=409, detail=detail)
+
+        new_user.shard = shard_router.shard_for(new_user.id)
         db_session.commit()
+        user_cache.bump()
         db_session.refresh(new_user)
 
         logger.info(f"New user created: {new_user.email_id} (id={new_user.id})")
@@ -55,15 +76,15 @@ def signup(user: UserSignup, db_session: Session = Depends(get_db_session)) -> R
 
 
 @auth_router.post("/login", response_model=UserToken, status_code=200)
-def login(user: UserLogin, db_session: Session = Depends(get_db_session)) -> UserToken:
+def login(
+    user: UserLogin, db_session: Session = Depends(get_read_db_session)
+) -> UserToken:
     try:
         # Normalize email
         email_normalized = str(user.email_id).lower()
 
         # Get user from database
-        db_user = db_session.exec(
-            select(User).where(User.email_id == email_normalized)
-        ).first()
+        db_user = db_session.exec(user_by_email(email_normalized)).scalars().first()
 
         if not db_user:
             detail = f"User with email {email_normalized} not found."
@@ -82,10 +103,14 @@ def login(user: UserLogin, db_session: Session = Depends(get_db_session)) -> Use
 
         return UserToken(
             access_token=create_token(
-                str(db_user.id), timedelta(minutes=Config.ACCESS_TOKEN_EXPIRE_MINUTES)
+                str(db_user.id),
+                timedelta(minutes=Config.ACCESS_TOKEN_EXPIRE_MINUTES),
+                db_user.token_version,
             ),
             refresh_token=create_token(
-                str(db_user.id), timedelta(hours=Config.REFRESH_TOKEN_EXPIRE_HOURS)
+                str(db_user.id),
+                timedelta(hours=Config.REFRESH_TOKEN_EXPIRE_HOURS),
+                db_user.token_version,
             ),
         )
 
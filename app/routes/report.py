@@ -0,0 +1,114 @@
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from fastapi import Depends, HTTPException, APIRouter, Query
+from fastapi.responses import HTMLResponse
+from sqlmodel import Session, select
+
+from app.models.report import RollupBucket
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.report import ReportSummary
+from app.utilities.config import Config
+from app.utilities.fast_read import read_task_report_rows
+from app.utilities.helper import get_utc_now
+from app.utilities.logger import get_logger
+from app.utilities.principal_cache import Principal
+from app.utilities.render import render_report
+from app.utilities.rollup import read_report_summary
+from app.utilities.security import get_current_principal
+from app.utilities.shard import get_task_read_session
+
+report_router = APIRouter()
+logger = get_logger(__name__)
+
+
+def report_range(
+    from_date: Optional[date], to_date: Optional[date]
+) -> tuple[date, date]:
+    """
+    Resolve a report's date range, defaulting to the last `REPORT_DEFAULT_DAYS`
+    days up to today (UTC).
+
+    Raises:
+        HTTPException: 400 if the range is reversed or longer than `REPORT_MAX_DAYS`.
+    """
+    to_date = to_date or get_utc_now().date()
+    from_date = from_date or to_date - timedelta(days=Config.REPORT_DEFAULT_DAYS - 1)
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    if (to_date - from_date).days >= Config.REPORT_MAX_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {Config.REPORT_MAX_DAYS} days per report"
+        )
+    return from_date, to_date
+
+
+@report_router.get("/summary", response_model=ReportSummary, status_code=200)
+def get_report_summary(
+    from_date: Optional[date] = Query(default=None, alias="from"),
+    to_date: Optional[date] = Query(default=None, alias="to"),
+    bucket: RollupBucket = RollupBucket.DAY,
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> ReportSummary:
+    """
+    Tasks created, closed and status transitions per day or week (UTC) for
+    the caller, read from the incrementally maintained rollups.
+    """
+    try:
+        from_date, to_date = report_range(from_date, to_date)
+        summary = read_report_summary(db_session, user.id, bucket, from_date, to_date)
+
+        logger.info(
+            f"Report summary for user {user.id}: {len(summary.periods)} periods"
+        )
+        return summary
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during report summary")
+        raise HTTPException(status_code=500, detail="Failed to build report summary")
+
+
+@report_router.get("/render", response_class=HTMLResponse, status_code=200)
+def render_report_html(
+    from_date: Optional[date] = Query(default=None, alias="from"),
+    to_date: Optional[date] = Query(default=None, alias="to"),
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> HTMLResponse:
+    """
+    The caller's work report for the period as HTML, listing the active
+    tasks changed in it. Task fragments come from the render cache unless
+    the task changed since it was last rendered.
+    """
+    try:
+        from_date, to_date = report_range(from_date, to_date)
+        summary = read_report_summary(
+            db_session, user.id, RollupBucket.DAY, from_date, to_date
+        )
+        tasks = read_task_report_rows(
+            db_session,
+            Task.owner_id == user.id,
+            Task.is_active == True,  # noqa
+            Task.updated_at >= datetime.combine(from_date, time.min),
+            Task.updated_at < datetime.combine(to_date + timedelta(days=1), time.min),
+        )
+        full_name = db_session.exec(
+            select(User.full_name).where(User.id == user.id)
+        ).first()
+
+        content = render_report(
+            summary, tasks, f"Work report: {full_name}", get_utc_now().date()
+        )
+
+        logger.info(f"Rendered report for user {user.id} with {len(tasks)} tasks")
+        return HTMLResponse(content=content)
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during report rendering")
+        raise HTTPException(status_code=500, detail="Failed to render report")
@@ -1,36 +1,120 @@
-from fastapi import Depends, HTTPException, APIRouter
+import asyncio
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Literal, Optional
+
+from fastapi import Depends, HTTPException, APIRouter, Header, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import tuple_
 from sqlmodel import Session, select, and_
 
 from app.models.task import Task, TaskStatus
-from app.models.user import User
-from app.schemas.task import ReadTask, CreateTask, UpdateTask
-from app.utilities.database import get_db_session
+from app.schemas.bulk import BulkOutcome, BulkResult
+from app.schemas.task import (
+    CreateTask,
+    ImportResult,
+    ReadTask,
+    ReadTaskBatch,
+    ReadTaskSummary,
+    TaskBatch,
+    TaskChanges,
+    TaskHistory,
+    TaskSelection,
+    TaskStats,
+    UpdateTask,
+)
+from app.utilities.archive import archive_cutoff, restore_tasks
+from app.utilities.coalesce import read_flight, request_key
+from app.utilities.config import Config
+from app.utilities.events import task_events
+from app.utilities.fast_read import (
+    iter_task_export,
+    read_active_task_rows,
+    read_task_changes,
+    read_task_rows,
+    read_task_summaries,
+    task_export_fields,
+    use_fast_read,
+)
 from app.utilities.helper import get_utc_now
+from app.utilities.history import append_events, field_changes, read_task_history
+from app.utilities.importer import TaskImporter, insert_tasks
 from app.utilities.logger import get_logger
-from app.utilities.security import get_current_user
+from app.utilities.principal_cache import Principal
+from app.utilities.rollup import record_created, record_transitions
+from app.utilities.security import get_current_principal, has_admin_role
+from app.utilities.serializer import (
+    dump_rows,
+    dump_task_batch,
+    dump_task_changes,
+    dump_tasks,
+    encode_csv,
+    encode_ndjson,
+    read_task,
+)
+from app.utilities.shard import (
+    Shard,
+    allocate_task_id,
+    get_shard,
+    get_task_read_session,
+    scatter_gather,
+)
+from app.utilities.statements import active_task, active_tasks
+from app.utilities.task_stats import read_task_stats
+from app.utilities.versioning import (
+    bulk_update,
+    conditional_update,
+    get_if_match,
+    selected_ids,
+    set_etag,
+)
+from app.utilities.write_batch import coordinator_for
 
 task_router = APIRouter()
 logger = get_logger(__name__)
 
+created_fields = ("title", "description", "note", "status")
+
 
 @task_router.post("/create", response_model=ReadTask, status_code=201)
 def create_task(
     task: CreateTask,
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_principal),
 ) -> ReadTask:
     try:
-        new_task = Task(
-            title=task.title.strip(),
-            description=task.description.strip() if task.description else None,
-            note=task.note.strip() if task.note else None,
-            status=TaskStatus.PENDING,
-            owner_id=user.id,
-        )
 
-        db_session.add(new_task)
-        db_session.commit()
-        db_session.refresh(new_task)
+        def apply(db_session: Session) -> Task:
+            new_task = Task(
+                id=allocate_task_id(db_session, user.shard),
+                title=task.title.strip(),
+                description=task.description.strip() if task.description else None,
+                note=task.note.strip() if task.note else None,
+                status=TaskStatus.PENDING,
+                owner_id=user.id,
+            )
+
+            db_session.add(new_task)
+            db_session.flush()
+            record_created(db_session, user.id, 1, new_task.created_at)
+            append_events(
+                db_session,
+                [
+                    {
+                        "task_id": new_task.id,
+                        "owner_id": user.id,
+                        "version": new_task.version,
+                        "type": "task.created",
+                        "changes": field_changes(created_fields, None, new_task),
+                        "created_at": new_task.created_at,
+                    }
+                ],
+            )
+            return new_task
+
+        new_task = coordinator_for(user.shard).submit(apply, read_task).result()
+        task_events.publish(user.id, "task.created", new_task)
 
         logger.info(f"New task created with ID: {new_task.id}")
 
@@ -45,16 +129,25 @@ def create_task(
 
 @task_router.get("/list", response_model=list[ReadTask], status_code=200)
 def list_tasks(
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
-) -> list[ReadTask]:
+    request: Request,
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> Response:
     try:
-        tasks = db_session.exec(
-            select(Task).where(and_(Task.owner_id == user.id, Task.is_active == True))  # noqa
-        ).all()
 
-        logger.info(f"Total active tasks {len(tasks)}")
-        return tasks if tasks else []  # noqa
+        def load() -> bytes:
+            if use_fast_read("list_tasks"):
+                tasks = read_active_task_rows(db_session, user.id)
+                content = dump_rows(tasks)
+            else:
+                tasks = db_session.exec(active_tasks(user.id)).scalars().all()
+                content = dump_tasks(tasks)
+
+            logger.info(f"Total active tasks {len(tasks)}")
+            return content
+
+        content = read_flight.do(request_key(request, user.id), load)
+        return Response(content=content, media_type="application/json")
 
     except HTTPException:
         raise
@@ -63,15 +156,319 @@ def list_tasks(
         raise HTTPException(status_code=500, detail="Failed to list active tasks")
 
 
-def get_task_by_id(task_id: int, db_session: Session, user_id: int) -> ReadTask:
+@task_router.get("/list/summary", response_model=list[ReadTaskSummary], status_code=200)
+def list_task_summaries(
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> Response:
+    try:
+        tasks = read_task_summaries(
+            db_session,
+            Task.owner_id == user.id,
+            Task.is_active == True,  # noqa
+        )
+
+        logger.info(f"Total active task summaries {len(tasks)}")
+        return Response(content=dump_rows(tasks), media_type="application/json")
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during task summary listing")
+        raise HTTPException(status_code=500, detail="Failed to list task summaries")
+
+
+@task_router.get("/stats", response_model=TaskStats, status_code=200)
+def get_task_stats(
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> TaskStats:
+    """
+    The caller's task counts per status, read from the trigger-maintained
+    counters rather than by scanning tasks.
+    """
+    try:
+        stats = read_task_stats(db_session, user.id)
+
+        logger.info(f"Task stats for user {user.id}: {stats.total} active")
+        return stats
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during task stats lookup")
+        raise HTTPException(status_code=500, detail="Failed to get task stats")
+
+
+def encode_sync_token(updated_at: datetime, task_id: int) -> str:
+    return urlsafe_b64encode(f"{updated_at.isoformat()}|{task_id}".encode()).decode()
+
+
+def decode_sync_token(token: str) -> tuple[datetime, int]:
+    """
+    Raises:
+        HTTPException: 400 if the token was not issued by `encode_sync_token`.
+    """
+    try:
+        updated_at, task_id = urlsafe_b64decode(token.encode()).decode().split("|")
+        return datetime.fromisoformat(updated_at), int(task_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+
+
+@task_router.get("/changes", response_model=TaskChanges, status_code=200)
+def list_task_changes(
+    since: Optional[str] = None,
+    limit: int = Query(default=Config.SYNC_PAGE_SIZE, ge=1, le=Config.SYNC_PAGE_SIZE),
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> Response:
+    """
+    Tasks changed after the `since` token, oldest first; soft-deleted tasks
+    are returned as tombstone ids. Pass `next_token` back as `since` until
+    `has_more` is false.
+
+    Changes younger than `SYNC_SETTLE_MS` are held back, so a write that
+    computed its `updated_at` before waiting for the write lock cannot
+    commit behind a token that was already handed out.
+
+    A token older than `ARCHIVE_AFTER_DAYS` gets a 410: tasks deleted since
+    then may already be archived, and their tombstones with them, so the
+    client must drop its copy and sync again without `since`.
+    """
     try:
-        task = db_session.exec(
-            select(Task).where(
-                and_(
-                    Task.owner_id == user_id, Task.id == task_id, Task.is_active == True
+        settled = get_utc_now() - timedelta(milliseconds=Config.SYNC_SETTLE_MS)
+        criteria = [Task.owner_id == user.id, Task.updated_at <= settled]
+        if since:
+            updated_at, task_id = decode_sync_token(since)
+            if (
+                updated_at.replace(tzinfo=updated_at.tzinfo or timezone.utc)
+                < archive_cutoff()
+            ):
+                raise HTTPException(
+                    status_code=410, detail="Sync token expired, full resync required"
                 )
-            )  # noqa
-        ).one_or_none()
+            token = tuple_(
+                updated_at, task_id, types=[Task.updated_at.type, Task.id.type]
+            )
+            criteria.append(tuple_(Task.updated_at, Task.id) > token)
+
+        rows = read_task_changes(db_session, *criteria, limit=limit + 1)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        tasks = [task for is_active, task in rows if is_active]
+        deleted = [task["id"] for is_active, task in rows if not is_active]
+        if rows:
+            last = rows[-1][1]
+            next_token = encode_sync_token(last["updated_at"], last["id"])
+        else:
+            next_token = since or ""
+
+        logger.info(f"Task changes: {len(tasks)} updated, {len(deleted)} deleted")
+        return Response(
+            content=dump_task_changes(tasks, deleted, next_token, has_more),
+            media_type="application/json",
+        )
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during task change listing")
+        raise HTTPException(status_code=500, detail="Failed to list task changes")
+
+
+@task_router.get("/stream", status_code=200)
+async def stream_tasks(
+    user: Principal = Depends(get_current_principal),
+    last_event_id: Optional[str] = Header(default=None),
+) -> StreamingResponse:
+    """
+    Server-sent events for the caller's task mutations, replacing polling.
+
+    Sends a comment heartbeat every `EVENT_HEARTBEAT_S`. A client reconnecting
+    with `Last-Event-ID` receives the events it missed, or a `reset` event if
+    they are no longer buffered or it fell too far behind.
+    """
+    subscription = task_events.subscribe(user.id, last_event_id)
+
+    async def events():
+        try:
+            if subscription.reset:
+                yield task_events.format_reset()
+                return
+
+            for event in subscription.backlog:
+                yield task_events.format(event)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(), Config.EVENT_HEARTBEAT_S
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+
+                if event is None:
+                    yield task_events.format_reset()
+                    return
+                yield task_events.format(event)
+
+        finally:
+            task_events.unsubscribe(subscription)
+
+    logger.info(f"Task event stream opened for user {user.id}")
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@task_router.get("/export", status_code=200)
+def export_tasks(
+    export_format: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format"),
+    user: Principal = Depends(get_current_principal),
+) -> StreamingResponse:
+    """
+    Stream all of the caller's tasks, deleted ones included, as NDJSON or CSV.
+
+    Rows are read through one streaming cursor in `EXPORT_BATCH_SIZE`
+    batches and encoded batch by batch, so memory stays constant.
+    """
+    engine = get_shard(user.shard).read_engine
+
+    def chunks():
+        try:
+            with engine.connect() as connection:
+                if export_format == "csv":
+                    yield encode_csv([task_export_fields])
+
+                for rows in iter_task_export(
+                    connection, Config.EXPORT_BATCH_SIZE, Task.owner_id == user.id
+                ):
+                    if export_format == "csv":
+                        yield encode_csv(rows)
+                    else:
+                        yield encode_ndjson(task_export_fields, rows)
+
+        except Exception:
+            logger.exception(f"Task export failed for user {user.id}")
+            raise
+
+    logger.info(f"Task export ({export_format}) started for user {user.id}")
+    return StreamingResponse(
+        chunks(),
+        media_type="text/csv" if export_format == "csv" else "application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks.{export_format}"'
+        },
+    )
+
+
+@task_router.post("/import", response_model=ImportResult, status_code=200)
+async def import_tasks(
+    request: Request,
+    import_format: Optional[Literal["ndjson", "csv"]] = Query(
+        default=None, alias="format"
+    ),
+    user: Principal = Depends(get_current_principal),
+) -> ImportResult:
+    """
+    Create tasks from a raw CSV (with a header row) or NDJSON request body.
+
+    The body is parsed as it arrives and valid rows are inserted in
+    `IMPORT_CHUNK_ROWS` chunks, one `executemany` each, while the next chunk
+    is parsed. Invalid rows are skipped and reported by row number. Progress
+    is published to `/task/stream` as `tasks.import` events after every chunk.
+    """
+    if import_format is None:
+        content_type = request.headers.get("content-type", "")
+        if "csv" in content_type:
+            import_format = "csv"
+        elif "json" in content_type:
+            import_format = "ndjson"
+        else:
+            raise HTTPException(
+                status_code=415,
+                detail="Send text/csv or application/x-ndjson, or pass format",
+            )
+
+    importer = TaskImporter(
+        import_format, user.id, Config.IMPORT_MAX_ERRORS, Config.IMPORT_MAX_RECORD_CHARS
+    )
+    coordinator = coordinator_for(user.shard)
+    rows: list[dict[str, Any]] = []
+    pending: Optional[asyncio.Future] = None
+    inserted = 0
+
+    def progress() -> dict[str, int]:
+        return {
+            "processed": importer.processed,
+            "inserted": inserted,
+            "failed": importer.failed,
+        }
+
+    async def flush() -> None:
+        # Keep one chunk in flight: wait for the previous insert, then queue this one
+        nonlocal rows, pending, inserted
+        if pending is not None:
+            inserted += await pending
+            pending = None
+            task_events.publish(user.id, "tasks.import", progress())
+        if rows:
+            chunk, rows = rows, []
+            pending = asyncio.wrap_future(
+                coordinator.submit(partial(insert_tasks, shard=user.shard, rows=chunk))
+            )
+
+    async def settle() -> None:
+        # A chunk already queued still commits after a failure, so count it
+        nonlocal pending, inserted
+        if pending is not None:
+            (outcome,) = await asyncio.gather(pending, return_exceptions=True)
+            inserted += outcome if isinstance(outcome, int) else 0
+            pending = None
+
+    try:
+        async for body in request.stream():
+            rows += await run_in_threadpool(importer.feed, body)
+            if len(rows) >= Config.IMPORT_CHUNK_ROWS:
+                await flush()
+        rows += importer.close()
+        await flush()
+        await flush()
+
+    except UnicodeDecodeError:
+        await settle()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Import body must be UTF-8, {inserted} rows were imported",
+        )
+    except HTTPException as exc:
+        await settle()
+        raise HTTPException(
+            status_code=exc.status_code,
+            detail=f"{exc.detail}, {inserted} rows were imported",
+        )
+    except Exception:
+        await settle()
+        logger.exception(f"Task import failed for user {user.id} after {inserted} rows")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to import tasks, {inserted} rows were imported",
+        )
+
+    logger.info(
+        f"Imported {inserted} tasks for user {user.id}, {importer.failed} rows failed"
+    )
+    return ImportResult(**progress(), errors=importer.errors)
+
+
+def get_task_by_id(task_id: int, db_session: Session, user_id: int) -> ReadTask:
+    try:
+        task = db_session.exec(active_task(user_id, task_id)).scalars().one_or_none()
 
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
@@ -88,11 +485,13 @@ def get_task_by_id(task_id: int, db_session: Session, user_id: int) -> ReadTask:
 @task_router.get("/get/{task_id}", response_model=ReadTask, status_code=200)
 def get_task(
     task_id: int,
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
+    response: Response,
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
 ) -> ReadTask:
     try:
         db_task = get_task_by_id(task_id, db_session, user.id)
+        set_etag(response, db_task.version)
 
         logger.info(f"Task retrieved with ID: {db_task.id}")
         return db_task  # noqa
@@ -107,29 +506,161 @@ def get_task(
         )
 
 
+@task_router.get("/history/{task_id}", response_model=TaskHistory, status_code=200)
+def get_task_history(
+    task_id: int,
+    after: int = Query(default=0, ge=0),
+    limit: int = Query(
+        default=Config.HISTORY_PAGE_SIZE, ge=1, le=Config.HISTORY_PAGE_SIZE
+    ),
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> TaskHistory:
+    """
+    A task's change events, oldest first, deleted tasks included. Pass
+    `next_after` back as `after` for the next page.
+    """
+    try:
+        owned = (
+            db_session.connection()
+            .execute(
+                select(Task.id).where(Task.id == task_id, Task.owner_id == user.id)
+            )
+            .first()
+        )
+        if owned is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        events = read_task_history(db_session, task_id, after, limit + 1)
+        has_more = len(events) > limit
+        events = events[:limit]
+
+        logger.info(f"Task history for ID {task_id}: {len(events)} events")
+        return TaskHistory(
+            events=events,  # noqa
+            next_after=events[-1].seq if has_more else None,
+        )
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception(f"Unable to fetch task history:{task_id} at this time.")
+        raise HTTPException(status_code=500, detail="Failed to load task history")
+
+
+def get_tasks_by_ids(db_session: Session, user_id: int, ids: list[int]) -> Response:
+    """
+    Fetch the caller's active tasks for `ids` with one `IN (...)` query,
+    in request order, reporting the ids that were not found.
+    """
+    ids = selected_ids(ids, False)
+    rows = read_task_rows(
+        db_session,
+        Task.owner_id == user_id,
+        Task.is_active == True,  # noqa
+        Task.id.in_(ids),
+    )
+
+    by_id = {row["id"]: row for row in rows}
+    tasks = [by_id[task_id] for task_id in ids if task_id in by_id]
+    missing = [task_id for task_id in ids if task_id not in by_id]
+
+    logger.info(f"Batch retrieved {len(tasks)} tasks, {len(missing)} missing")
+    return Response(
+        content=dump_task_batch(tasks, missing), media_type="application/json"
+    )
+
+
+@task_router.get("/batch", response_model=ReadTaskBatch, status_code=200)
+def get_task_batch(
+    ids: list[str] = Query(description="Task ids, comma-separated or repeated"),
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> Response:
+    try:
+        try:
+            task_ids = [int(part) for value in ids for part in value.split(",") if part]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Task ids must be integers")
+
+        return get_tasks_by_ids(db_session, user.id, task_ids)
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during batch task retrieval")
+        raise HTTPException(status_code=500, detail="Failed to retrieve tasks")
+
+
+@task_router.post("/batch", response_model=ReadTaskBatch, status_code=200)
+def post_task_batch(
+    batch: TaskBatch,
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> Response:
+    try:
+        return get_tasks_by_ids(db_session, user.id, batch.ids)
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during batch task retrieval")
+        raise HTTPException(status_code=500, detail="Failed to retrieve tasks")
+
+
+def update_task_row(
+    db_session: Session,
+    task_id: int,
+    user_id: int,
+    values: dict[str, Any],
+    expected_version: Optional[int],
+    is_active: bool = True,
+    guards: tuple = (),
+    not_found: str = "Task not found",
+) -> Task:
+    """
+    Update an owned task in a single statement (see `conditional_update`).
+    Its history event is logged by the `task_events_record_update` trigger.
+    """
+    return conditional_update(
+        db_session,
+        Task,
+        (Task.id == task_id, Task.owner_id == user_id, Task.is_active == is_active),
+        values,
+        expected_version,
+        guards,
+        not_found,
+    )
+
+
 @task_router.put("/update/{task_id}", response_model=ReadTask, status_code=200)
 def update_task(
     task_id: int,
     task: UpdateTask,
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
+    response: Response,
+    user: Principal = Depends(get_current_principal),
+    expected_version: Optional[int] = Depends(get_if_match),
 ) -> ReadTask:
     try:
-        db_task = get_task_by_id(task_id, db_session, user.id)
-
         if task.title is None:
             raise HTTPException(
                 status_code=400, detail="Missing required fields for full update"
             )
 
-        db_task.title = task.title.strip()
-        db_task.description = task.description.strip() if task.description else None
-        db_task.note = task.note.strip() if task.note else None
-        db_task.updated_at = get_utc_now()
+        values = {
+            "title": task.title.strip(),
+            "description": task.description.strip() if task.description else None,
+            "note": task.note.strip() if task.note else None,
+        }
 
-        db_session.add(db_task)
-        db_session.commit()
-        db_session.refresh(db_task)
+        def apply(db_session: Session) -> Task:
+            return update_task_row(
+                db_session, task_id, user.id, values, expected_version
+            )
+
+        db_task = coordinator_for(user.shard).submit(apply, read_task).result()
+        task_events.publish(user.id, "task.updated", db_task)
+        set_etag(response, db_task.version)
 
         logger.info(f"Task updated with ID: {db_task.id}")
         return db_task  # noqa
@@ -148,24 +679,27 @@ def update_task(
 def edit_task(
     task_id: int,
     task: UpdateTask,
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
+    response: Response,
+    user: Principal = Depends(get_current_principal),
+    expected_version: Optional[int] = Depends(get_if_match),
 ) -> ReadTask:
     try:
-        db_task = get_task_by_id(task_id, db_session, user.id)
-
+        values = {}
         if task.title is not None:
-            db_task.title = task.title.strip()
+            values["title"] = task.title.strip()
         if task.description is not None:
-            db_task.description = task.description.strip()
+            values["description"] = task.description.strip()
         if task.note is not None:
-            db_task.note = task.note.strip()
+            values["note"] = task.note.strip()
 
-        db_task.updated_at = get_utc_now()
+        def apply(db_session: Session) -> Task:
+            return update_task_row(
+                db_session, task_id, user.id, values, expected_version
+            )
 
-        db_session.add(db_task)
-        db_session.commit()
-        db_session.refresh(db_task)
+        db_task = coordinator_for(user.shard).submit(apply, read_task).result()
+        task_events.publish(user.id, "task.updated", db_task)
+        set_etag(response, db_task.version)
 
         logger.info(f"Task edited with ID: {db_task.id}")
         return db_task  # noqa
@@ -183,17 +717,22 @@ def edit_task(
 @task_router.delete("/delete/{task_id}", status_code=204)
 def delete_task(
     task_id: int,
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_principal),
+    expected_version: Optional[int] = Depends(get_if_match),
 ) -> None:
     try:
-        db_task = get_task_by_id(task_id, db_session, user.id)
 
-        db_task.is_active = False
-        db_task.updated_at = get_utc_now()
+        def apply(db_session: Session) -> Task:
+            return update_task_row(
+                db_session,
+                task_id,
+                user.id,
+                {"is_active": False},
+                expected_version,
+            )
 
-        db_session.add(db_task)
-        db_session.commit()
+        db_task = coordinator_for(user.shard).submit(apply, read_task).result()
+        task_events.publish(user.id, "task.deleted", {"id": db_task.id})
 
         logger.info(f"Task deleted with ID: {db_task.id}")
 
@@ -209,16 +748,23 @@ def delete_task(
 
 @task_router.get("/list/deleted", response_model=list[ReadTask], status_code=200)
 def list_deleted_tasks(
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
-) -> list[ReadTask]:
+    db_session: Session = Depends(get_task_read_session),
+    user: Principal = Depends(get_current_principal),
+) -> Response:
     try:
-        tasks = db_session.exec(
-            select(Task).where(and_(Task.owner_id == user.id, Task.is_active == False))  # noqa
-        ).all()
+        criteria = and_(Task.owner_id == user.id, Task.is_active == False)  # noqa
+
+        if use_fast_read("list_deleted_tasks"):
+            tasks = read_task_rows(db_session, criteria)
+            content = dump_rows(tasks)
+        else:
+            tasks = db_session.exec(
+                select(Task).where(criteria).order_by(Task.id)
+            ).all()
+            content = dump_tasks(tasks)
 
         logger.info(f"Total deleted tasks {len(tasks)}")
-        return tasks if tasks else []  # noqa
+        return Response(content=content, media_type="application/json")
 
     except HTTPException:
         raise
@@ -230,28 +776,26 @@ def list_deleted_tasks(
 @task_router.patch("/activate/{task_id}", status_code=200)
 def activate_task(
     task_id: int,
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
+    response: Response,
+    user: Principal = Depends(get_current_principal),
+    expected_version: Optional[int] = Depends(get_if_match),
 ) -> ReadTask:
     try:
-        db_task = db_session.exec(
-            select(Task).where(
-                and_(
-                    Task.owner_id == user.id,
-                    Task.id == task_id,
-                    Task.is_active == False,
-                )
-            )  # noqa
-        ).one_or_none()
 
-        if not db_task:
-            raise HTTPException(status_code=404, detail="Task not deleted or notfound")
-
-        db_task.is_active = True
-        db_task.updated_at = get_utc_now()
+        def apply(db_session: Session) -> Task:
+            return update_task_row(
+                db_session,
+                task_id,
+                user.id,
+                {"is_active": True},
+                expected_version,
+                is_active=False,
+                not_found="Task not deleted or notfound",
+            )
 
-        db_session.add(db_task)
-        db_session.commit()
+        db_task = coordinator_for(user.shard).submit(apply, read_task).result()
+        task_events.publish(user.id, "task.activated", db_task)
+        set_etag(response, db_task.version)
 
         logger.info(f"Task active with ID: {db_task.id}")
         return db_task  # noqa
@@ -270,23 +814,41 @@ def activate_task(
 def change_task_status(
     task_id: int,
     status: TaskStatus,
-    db_session: Session = Depends(get_db_session),
-    user: User = Depends(get_current_user),
+    response: Response,
+    user: Principal = Depends(get_current_principal),
+    expected_version: Optional[int] = Depends(get_if_match),
 ) -> ReadTask:
     try:
-        db_task = get_task_by_id(task_id, db_session, user.id)
+        same_status = HTTPException(
+            status_code=400, detail="Task status is already the same"
+        )
 
-        if db_task.status == status:
-            raise HTTPException(
-                status_code=400, detail="Task status is already the same"
+        def apply(db_session: Session) -> Task:
+            previous = (
+                db_session.connection()
+                .execute(
+                    select(Task.status).where(
+                        Task.id == task_id, Task.owner_id == user.id
+                    )
+                )
+                .scalar()
             )
+            db_task = update_task_row(
+                db_session,
+                task_id,
+                user.id,
+                {"status": status},
+                expected_version,
+                guards=((Task.status != status, same_status),),
+            )
+            record_transitions(
+                db_session, user.id, [(previous, status)], db_task.updated_at
+            )
+            return db_task
 
-        db_task.status = status
-        db_task.updated_at = get_utc_now()
-
-        db_session.add(db_task)
-        db_session.commit()
-        db_session.refresh(db_task)
+        db_task = coordinator_for(user.shard).submit(apply, read_task).result()
+        task_events.publish(user.id, "task.status", db_task)
+        set_etag(response, db_task.version)
 
         logger.info(f"Task status changed with ID: {db_task.id}")
         return db_task  # noqa
@@ -299,3 +861,165 @@ def change_task_status(
             status_code=500,
             detail="Task status could not be changed at the moment. Please try again.",
         )
+
+
+def bulk_update_tasks(
+    user: Principal,
+    selection: TaskSelection,
+    criteria: tuple,
+    values: dict[str, Any],
+    event_type: str,
+) -> BulkResult:
+    """
+    Apply one set-based UPDATE to the caller's selected tasks on their shard
+    and publish a single event listing the updated ids. Each task's history
+    event is logged by the `task_events_record_update` trigger.
+    """
+    ids = selected_ids(selection.ids, selection.status is not None)
+
+    scope = [Task.owner_id == user.id]
+    if selection.status is not None:
+        scope.append(Task.status == selection.status)
+
+    def apply(db_session: Session) -> BulkResult:
+        previous = []
+        if "status" in values:
+            # The writer holds the lock, so these are exactly the rows about to change
+            statement = select(Task.status).where(*scope, *criteria)
+            if ids is not None:
+                statement = statement.where(Task.id.in_(ids))
+            previous = db_session.connection().execute(statement).scalars().all()
+
+        result = bulk_update(db_session, Task, scope, criteria, values, ids)[1]
+        record_transitions(
+            db_session,
+            user.id,
+            [(status, values["status"]) for status in previous],
+            get_utc_now(),
+        )
+        return result
+
+    result = coordinator_for(user.shard).submit(apply).result()
+
+    updated = [item.id for item in result.results if item.outcome == "updated"]
+    if updated:
+        task_events.publish(user.id, event_type, {"ids": updated, **values})
+
+    return result
+
+
+@task_router.post("/archive/restore", response_model=BulkResult, status_code=200)
+def restore_archived_tasks(
+    batch: TaskBatch,
+    is_admin: bool = Depends(has_admin_role),
+) -> BulkResult:
+    """
+    Move archived tasks back into their owners' deleted tasks (admin only),
+    from whichever shard holds them. Owners can then activate them as usual.
+    """
+    try:
+        ids = selected_ids(batch.ids, False)
+
+        def restore(shard: Shard) -> list[tuple[int, int, int]]:
+            return (
+                coordinator_for(shard.index)
+                .submit(partial(restore_tasks, ids=ids))
+                .result()
+            )
+
+        restored = set()
+        for rows in scatter_gather(restore):
+            for task_id, owner_id, version in rows:
+                restored.add(task_id)
+                task_events.publish(owner_id, "task.restored", {"id": task_id})
+
+        logger.info(f"Restored {len(restored)} archived tasks")
+        return BulkResult(
+            updated=len(restored),
+            results=[
+                BulkOutcome(
+                    id=task_id,
+                    outcome="updated" if task_id in restored else "not_found",
+                )
+                for task_id in ids
+            ],
+        )
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during archived task restore")
+        raise HTTPException(status_code=500, detail="Failed to restore archived tasks")
+
+
+@task_router.patch("/bulk/status", response_model=BulkResult, status_code=200)
+def bulk_change_task_status(
+    status: TaskStatus,
+    selection: TaskSelection,
+    user: Principal = Depends(get_current_principal),
+) -> BulkResult:
+    try:
+        result = bulk_update_tasks(
+            user,
+            selection,
+            (Task.is_active == True, Task.status != status),  # noqa
+            {"status": status},
+            "tasks.status",
+        )
+
+        logger.info(f"Bulk status change updated {result.updated} tasks")
+        return result
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during bulk task status change")
+        raise HTTPException(status_code=500, detail="Failed to change task statuses")
+
+
+@task_router.post("/bulk/delete", response_model=BulkResult, status_code=200)
+def bulk_delete_tasks(
+    selection: TaskSelection,
+    user: Principal = Depends(get_current_principal),
+) -> BulkResult:
+    try:
+        result = bulk_update_tasks(
+            user,
+            selection,
+            (Task.is_active == True,),  # noqa
+            {"is_active": False},
+            "tasks.deleted",
+        )
+
+        logger.info(f"Bulk delete updated {result.updated} tasks")
+        return result
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during bulk task deletion")
+        raise HTTPException(status_code=500, detail="Failed to delete tasks")
+
+
+@task_router.patch("/bulk/activate", response_model=BulkResult, status_code=200)
+def bulk_activate_tasks(
+    selection: TaskSelection,
+    user: Principal = Depends(get_current_principal),
+) -> BulkResult:
+    try:
+        result = bulk_update_tasks(
+            user,
+            selection,
+            (Task.is_active == False,),  # noqa
+            {"is_active": True},
+            "tasks.activated",
+        )
+
+        logger.info(f"Bulk activate updated {result.updated} tasks")
+        return result
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during bulk task activation")
+        raise HTTPException(status_code=500, detail="Failed to activate tasks")
@@ -1,12 +1,23 @@
-from fastapi import Depends, HTTPException, APIRouter
-from sqlmodel import Session, select, is_
+from typing import Any, Optional
 
+from fastapi import Depends, HTTPException, APIRouter, Request, Response
+from sqlalchemy.orm import defer
+from sqlmodel import Session, func, select
+
+from app.models.task import Task
 from app.models.user import User
-from app.schemas.user import ReadUser, UpdateUser, PasswordChange, RoleChange, UserSuccessMessage
-from app.utilities.database import get_db_session
-from app.utilities.helper import get_utc_now
+from app.schemas.bulk import BulkResult
+from app.schemas.user import ReadUser, UpdateUser, PasswordChange, RoleChange, ShardStats, UserSelection, UserSuccessMessage
+from app.utilities.cache import user_cache
+from app.utilities.coalesce import read_flight, request_key
+from app.utilities.database import get_db_session, get_read_db_session
+from app.utilities.fast_read import read_user_rows, use_fast_read
 from app.utilities.logger import get_logger
-from app.utilities.security import has_admin_role, get_current_user, verify_password, hash_password
+from app.utilities.principal_cache import Principal, principal_cache
+from app.utilities.security import has_admin_role, get_current_user, get_current_principal, verify_password, hash_password
+from app.utilities.serializer import dump_rows, dump_users, read_user
+from app.utilities.shard import Shard, scatter_gather
+from app.utilities.versioning import bulk_update, conditional_update, get_if_match, selected_ids, set_etag
 
 logger = get_logger(__name__)
 user_router = APIRouter()
@@ -18,7 +29,9 @@ def get_user_by_id(user_id: int, db_session: Session) -> User:
     """
     try:
         user = db_session.exec(
-            select(User).where(User.id == user_id, User.is_active == True)
+            select(User)
+            .where(User.id == user_id, User.is_active == True)
+            .options(defer(User.hashed_password))
         ).one_or_none()
 
         if not user:
@@ -33,21 +46,58 @@ def get_user_by_id(user_id: int, db_session: Session) -> User:
         raise HTTPException(status_code=500, detail="Failed to retrieve user")
 
 
+def update_user_row(
+        db_session: Session,
+        user_id: int,
+        values: dict[str, Any],
+        expected_version: Optional[int],
+        is_active: bool = True,
+        not_found: str = "User not found",
+) -> User:
+    """
+    Update a user in a single statement (see `conditional_update`).
+    """
+    return conditional_update(
+        db_session,
+        User,
+        (User.id == user_id, User.is_active == is_active),
+        values,
+        expected_version,
+        not_found=not_found,
+    )
+
+
 @user_router.get("/list", response_model=list[ReadUser], status_code=200)
 def list_users(
-        db_session: Session = Depends(get_db_session),
+        request: Request,
+        db_session: Session = Depends(get_read_db_session),
+        user: Principal = Depends(get_current_principal),
         is_admin: bool = Depends(has_admin_role),
-) -> list[ReadUser]:
+) -> Response:
     """
     List all active users (admin only).
+    Served from the response cache until a user mutation bumps its generation.
     """
     try:
-        users = db_session.exec(
-            select(User).where(User.is_active == True)
-        ).all()
 
-        logger.info(f"Total active users: {len(users)}")
-        return users  # noqa
+        def load() -> bytes:
+            if use_fast_read("list_users"):
+                users = read_user_rows(db_session, User.is_active == True)
+                content = dump_rows(users)
+            else:
+                users = db_session.exec(
+                    select(User).where(User.is_active == True).order_by(User.id)
+                ).all()
+                content = dump_users(users)
+
+            logger.info(f"Total active users: {len(users)}")
+            return content
+
+        content = user_cache.get_or_load(
+            request.url.path,
+            lambda: read_flight.do(request_key(request, user.id), load),
+        )
+        return Response(content=content, media_type="application/json")
 
     except HTTPException:
         raise
@@ -59,7 +109,7 @@ def list_users(
 @user_router.get("/get/{user_id}", response_model=ReadUser, status_code=200)
 def get_user(
         user_id: int,
-        db_session: Session = Depends(get_db_session),
+        db_session: Session = Depends(get_read_db_session),
         is_admin: bool = Depends(has_admin_role),
 ) -> ReadUser:
     """
@@ -81,29 +131,32 @@ def get_user(
 def update_user(
         user_id: int,
         user: UpdateUser,
+        response: Response,
         db_session: Session = Depends(get_db_session),
         is_admin: bool = Depends(has_admin_role),
+        expected_version: Optional[int] = Depends(get_if_match),
 ) -> ReadUser:
     """
     Full update of a user (admin only).
     """
     try:
-        db_user = get_user_by_id(user_id, db_session)
         if user.full_name is None:
             raise HTTPException(
                 status_code=400, detail="Missing required fields for full update"
             )
 
-        db_user.full_name = user.full_name.strip()
-        db_user.phone_no = user.phone_no.strip() if user.phone_no else None
-        db_user.updated_at = get_utc_now()
+        values = {
+            "full_name": user.full_name.strip(),
+            "phone_no": user.phone_no.strip() if user.phone_no else None,
+        }
+        db_user = read_user(update_user_row(db_session, user_id, values, expected_version))
 
-        db_session.add(db_user)
         db_session.commit()
-        db_session.refresh(db_user)
+        user_cache.bump()
+        set_etag(response, db_user.version)
 
         logger.info(f"User updated with ID: {db_user.id}")
-        return db_user  # noqa
+        return db_user
 
     except HTTPException:
         raise
@@ -116,27 +169,29 @@ def update_user(
 def edit_user(
         user_id: int,
         user: UpdateUser,
+        response: Response,
         db_session: Session = Depends(get_db_session),
         is_admin: bool = Depends(has_admin_role),
+        expected_version: Optional[int] = Depends(get_if_match),
 ) -> ReadUser:
     """
     Partial update of a user (admin only).
     """
     try:
-        db_user = get_user_by_id(user_id, db_session)
-
+        values = {}
         if user.full_name is not None:
-            db_user.full_name = user.full_name.strip()
+            values["full_name"] = user.full_name.strip()
         if user.phone_no is not None:
-            db_user.phone_no = user.phone_no.strip()
-        db_user.updated_at = get_utc_now()
+            values["phone_no"] = user.phone_no.strip()
+
+        db_user = read_user(update_user_row(db_session, user_id, values, expected_version))
 
-        db_session.add(db_user)
         db_session.commit()
-        db_session.refresh(db_user)
+        user_cache.bump()
+        set_etag(response, db_user.version)
 
         logger.info(f"User edited with ID: {db_user.id}")
-        return db_user  # noqa
+        return db_user
 
     except HTTPException:
         raise
@@ -150,22 +205,22 @@ def delete_user(
         user_id: int,
         db_session: Session = Depends(get_db_session),
         is_admin: bool = Depends(has_admin_role),
+        expected_version: Optional[int] = Depends(get_if_match),
 ) -> None:
     """
     Soft-delete a user (admin only).
     Returns no content (204).
     """
     try:
-        db_user = get_user_by_id(user_id, db_session)
-
-        db_user.is_active = False
-        db_user.updated_at = get_utc_now()
+        principal = Principal.from_user(
+            update_user_row(db_session, user_id, {"is_active": False}, expected_version)
+        )
 
-        db_session.add(db_user)
         db_session.commit()
-        db_session.refresh(db_user)
+        user_cache.bump()
+        principal_cache.put(principal)
 
-        logger.info(f"User deleted with ID: {db_user.id}")
+        logger.info(f"User deleted with ID: {principal.id}")
 
     except HTTPException:
         raise
@@ -176,17 +231,31 @@ def delete_user(
 
 @user_router.get("/list/deleted", response_model=list[ReadUser], status_code=200)
 def list_deleted_users(
-        db_session: Session = Depends(get_db_session),
+        request: Request,
+        db_session: Session = Depends(get_read_db_session),
         is_admin: bool = Depends(has_admin_role),
-) -> list[ReadUser]:
+) -> Response:
     """
     List soft-deleted users (admin only).
+    Served from the response cache until a user mutation bumps its generation.
     """
     try:
-        users = db_session.exec(select(User).where(User.is_active == False)).all()  # noqa
 
-        logger.info(f"Total deleted users: {len(users)}")
-        return users  # noqa
+        def load() -> bytes:
+            if use_fast_read("list_deleted_users"):
+                users = read_user_rows(db_session, User.is_active == False)  # noqa
+                content = dump_rows(users)
+            else:
+                users = db_session.exec(
+                    select(User).where(User.is_active == False).order_by(User.id)  # noqa
+                ).all()
+                content = dump_users(users)
+
+            logger.info(f"Total deleted users: {len(users)}")
+            return content
+
+        content = user_cache.get_or_load(request.url.path, load)
+        return Response(content=content, media_type="application/json")
 
     except HTTPException:
         raise
@@ -195,32 +264,69 @@ def list_deleted_users(
         raise HTTPException(status_code=500, detail="Failed to list deleted users")
 
 
+@user_router.get("/shards", response_model=list[ShardStats], status_code=200)
+def list_shard_stats(
+        db_session: Session = Depends(get_read_db_session),
+        is_admin: bool = Depends(has_admin_role),
+) -> list[ShardStats]:
+    """
+    Users and tasks per shard (admin only), counted on all shards in parallel.
+    """
+    try:
+        users = dict(
+            db_session.exec(select(User.shard, func.count()).group_by(User.shard)).all()
+        )
+
+        def count_tasks(shard: Shard) -> tuple[int, int]:
+            with shard.read_engine.connect() as connection:
+                return connection.execute(
+                    select(func.count(), func.count().filter(Task.is_active == True))  # noqa
+                ).one()
+
+        stats = [
+            ShardStats(shard=index, users=users.get(index, 0), tasks=tasks, active_tasks=active)
+            for index, (tasks, active) in enumerate(scatter_gather(count_tasks))
+        ]
+
+        logger.info(f"Shard stats for {len(stats)} shards")
+        return stats
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during shard stats")
+        raise HTTPException(status_code=500, detail="Failed to collect shard stats")
+
+
 @user_router.patch("/activate/{user_id}", response_model=ReadUser, status_code=200)
 def activate_user(
         user_id: int,
+        response: Response,
         db_session: Session = Depends(get_db_session),
         is_admin: bool = Depends(has_admin_role),
+        expected_version: Optional[int] = Depends(get_if_match),
 ) -> ReadUser:
     """
     Reactivate a previously deleted user (admin only).
     """
     try:
-        db_user = db_session.exec(
-            select(User).where(User.id == user_id, User.is_active == False)  # noqa
-        ).one_or_none()
-
-        if not db_user:
-            raise HTTPException(status_code=404, detail="User not deleted or notfound")
-
-        db_user.is_active = True
-        db_user.updated_at = get_utc_now()
+        row = update_user_row(
+            db_session,
+            user_id,
+            {"is_active": True},
+            expected_version,
+            is_active=False,
+            not_found="User not deleted or notfound",
+        )
+        db_user, principal = read_user(row), Principal.from_user(row)
 
-        db_session.add(db_user)
         db_session.commit()
-        db_session.refresh(db_user)
+        user_cache.bump()
+        principal_cache.put(principal)
+        set_etag(response, db_user.version)
 
         logger.info(f"User activated with ID: {db_user.id}")
-        return db_user  # noqa
+        return db_user
 
     except HTTPException:
         raise
@@ -233,24 +339,25 @@ def activate_user(
 def change_role(
         user_id: int,
         role: RoleChange,
+        response: Response,
         db_session: Session = Depends(get_db_session),
         is_admin: bool = Depends(has_admin_role),
+        expected_version: Optional[int] = Depends(get_if_match),
 ) -> ReadUser:
     """
     Change a user's role (admin only).
     """
     try:
-        db_user = get_user_by_id(user_id, db_session)
+        row = update_user_row(db_session, user_id, {"role": role.role}, expected_version)
+        db_user, principal = read_user(row), Principal.from_user(row)
 
-        db_user.role = role.role
-        db_user.updated_at = get_utc_now()
-
-        db_session.add(db_user)
         db_session.commit()
-        db_session.refresh(db_user)
+        user_cache.bump()
+        principal_cache.put(principal)
+        set_etag(response, db_user.version)
 
         logger.info(f"User role changed to {db_user.role} with ID: {db_user.id}")
-        return db_user  # noqa
+        return db_user
 
     except HTTPException:
         raise
@@ -259,6 +366,79 @@ def change_role(
         raise HTTPException(status_code=500, detail="Failed to change user role")
 
 
+def bulk_update_users(
+        db_session: Session,
+        selection: UserSelection,
+        is_active: bool,
+) -> BulkResult:
+    """
+    Set `is_active` on the selected users in one statement and publish
+    their principals after the commit.
+    """
+    ids = selected_ids(selection.ids, selection.role is not None)
+    scope = [User.role == selection.role] if selection.role is not None else []
+
+    rows, result = bulk_update(
+        db_session,
+        User,
+        scope,
+        (User.is_active == (not is_active),),
+        {"is_active": is_active},
+        ids,
+        returning=(User.role, User.is_active, User.token_version, User.shard),
+    )
+
+    db_session.commit()
+    if rows:
+        user_cache.bump()
+    for row in rows:
+        principal_cache.put(Principal(*row))
+
+    return result
+
+
+@user_router.post("/bulk/delete", response_model=BulkResult, status_code=200)
+def bulk_delete_users(
+        selection: UserSelection,
+        db_session: Session = Depends(get_db_session),
+        is_admin: bool = Depends(has_admin_role),
+) -> BulkResult:
+    """
+    Soft-delete many users by ids or role (admin only).
+    """
+    try:
+        result = bulk_update_users(db_session, selection, is_active=False)
+        logger.info(f"Bulk delete deactivated {result.updated} users")
+        return result
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during bulk user deletion")
+        raise HTTPException(status_code=500, detail="Failed to delete users")
+
+
+@user_router.patch("/bulk/activate", response_model=BulkResult, status_code=200)
+def bulk_activate_users(
+        selection: UserSelection,
+        db_session: Session = Depends(get_db_session),
+        is_admin: bool = Depends(has_admin_role),
+) -> BulkResult:
+    """
+    Reactivate many users by ids or role (admin only).
+    """
+    try:
+        result = bulk_update_users(db_session, selection, is_active=True)
+        logger.info(f"Bulk activate reactivated {result.updated} users")
+        return result
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during bulk user activation")
+        raise HTTPException(status_code=500, detail="Failed to activate users")
+
+
 @user_router.patch("/password/{user_id}", response_model=UserSuccessMessage, status_code=200)
 def change_password(
         password: PasswordChange,
@@ -267,22 +447,33 @@ def change_password(
 ) -> UserSuccessMessage:
     """
     Change the currently authenticated user's password.
+    Tokens issued before the change are revoked.
     """
     try:
-
+        # `user` is on the read-only session: verify and hash there, so the
+        # writer's single connection is only held for the UPDATE
         if not verify_password(password.old_password, user.hashed_password):
             detail = "Old password is incorrect"
             logger.error(detail)
             raise HTTPException(status_code=400, detail=detail)
 
-        user.hashed_password = hash_password(password.new_password)
-        user.updated_at = get_utc_now()
+        hashed_password = hash_password(password.new_password)
+
+        # Conditional on the version just read, so a concurrent change fails with 412
+        principal = Principal.from_user(
+            update_user_row(
+                db_session,
+                user.id,
+                {"hashed_password": hashed_password, "token_version": User.token_version + 1},
+                user.version,
+            )
+        )
 
-        db_session.add(user)
         db_session.commit()
-        db_session.refresh(user)
+        user_cache.bump()
+        principal_cache.put(principal)
 
-        logger.info(f"Password updated for user {user.id}")
+        logger.info(f"Password updated for user {principal.id}")
         return UserSuccessMessage(
             status_code=200,
             detail={"message": "Password updated successfully"},
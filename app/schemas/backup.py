@@ -0,0 +1,40 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BackupFile(BaseModel):
+    shard: int
+    name: str
+    bytes: int
+    page_count: int
+    sha256: str
+
+
+class BackupSnapshot(BaseModel):
+    name: str
+    created_at: datetime
+    files: list[BackupFile]
+
+
+class BackupCheck(BaseModel):
+    name: str
+    file: str
+    ok: bool
+    detail: str
+
+
+class BackupJobState(str, Enum):
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class BackupJob(BaseModel):
+    state: BackupJobState
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    snapshot: Optional[BackupSnapshot] = None
+    error: Optional[str] = None
@@ -0,0 +1,13 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class BulkOutcome(BaseModel):
+    id: int
+    outcome: Literal["updated", "unchanged", "not_found"]
+
+
+class BulkResult(BaseModel):
+    updated: int
+    results: list[BulkOutcome]
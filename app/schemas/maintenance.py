@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class MaintenanceRun(BaseModel):
+    finished_at: datetime
+    duration_ms: float
+    analyzed: bool
+    vacuumed_pages: int
+    checkpointed: bool
+
+
+class DatabaseFile(BaseModel):
+    shard: int
+    page_size: int
+    page_count: int
+    freelist_count: int
+    auto_vacuum: str
+    file_bytes: int
+    wal_bytes: int
+    last_maintenance: Optional[MaintenanceRun] = None
+
+
+class MaintenanceStatus(BaseModel):
+    files: list[DatabaseFile]
@@ -0,0 +1,28 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+from app.models.report import RollupBucket
+from app.models.task import TaskStatus
+
+
+class StatusTransition(BaseModel):
+    from_status: TaskStatus
+    to_status: TaskStatus
+    count: int
+
+
+class ReportPeriod(BaseModel):
+    period_start: date
+    created: int
+    closed: int
+    transitions: list[StatusTransition]
+
+
+class ReportSummary(BaseModel):
+    bucket: RollupBucket
+    from_date: date
+    to_date: date
+    created: int
+    closed: int
+    periods: list[ReportPeriod]
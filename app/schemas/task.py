@@ -19,12 +19,73 @@ class UpdateTask(SQLModel):
     note: Optional[str] = None
 
 
+class TaskSelection(SQLModel):
+    ids: Optional[list[int]] = None
+    status: Optional[TaskStatus] = None
+
+
 class ReadTask(SQLModel):
     id: int
     title: str
     description: Optional[str] = None
     note: Optional[str] = None
     status: TaskStatus
+    version: int
     owner: ReadUser
     created_at: datetime
     updated_at: datetime
+
+
+class TaskBatch(SQLModel):
+    ids: list[int]
+
+
+class ReadTaskBatch(SQLModel):
+    tasks: list[ReadTask]
+    missing: list[int]
+
+
+class TaskChanges(SQLModel):
+    tasks: list[ReadTask]
+    deleted: list[int]
+    next_token: str
+    has_more: bool
+
+
+class ReadTaskEvent(SQLModel):
+    seq: int
+    task_id: int
+    version: int
+    type: str
+    changes: dict[str, list]
+    created_at: datetime
+
+
+class TaskHistory(SQLModel):
+    events: list[ReadTaskEvent]
+    next_after: Optional[int] = None
+
+
+class ImportRowError(SQLModel):
+    row: int
+    detail: str
+
+
+class ImportResult(SQLModel):
+    processed: int
+    inserted: int
+    failed: int
+    errors: list[ImportRowError]
+
+
+class TaskStats(SQLModel):
+    total: int
+    deleted: int
+    statuses: dict[TaskStatus, int]
+
+
+class ReadTaskSummary(SQLModel):
+    id: int
+    title: str
+    status: TaskStatus
+    updated_at: datetime
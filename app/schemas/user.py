@@ -20,15 +20,29 @@ class RoleChange(BaseModel):
     role: UserRole
 
 
+class UserSelection(BaseModel):
+    ids: Optional[list[int]] = None
+    role: Optional[UserRole] = None
+
+
 class ReadUser(BaseModel):
     id: int
     full_name: str
     email_id: EmailStr
     phone_no: Optional[str] = None
     role: UserRole
+    version: int
     created_at: datetime
     updated_at: datetime
 
+
+class ShardStats(BaseModel):
+    shard: int
+    users: int
+    tasks: int
+    active_tasks: int
+
+
 class UserSuccessMessage(BaseModel):
     status_code: int
     detail: dict[str, Any]
\ No newline at end of file
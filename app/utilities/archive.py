@@ -0,0 +1,188 @@
+import threading
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, literal
+from sqlmodel import Session, select
+
+from app.models.task import Task, TaskArchive
+from app.models.types import EpochMicros
+from app.utilities.config import Config
+from app.utilities.helper import get_utc_now
+from app.utilities.history import append_events
+from app.utilities.logger import get_logger
+from app.utilities.shard import shard_indexes
+from app.utilities.write_batch import coordinator_for
+
+logger = get_logger(__name__)
+
+_task_columns = [column.key for column in Task.__table__.columns]  # noqa
+
+
+def archive_cutoff(after_days: int = Config.ARCHIVE_AFTER_DAYS) -> datetime:
+    """
+    Tasks deleted before this are due for the archive, which takes them out
+    of `tasks` and so out of delta sync.
+    """
+    return get_utc_now() - timedelta(days=after_days)
+
+
+def archive_batch(db_session: Session, cutoff: datetime, batch_size: int) -> int:
+    """
+    Move up to `batch_size` tasks soft-deleted before `cutoff` into `tasks_archive`.
+
+    Soft-deleted tasks can't be edited, so `updated_at` is when they were deleted.
+    The task with the highest id always stays: SQLite would hand its rowid
+    to the next new task, which could then never be restored over.
+
+    Returns:
+        int: Number of tasks archived.
+    """
+    connection = db_session.connection()
+    ids = (
+        connection.execute(
+            select(Task.id)
+            .where(
+                Task.is_active == False,  # noqa
+                Task.updated_at < cutoff,
+                Task.id < select(func.max(Task.id)).scalar_subquery(),
+            )
+            .order_by(Task.updated_at)
+            .limit(batch_size)
+        )
+        .scalars()
+        .all()
+    )
+    if not ids:
+        return 0
+
+    connection.execute(
+        insert(TaskArchive).from_select(
+            [*_task_columns, "archived_at"],
+            select(
+                *(getattr(Task, name) for name in _task_columns),
+                literal(get_utc_now(), EpochMicros),
+            ).where(Task.id.in_(ids)),
+        )
+    )
+    connection.execute(delete(Task).where(Task.id.in_(ids)))
+    return len(ids)
+
+
+def restore_tasks(db_session: Session, ids: list[int]) -> list[tuple[int, int, int]]:
+    """
+    Move archived tasks back into `tasks`, still soft-deleted, with a new
+    version, and log a `task.restored` event for each.
+
+    Returns:
+        list: `(id, owner_id, version)` of every restored task.
+    """
+    connection = db_session.connection()
+    restored = connection.execute(
+        select(TaskArchive.id, TaskArchive.owner_id, TaskArchive.version + 1).where(
+            TaskArchive.id.in_(ids)
+        )
+    ).all()
+    if not restored:
+        return []
+
+    now = get_utc_now()
+    columns = {name: getattr(TaskArchive, name) for name in _task_columns}
+    columns.update(
+        version=TaskArchive.version + 1, updated_at=literal(now, EpochMicros)
+    )
+    connection.execute(
+        insert(Task).from_select(
+            list(columns),
+            select(*columns.values()).where(TaskArchive.id.in_(ids)),
+        )
+    )
+    connection.execute(delete(TaskArchive).where(TaskArchive.id.in_(ids)))
+    append_events(
+        db_session,
+        [
+            {
+                "task_id": task_id,
+                "owner_id": owner_id,
+                "version": version,
+                "type": "task.restored",
+                "changes": {},
+                "created_at": now,
+            }
+            for task_id, owner_id, version in restored
+        ],
+    )
+    return [tuple(row) for row in restored]
+
+
+class Archiver:
+    """
+    Background thread that archives old soft-deleted tasks on every shard.
+
+    Every `interval_s` it moves tasks deleted more than `after_days` ago
+    in batches of `batch_size`, each its own small write through the
+    shard's write coordinator, so regular writes interleave with it.
+    """
+
+    def __init__(self, interval_s: float, after_days: int, batch_size: int):
+        self.interval_s = interval_s
+        self.after_days = after_days
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="task-archiver", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def run_once(self) -> int:
+        """
+        Archive everything currently due.
+
+        Returns:
+            int: Number of tasks archived.
+        """
+        cutoff = archive_cutoff(self.after_days)
+        archived = 0
+        for index in shard_indexes():
+            while not self._stop.is_set():
+                moved = (
+                    coordinator_for(index)
+                    .submit(
+                        partial(
+                            archive_batch, cutoff=cutoff, batch_size=self.batch_size
+                        )
+                    )
+                    .result()
+                )
+                archived += moved
+                if moved < self.batch_size:
+                    break
+
+        if archived:
+            logger.info(f"Archived {archived} tasks deleted before {cutoff:%Y-%m-%d}")
+        return archived
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Task archival failed")
+
+
+archiver = Archiver(
+    Config.ARCHIVE_INTERVAL_S, Config.ARCHIVE_AFTER_DAYS, Config.ARCHIVE_BATCH_SIZE
+)
@@ -0,0 +1,332 @@
+import argparse
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from app.schemas.backup import (
+    BackupCheck,
+    BackupFile,
+    BackupJob,
+    BackupJobState,
+    BackupSnapshot,
+)
+from app.utilities.config import Config
+from app.utilities.helper import get_utc_now
+from app.utilities.logger import get_logger
+from app.utilities.shard import shard_indexes, shard_path
+
+logger = get_logger(__name__)
+
+manifest_name = "manifest.json"
+_partial_suffix = ".partial"
+_backup_lock = threading.Lock()
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def backup_file(source: str, target: str, step_pages: int, step_sleep_s: float) -> int:
+    """
+    Copy a live database into `target` with the SQLite backup API.
+
+    The copy runs `step_pages` pages at a time with a pause between steps.
+    It reads from one snapshot held open for the whole copy: in WAL mode
+    that never blocks writers, and it keeps their commits from restarting
+    the backup, which a long stepped copy would otherwise never outrun.
+
+    Returns:
+        int: Page count of the copy.
+    """
+    source_db = sqlite3.connect(
+        f"file:{source}?mode=ro", uri=True, isolation_level=None
+    )
+    target_db = sqlite3.connect(target)
+    try:
+        source_db.execute("BEGIN")
+        source_db.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+
+        def pause(status, remaining, total):  # noqa
+            if remaining:
+                time.sleep(step_sleep_s)
+
+        source_db.backup(target_db, pages=step_pages, progress=pause)
+        source_db.execute("COMMIT")
+
+        # The copy inherits WAL mode; switch it back so the snapshot is a single file
+        target_db.execute("PRAGMA journal_mode=DELETE")
+        return target_db.execute("PRAGMA page_count").fetchone()[0]
+    finally:
+        source_db.close()
+        target_db.close()
+
+
+def _snapshot_dir(name: str, backup_dir: str) -> str:
+    if not name or os.path.basename(name) != name or name.endswith(_partial_suffix):
+        raise ValueError(f"Invalid backup name: {name!r}")
+    return os.path.join(backup_dir, name)
+
+
+def _read_manifest(directory: str) -> BackupSnapshot:
+    with open(os.path.join(directory, manifest_name)) as file:
+        return BackupSnapshot.model_validate_json(file.read())
+
+
+def list_backups(backup_dir: str = Config.BACKUP_DIR) -> list[BackupSnapshot]:
+    """
+    Completed snapshots in `backup_dir`, newest first.
+    """
+    if not os.path.isdir(backup_dir):
+        return []
+
+    snapshots = [
+        _read_manifest(os.path.join(backup_dir, name))
+        for name in os.listdir(backup_dir)
+        if not name.endswith(_partial_suffix)
+        and os.path.isfile(os.path.join(backup_dir, name, manifest_name))
+    ]
+    return sorted(snapshots, key=lambda snapshot: snapshot.created_at, reverse=True)
+
+
+def create_backup(
+    backup_dir: str = Config.BACKUP_DIR,
+    keep: int = Config.BACKUP_KEEP,
+    step_pages: int = Config.BACKUP_STEP_PAGES,
+    step_sleep_ms: float = Config.BACKUP_STEP_SLEEP_MS,
+) -> Optional[BackupSnapshot]:
+    """
+    Snapshot every shard's database into a new directory in `backup_dir`
+    and drop all but the newest `keep` snapshots.
+
+    Each file is consistent on its own; shards are copied one after
+    another, so a user moved between shards meanwhile may be missing from
+    or present in both copies. The snapshot is written under a `.partial`
+    name and renamed once its manifest of checksums is complete.
+
+    Returns:
+        BackupSnapshot | None: The new snapshot, or None if a backup is already running.
+    """
+    if not _backup_lock.acquire(blocking=False):
+        return None
+
+    try:
+        created_at = get_utc_now()
+        name = f"{created_at:%Y%m%dT%H%M%S%fZ}"
+        partial = os.path.join(backup_dir, name + _partial_suffix)
+        os.makedirs(partial)
+
+        files = []
+        for index in shard_indexes():
+            source = shard_path(index)
+            file_name = os.path.basename(source)
+            target = os.path.join(partial, file_name)
+            page_count = backup_file(source, target, step_pages, step_sleep_ms / 1000)
+            files.append(
+                BackupFile(
+                    shard=index,
+                    name=file_name,
+                    bytes=os.path.getsize(target),
+                    page_count=page_count,
+                    sha256=file_sha256(target),
+                )
+            )
+
+        snapshot = BackupSnapshot(name=name, created_at=created_at, files=files)
+        with open(os.path.join(partial, manifest_name), "w") as file:
+            file.write(snapshot.model_dump_json(indent=2))
+        os.rename(partial, _snapshot_dir(name, backup_dir))
+        logger.info(f"Created backup {name} of {len(files)} database files")
+
+        for old in list_backups(backup_dir)[keep:]:
+            shutil.rmtree(_snapshot_dir(old.name, backup_dir))
+            logger.info(f"Removed backup {old.name}")
+
+        return snapshot
+
+    finally:
+        _backup_lock.release()
+
+
+class BackupRunner:
+    """
+    Runs `create_backup` on a background thread so a request only starts it.
+
+    One job runs at a time; `job` is the running one or the last one to
+    finish, for callers to poll.
+    """
+
+    def __init__(self):
+        self.job: Optional[BackupJob] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> Optional[BackupJob]:
+        """
+        Start a backup job.
+
+        Returns:
+            BackupJob | None: The new job, or None if one is already running.
+        """
+        with self._lock:
+            if self.job is not None and self.job.state == BackupJobState.RUNNING:
+                return None
+            self.job = BackupJob(state=BackupJobState.RUNNING, started_at=get_utc_now())
+            self._thread = threading.Thread(
+                target=self._run, name="db-backup", daemon=True
+            )
+            self._thread.start()
+            return self.job
+
+    def stop(self) -> None:
+        """
+        Wait for a running job, so shutdown never leaves a half-written snapshot behind.
+        """
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        snapshot, error = None, None
+        try:
+            snapshot = create_backup()
+            if snapshot is None:
+                error = "A backup is already running"
+        except Exception as exc:
+            logger.exception("Database backup failed")
+            error = str(exc) or type(exc).__name__
+
+        with self._lock:
+            self.job = self.job.model_copy(
+                update={
+                    "state": BackupJobState.FAILED
+                    if error
+                    else BackupJobState.SUCCEEDED,
+                    "finished_at": get_utc_now(),
+                    "snapshot": snapshot,
+                    "error": error,
+                }
+            )
+
+
+backups = BackupRunner()
+
+
+def _check_file(path: str, backup: BackupFile, scratch: str) -> str:
+    if not os.path.isfile(path):
+        return "missing"
+    if file_sha256(path) != backup.sha256:
+        return "checksum mismatch"
+
+    restored = os.path.join(scratch, backup.name)
+    shutil.copyfile(path, restored)
+    db = sqlite3.connect(restored)
+    try:
+        result = [row[0] for row in db.execute("PRAGMA integrity_check")]
+        page_count = db.execute("PRAGMA page_count").fetchone()[0]
+    finally:
+        db.close()
+
+    if result != ["ok"]:
+        return "; ".join(result)
+    if page_count != backup.page_count:
+        return f"{page_count} pages, expected {backup.page_count}"
+    return "ok"
+
+
+def verify_backup(name: str, backup_dir: str = Config.BACKUP_DIR) -> list[BackupCheck]:
+    """
+    Check that a snapshot restores cleanly: every file matches its checksum
+    and page count, and a scratch copy of it passes `PRAGMA integrity_check`.
+    """
+    directory = _snapshot_dir(name, backup_dir)
+    snapshot = _read_manifest(directory)
+
+    checks = []
+    with tempfile.TemporaryDirectory() as scratch:
+        for backup in snapshot.files:
+            detail = _check_file(os.path.join(directory, backup.name), backup, scratch)
+            checks.append(
+                BackupCheck(
+                    name=name, file=backup.name, ok=detail == "ok", detail=detail
+                )
+            )
+
+    return checks
+
+
+def restore_backup(name: str, backup_dir: str = Config.BACKUP_DIR) -> list[str]:
+    """
+    Replace the database files with a verified snapshot. The app must be stopped.
+
+    Returns:
+        list: Paths of the restored database files.
+
+    Raises:
+        ValueError: If the snapshot fails `verify_backup`.
+    """
+    checks = verify_backup(name, backup_dir)
+    failed = [check for check in checks if not check.ok]
+    if failed:
+        raise ValueError(f"Backup {name} failed verification: {failed}")
+
+    directory = _snapshot_dir(name, backup_dir)
+    restored = []
+    for backup in _read_manifest(directory).files:
+        target = shard_path(backup.shard)
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(target + suffix):
+                os.remove(target + suffix)
+        shutil.copyfile(os.path.join(directory, backup.name), target)
+        restored.append(target)
+    return restored
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Back up and restore the database files."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "create", help="Snapshot every shard while the app keeps running"
+    )
+    commands.add_parser("list", help="List snapshots, newest first")
+    verify = commands.add_parser(
+        "verify", help="Restore a snapshot into scratch space and check it"
+    )
+    verify.add_argument("name")
+    restore = commands.add_parser(
+        "restore", help="Replace the databases with a verified snapshot (app stopped)"
+    )
+    restore.add_argument("name")
+    args = parser.parse_args()
+
+    if args.command == "create":
+        snapshot = create_backup()
+        print(snapshot.model_dump_json() if snapshot else "A backup is already running")
+    elif args.command == "list":
+        for snapshot in list_backups():
+            print(
+                f"{snapshot.name}  {sum(file.bytes for file in snapshot.files)} bytes"
+            )
+    elif args.command == "verify":
+        checks = verify_backup(args.name)
+        for check in checks:
+            print(f"{check.file}: {check.detail}")
+        if not all(check.ok for check in checks):
+            raise SystemExit(1)
+    else:
+        for path in restore_backup(args.name):
+            print(f"Restored {path}")
+
+
+if __name__ == "__main__":
+    main()
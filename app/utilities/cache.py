@@ -0,0 +1,241 @@
+import mmap
+import os
+import struct
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from app.utilities.config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process locking only
+    fcntl = None
+
+_COUNTERS_MAGIC = b"WRGC"
+_COUNTERS_HEADER = struct.Struct("<4sI")  # magic, slot count
+_COUNTER = struct.Struct("<Q")
+
+
+class CacheBackend(ABC):
+    """
+    Minimal byte-oriented cache interface.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def incr(self, key: str, amount: int = 1) -> int:
+        """
+        Atomically add `amount` to the counter `key` and return its new value.
+
+        Counters start at 0, are shared by everyone using the backend and are
+        never evicted or cleared; `incr(key, 0)` reads one.
+        """
+
+
+class SharedCounters:
+    """
+    Named counters in an mmap-backed file shared by all workers on a host.
+
+    Names are direct-mapped onto a fixed number of slots; names sharing a
+    slot share a counter, which for generations only costs extra misses.
+    Increments are serialized by an exclusive file lock; reads never lock.
+    """
+
+    def __init__(self, path: str, slots: int = 64):
+        self.path = path
+        self.slots = slots
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        size = _COUNTERS_HEADER.size + slots * _COUNTER.size
+        self._lock()
+        try:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            header = os.read(self._fd, _COUNTERS_HEADER.size)
+            expected = _COUNTERS_HEADER.pack(_COUNTERS_MAGIC, slots)
+            if header != expected or os.fstat(self._fd).st_size != size:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, expected)
+        finally:
+            self._unlock()
+
+        self._mm = mmap.mmap(self._fd, size)
+
+    def _lock(self) -> None:
+        self._thread_lock.acquire()
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def _unlock(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._thread_lock.release()
+
+    def _offset(self, key: str) -> int:
+        return (
+            _COUNTERS_HEADER.size
+            + (zlib.crc32(key.encode()) % self.slots) * _COUNTER.size
+        )
+
+    def _read(self, offset: int) -> int:
+        # Re-read until stable so a concurrent increment is never seen half-written
+        (value,) = _COUNTER.unpack_from(self._mm, offset)
+        while True:
+            (again,) = _COUNTER.unpack_from(self._mm, offset)
+            if again == value:
+                return value
+            value = again
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        offset = self._offset(key)
+        if not amount:
+            return self._read(offset)
+
+        self._lock()
+        try:
+            value = _COUNTER.unpack_from(self._mm, offset)[0] + amount
+            _COUNTER.pack_into(self._mm, offset, value)
+            return value
+        finally:
+            self._unlock()
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache bounded by entry count and total value size.
+
+    Counters live in `counters` when given, so that every worker sees the
+    same generations even though each caches its own values; otherwise
+    they are local to this instance.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: int,
+        counters: Optional[SharedCounters] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.counters = counters
+        self.size = 0
+        self._lock = threading.Lock()
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+        self._counts: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+
+            self._items[key] = value
+            self.size += len(value)
+
+            while self.size > self.max_bytes or len(self._items) > self.max_entries:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        if self.counters is not None:
+            return self.counters.incr(key, amount)
+
+        with self._lock:
+            value = self._counts.get(key, 0) + amount
+            self._counts[key] = value
+            return value
+
+
+def _memory_backend() -> MemoryCache:
+    os.makedirs(Config.DATABASE_DIR, exist_ok=True)
+    counters = SharedCounters(f"{Config.DATABASE_DIR}/{Config.CACHE_GENERATION_FILE}")
+    return MemoryCache(Config.CACHE_MAX_BYTES, Config.CACHE_MAX_ENTRIES, counters)
+
+
+_backends: Dict[str, Callable[[], CacheBackend]] = {
+    "memory": _memory_backend,
+}
+
+
+def register_backend(name: str, factory: Callable[[], CacheBackend]) -> None:
+    """
+    Make a cache backend selectable through `Config.CACHE_BACKEND`.
+    """
+    _backends[name] = factory
+
+
+def create_backend(name: Optional[str] = None) -> CacheBackend:
+    name = name or Config.CACHE_BACKEND
+    if name not in _backends:
+        raise ValueError(f"Unknown cache backend: {name}")
+    return _backends[name]()
+
+
+class VersionedCache:
+    """
+    Cache of pre-serialized responses invalidated by a generation counter.
+
+    Every mutation of the underlying data calls `bump()`; entries written
+    under an older generation are never read again and age out of the
+    backend on their own. The generation is a counter in the backend, so a
+    bump in one worker is seen by every worker sharing it.
+    """
+
+    def __init__(self, namespace: str, backend: CacheBackend):
+        self.namespace = namespace
+        self.backend = backend
+        self._generation_key = f"{namespace}:generation"
+
+    @property
+    def generation(self) -> int:
+        return self.backend.incr(self._generation_key, 0)
+
+    def bump(self) -> None:
+        self.backend.incr(self._generation_key)
+
+    def get_or_load(self, key: str, load: Callable[[], bytes]) -> bytes:
+        """
+        Return the cached value for `key`, calling `load` on a miss.
+
+        The generation is captured before loading, so a value produced while
+        a mutation commits is stored under the stale generation.
+        """
+        versioned_key = f"{self.namespace}:{self.generation}:{key}"
+
+        value = self.backend.get(versioned_key)
+        if value is None:
+            value = load()
+            self.backend.set(versioned_key, value)
+
+        return value
+
+
+user_cache = VersionedCache("users", create_backend())
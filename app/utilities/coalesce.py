@@ -0,0 +1,121 @@
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from fastapi import Request
+
+from app.utilities.config import Config
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "expires_at")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.expires_at: Optional[float] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into a single execution.
+
+    The first caller for a key (the leader) runs the function, every caller
+    arriving while it is in flight waits and receives the same result or
+    exception. With a positive `ttl_ms` the finished result is also served
+    to callers arriving within that window.
+
+    At most `max_keys` calls are tracked: expired results are dropped first,
+    then the cached results closest to expiry. When every slot holds a call
+    still in flight, a new key runs uncoalesced instead of growing the table.
+    """
+
+    def __init__(self, ttl_ms: int = 0, max_keys: int = 1024):
+        self.ttl = ttl_ms / 1000
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def _is_live(self, call: _Call, now: float) -> bool:
+        return call.expires_at is None or call.expires_at > now
+
+    def _prune(self, now: float) -> None:
+        finished = sorted(
+            (key for key, call in self._calls.items() if call.expires_at is not None),
+            key=lambda key: self._calls[key].expires_at,
+        )
+        for key in finished:
+            if (
+                self._is_live(self._calls[key], now)
+                and len(self._calls) < self.max_keys
+            ):
+                break
+            del self._calls[key]
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` once for all concurrent callers sharing `key`.
+
+        Args:
+            key (Hashable): Identity of the call, see `request_key`.
+            fn (Callable): Zero-argument function producing the result.
+
+        Returns:
+            Any: The shared result of `fn`.
+        """
+        with self._lock:
+            now = time.monotonic()
+            call = self._calls.get(key)
+            if call is not None and self._is_live(call, now):
+                leader = False
+            else:
+                if key not in self._calls and len(self._calls) >= self.max_keys:
+                    self._prune(now)
+                if key in self._calls or len(self._calls) < self.max_keys:
+                    call = self._calls[key] = _Call()
+                else:
+                    # Every slot holds a call in flight: run this one on its own
+                    call = None
+                leader = True
+
+        if call is None:
+            return fn()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                # Each waiter raises its own copy; the leader's traceback stays intact
+                raise copy.copy(call.error) from call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                if call.error is not None or self.ttl <= 0:
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+                else:
+                    call.expires_at = time.monotonic() + self.ttl
+            call.event.set()
+
+        return call.result
+
+
+def request_key(request: Request, principal_id: Optional[int]) -> Hashable:
+    """
+    Build a coalescing key from the route, the principal and the query params.
+    """
+    return (
+        request.url.path,
+        principal_id,
+        tuple(sorted(request.query_params.multi_items())),
+    )
+
+
+read_flight = SingleFlight(ttl_ms=Config.COALESCE_TTL_MS)
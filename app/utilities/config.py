@@ -26,6 +26,13 @@ class Config:
     # Database
     DATABASE_DIR: str = os.environ["DATABASE_DIR"]
     DATABASE_NAME: str = os.environ["DATABASE_NAME"]
+    DB_READ_POOL_SIZE: int = int(os.getenv("DB_READ_POOL_SIZE", "8"))
+    DB_LOCK_RETRIES: int = int(os.getenv("DB_LOCK_RETRIES", "6"))
+    DB_LOCK_BACKOFF_MS: int = int(os.getenv("DB_LOCK_BACKOFF_MS", "10"))
+    # Compiled SQL statements cached per engine (SQLAlchemy's `query_cache_size`)
+    DB_QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1000"))
+    DATABASE_SHARDS: int = int(os.getenv("DATABASE_SHARDS", "1"))
+    SHARD_ID_STRIDE: int = int(os.getenv("SHARD_ID_STRIDE", "64"))
 
     # JWT
     JWT_SECRET_KEY: str = os.environ["JWT_SECRET_KEY"]
@@ -35,3 +42,81 @@ class Config:
 
     # Security
     SALT_LENGTH: int = int(os.environ["SALT_LENGTH"])
+
+    # Request coalescing
+    COALESCE_TTL_MS: int = int(os.getenv("COALESCE_TTL_MS", "0"))
+
+    # Response cache
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_MAX_BYTES: int = int(os.getenv("CACHE_MAX_BYTES", "8388608"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+    CACHE_GENERATION_FILE: str = os.getenv("CACHE_GENERATION_FILE", "generations.cache")
+
+    # Shared principal cache
+    PRINCIPAL_CACHE_FILE: str = os.getenv("PRINCIPAL_CACHE_FILE", "principals.cache")
+    PRINCIPAL_CACHE_SLOTS: int = int(os.getenv("PRINCIPAL_CACHE_SLOTS", "65536"))
+
+    # Core read path for list routes (comma-separated route names)
+    FAST_READ_ROUTES: set[str] = set(
+        filter(
+            None,
+            os.getenv(
+                "FAST_READ_ROUTES",
+                "list_tasks,list_deleted_tasks,list_users,list_deleted_users",
+            ).split(","),
+        )
+    )
+
+    # Group commit for task writes
+    WRITE_BATCH_WINDOW_MS: float = float(os.getenv("WRITE_BATCH_WINDOW_MS", "2"))
+    WRITE_BATCH_MAX_OPS: int = int(os.getenv("WRITE_BATCH_MAX_OPS", "64"))
+
+    # Bulk mutation endpoints
+    BULK_MAX_IDS: int = int(os.getenv("BULK_MAX_IDS", "1000"))
+
+    # Delta sync
+    SYNC_PAGE_SIZE: int = int(os.getenv("SYNC_PAGE_SIZE", "500"))
+    SYNC_SETTLE_MS: int = int(os.getenv("SYNC_SETTLE_MS", "2000"))
+
+    # Streaming export
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+    # Task import
+    IMPORT_CHUNK_ROWS: int = int(os.getenv("IMPORT_CHUNK_ROWS", "1000"))
+    IMPORT_MAX_ERRORS: int = int(os.getenv("IMPORT_MAX_ERRORS", "100"))
+    IMPORT_MAX_RECORD_CHARS: int = int(os.getenv("IMPORT_MAX_RECORD_CHARS", "1048576"))
+
+    # Work report
+    REPORT_DEFAULT_DAYS: int = int(os.getenv("REPORT_DEFAULT_DAYS", "30"))
+    REPORT_MAX_DAYS: int = int(os.getenv("REPORT_MAX_DAYS", "1830"))
+    RENDER_CACHE_MAX_BYTES: int = int(os.getenv("RENDER_CACHE_MAX_BYTES", "16777216"))
+    RENDER_CACHE_MAX_ENTRIES: int = int(os.getenv("RENDER_CACHE_MAX_ENTRIES", "50000"))
+
+    # Task history
+    HISTORY_PAGE_SIZE: int = int(os.getenv("HISTORY_PAGE_SIZE", "100"))
+
+    # Archival of soft-deleted tasks (interval 0 disables the archiver)
+    ARCHIVE_INTERVAL_S: float = float(os.getenv("ARCHIVE_INTERVAL_S", "3600"))
+    ARCHIVE_AFTER_DAYS: int = int(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+    ARCHIVE_BATCH_SIZE: int = int(os.getenv("ARCHIVE_BATCH_SIZE", "200"))
+
+    # Database file maintenance (interval 0 disables the scheduler)
+    MAINTENANCE_INTERVAL_S: float = float(os.getenv("MAINTENANCE_INTERVAL_S", "300"))
+    MAINTENANCE_IDLE_MS: float = float(os.getenv("MAINTENANCE_IDLE_MS", "5000"))
+    MAINTENANCE_BUDGET_MS: float = float(os.getenv("MAINTENANCE_BUDGET_MS", "500"))
+    MAINTENANCE_VACUUM_PAGES: int = int(os.getenv("MAINTENANCE_VACUUM_PAGES", "256"))
+    MAINTENANCE_ANALYSIS_LIMIT: int = int(
+        os.getenv("MAINTENANCE_ANALYSIS_LIMIT", "1000")
+    )
+
+    # Online backups
+    BACKUP_DIR: str = os.getenv("BACKUP_DIR", os.path.join(DATABASE_DIR, "backups"))
+    BACKUP_KEEP: int = int(os.getenv("BACKUP_KEEP", "7"))
+    BACKUP_STEP_PAGES: int = int(os.getenv("BACKUP_STEP_PAGES", "256"))
+    BACKUP_STEP_SLEEP_MS: float = float(os.getenv("BACKUP_STEP_SLEEP_MS", "5"))
+
+    # Task event stream
+    EVENT_BUFFER_SIZE: int = int(os.getenv("EVENT_BUFFER_SIZE", "256"))
+    EVENT_HISTORY_SIZE: int = int(os.getenv("EVENT_HISTORY_SIZE", "64"))
+    EVENT_HISTORY_TTL_S: float = float(os.getenv("EVENT_HISTORY_TTL_S", "600"))
+    EVENT_HEARTBEAT_S: float = float(os.getenv("EVENT_HEARTBEAT_S", "15"))
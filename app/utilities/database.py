@@ -1,24 +1,235 @@
 import os
+import time
+from typing import Optional
 
+from sqlalchemy import Engine, Table, event, inspect, text
+from sqlalchemy.exc import OperationalError
 from sqlmodel import create_engine, Session, SQLModel
 
+from app.models.types import EpochMicros, epoch_micros_from_text
 from app.utilities.config import Config
 
 os.makedirs(Config.DATABASE_DIR, exist_ok=True)
 database_path = f"{Config.DATABASE_DIR}/{Config.DATABASE_NAME}"
 database_url = f"sqlite:///{database_path}"
+read_only_url = f"sqlite:///file:{database_path}?mode=ro&uri=true"
 
-engine = create_engine(database_url, echo=False)
+
+def begin_immediate(connection) -> None:
+    """
+    Take the write lock up front, backing off while another writer holds it.
+    """
+    for attempt in range(Config.DB_LOCK_RETRIES + 1):
+        try:
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+            return
+        except OperationalError as exc:
+            if "locked" not in str(exc) or attempt == Config.DB_LOCK_RETRIES:
+                raise
+            time.sleep(Config.DB_LOCK_BACKOFF_MS * (2**attempt) / 1000)
+
+
+def attach_home(dbapi_connection, home: str) -> None:
+    """
+    ATTACH the primary database read-only as `home`, so that unqualified
+    `users` in shard queries resolves to the primary's table.
+    """
+    dbapi_connection.execute(
+        "ATTACH DATABASE ? AS home", (f"file:{os.path.abspath(home)}?mode=ro",)
+    )
+
+
+def create_write_engine(url: str, home: Optional[str] = None) -> Engine:
+    """
+    Engine with a single connection whose transactions start with BEGIN IMMEDIATE.
+
+    pysqlite's own transaction handling is disabled: it defers BEGIN until
+    the first DML statement, which both breaks SAVEPOINTs and lets readers
+    fail late with "database is locked" when upgrading to a write lock.
+    """
+    engine = create_engine(
+        url,
+        echo=False,
+        pool_size=1,
+        max_overflow=0,
+        query_cache_size=Config.DB_QUERY_CACHE_SIZE,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):  # noqa
+        dbapi_connection.isolation_level = None
+        # Only takes effect for new databases (or on the next VACUUM)
+        dbapi_connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+        if home is not None:
+            attach_home(dbapi_connection, home)
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        begin_immediate(connection)
+
+    return engine
+
+
+def create_read_engine(url: str, home: Optional[str] = None) -> Engine:
+    """
+    Engine with a pool of read-only (`mode=ro`, `query_only`) connections.
+    """
+    engine = create_engine(
+        url,
+        echo=False,
+        pool_size=Config.DB_READ_POOL_SIZE,
+        max_overflow=0,
+        query_cache_size=Config.DB_QUERY_CACHE_SIZE,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):  # noqa
+        if home is not None:
+            attach_home(dbapi_connection, home)
+        dbapi_connection.execute("PRAGMA query_only=ON")
+
+    return engine
+
+
+write_engine = create_write_engine(database_url)
+read_engine = create_read_engine(read_only_url)
 
 
 def get_db_session():
-    with Session(engine) as session:
+    """
+    Session on the single writer connection, for routes that mutate data.
+    """
+    with Session(write_engine) as session:
+        yield session
+
+
+def get_read_db_session():
+    """
+    Session on the read-only pool, for routes that only query.
+    """
+    with Session(read_engine) as session:
         yield session
 
 
 def init_table():
     from app.models.user import User  # noqa
     from app.models.task import Task  # noqa
+    from app.models.report import TaskRollup  # noqa
+
+    # SQLModel.metadata.drop_all(write_engine)
+    SQLModel.metadata.create_all(write_engine)
+    add_missing_columns()
+    drop_undeclared_indexes()
+    convert_epoch_columns()
+
+
+def add_missing_columns(
+    engine: Engine = write_engine, tables: Optional[list[Table]] = None
+):
+    """
+    Add columns and indexes declared on the models but missing from existing
+    tables.
+
+    `create_all` only creates missing tables, so databases created by an
+    older version of the app would otherwise never see new columns.
+    New non-nullable columns must declare a `server_default`.
+    """
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        for table in tables or SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+
+                ddl = f"{column.name} {column.type.compile(dialect=engine.dialect)}"
+                if column.server_default is not None:
+                    ddl += f" DEFAULT {column.server_default.arg}"
+                if not column.nullable:
+                    ddl += " NOT NULL"
+
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
+
+def drop_undeclared_indexes(
+    engine: Engine = write_engine, tables: Optional[list[Table]] = None
+):
+    """
+    Drop `ix_` indexes that existing tables still have but the models no
+    longer declare, such as the single-column `is_active` indexes the
+    partial active-row indexes replaced.
+
+    Only the `ix_` prefix SQLModel gives `Field(index=True)` is touched, so
+    indexes created by hand under another name are kept.
+    """
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        for table in tables or SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            declared = {index.name for index in table.indexes}
+            for index in inspector.get_indexes(table.name):
+                if index["name"].startswith("ix_") and index["name"] not in declared:
+                    connection.execute(text(f"DROP INDEX {index['name']}"))
+
+
+def convert_epoch_columns(
+    engine: Engine = write_engine, tables: Optional[list[Table]] = None
+):
+    """
+    Rewrite `EpochMicros` columns that still hold the ISO text of the
+    `DateTime` columns they replaced, in place.
+
+    Only values stored as text are touched, so this is a no-op once a
+    database is converted. The old columns keep their DATETIME declaration,
+    whose affinity stores the integers unchanged. The table's triggers (such
+    as the append-only guard on `task_events`) are dropped for the rewrite
+    and recreated in the same transaction.
+    """
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        for table in tables or SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            columns = [
+                column.name
+                for column in table.columns
+                if isinstance(column.type, EpochMicros)
+            ]
+            stale = " OR ".join(f"typeof({name}) = 'text'" for name in columns)
+            if (
+                not columns
+                or not connection.execute(
+                    text(f"SELECT 1 FROM {table.name} WHERE {stale} LIMIT 1")
+                ).first()
+            ):
+                continue
 
-    # SQLModel.metadata.drop_all(engine)
-    SQLModel.metadata.create_all(engine)
+            triggers = connection.execute(
+                text(
+                    "SELECT name, sql FROM sqlite_master "
+                    "WHERE type = 'trigger' AND tbl_name = :table"
+                ),
+                {"table": table.name},
+            ).all()
+            for name, _ in triggers:
+                connection.execute(text(f"DROP TRIGGER {name}"))
+            for name in columns:
+                connection.execute(
+                    text(
+                        f"UPDATE {table.name} SET {name} = "
+                        f"{epoch_micros_from_text(name)} "
+                        f"WHERE typeof({name}) = 'text'"
+                    )
+                )
+            for _, sql in triggers:
+                connection.execute(text(sql))
@@ -0,0 +1,190 @@
+import asyncio
+import secrets
+import threading
+import time
+from collections import deque
+from typing import Any, NamedTuple, Optional
+
+from pydantic_core import to_json
+
+from app.utilities.config import Config
+
+
+class Event(NamedTuple):
+    seq: int
+    type: str
+    data: str
+
+
+class Subscription:
+    """
+    One stream's bounded buffer, filled from any thread and drained on its event loop.
+
+    When the client falls `buffer_size` events behind, the buffer is dropped
+    and replaced by a single `None`, telling the stream to ask the client
+    to resynchronise.
+    """
+
+    def __init__(
+        self, owner_id: int, loop: asyncio.AbstractEventLoop, buffer_size: int
+    ):
+        self.owner_id = owner_id
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(
+            maxsize=buffer_size
+        )
+        self.backlog: list[Event] = []
+        self.reset = False
+
+    def offer(self, event: Event) -> None:
+        # Runs on the subscription's event loop
+        if self.reset:
+            return
+        if self.queue.full():
+            self.reset = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            return
+        self.queue.put_nowait(event)
+
+
+class EventBus:
+    """
+    In-process pub/sub fanout of task events, keyed by owner.
+
+    Every event gets a process-wide sequence number; its SSE id is
+    `<epoch>-<seq>`, where the epoch changes on every restart. The last
+    `history_size` events per owner are kept so a reconnecting client can
+    resume from `Last-Event-ID`; when the gap is no longer covered (or the
+    id is from another epoch) the stream starts with a reset instead.
+
+    Owners with no open stream and no event in the last `history_ttl_s`
+    seconds are forgotten; their clients are reset when they reconnect.
+    """
+
+    def __init__(self, buffer_size: int, history_size: int, history_ttl_s: float):
+        self.buffer_size = buffer_size
+        self.history_size = history_size
+        self.history_ttl_s = history_ttl_s
+        self.epoch = secrets.token_hex(4)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._history: dict[int, deque[Event]] = {}
+        self._published: dict[int, float] = {}
+        self._evicted: dict[int, int] = {}
+        self._forgotten = 0
+        self._next_prune = time.monotonic() + history_ttl_s
+        self._subscribers: dict[int, set[Subscription]] = {}
+
+    def event_id(self, event: Event) -> str:
+        return f"{self.epoch}-{event.seq}"
+
+    def current_id(self) -> str:
+        return f"{self.epoch}-{self._seq}"
+
+    def format(self, event: Event) -> str:
+        """
+        Encode an event as an SSE message.
+        """
+        return (
+            f"id: {self.event_id(event)}\nevent: {event.type}\ndata: {event.data}\n\n"
+        )
+
+    def format_reset(self) -> str:
+        """
+        SSE message telling the client it missed events and must resynchronise,
+        e.g. through `/task/changes`. Its id lets the next reconnect resume from now.
+        """
+        return f"id: {self.current_id()}\nevent: reset\ndata: {{}}\n\n"
+
+    def publish(self, owner_id: int, event_type: str, data: Any) -> None:
+        """
+        Fan an event out to the owner's open streams. Safe to call from any thread.
+        """
+        payload = to_json(data).decode()
+
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_prune:
+                self._prune(now)
+
+            self._seq += 1
+            event = Event(self._seq, event_type, payload)
+
+            history = self._history.get(owner_id)
+            if history is None:
+                history = self._history[owner_id] = deque(maxlen=self.history_size)
+                # Events of a forgotten owner may be gone; resume only from here on
+                self._evicted[owner_id] = self._forgotten
+            elif len(history) == self.history_size:
+                self._evicted[owner_id] = history[0].seq
+            history.append(event)
+            self._published[owner_id] = now
+
+            subscribers = list(self._subscribers.get(owner_id, ()))
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:  # event loop already closed
+                self.unsubscribe(subscription)
+
+    def _prune(self, now: float) -> None:
+        # Called with the lock held
+        for owner_id, published in list(self._published.items()):
+            if (
+                now - published >= self.history_ttl_s
+                and owner_id not in self._subscribers
+            ):
+                self._forgotten = max(self._forgotten, self._history[owner_id][-1].seq)
+                del (
+                    self._history[owner_id],
+                    self._published[owner_id],
+                    self._evicted[owner_id],
+                )
+        self._next_prune = now + self.history_ttl_s
+
+    def subscribe(
+        self, owner_id: int, last_event_id: Optional[str] = None
+    ) -> Subscription:
+        """
+        Open a subscription on the running event loop, with the events missed
+        since `last_event_id` (if any) in its `backlog`.
+        """
+        subscription = Subscription(
+            owner_id, asyncio.get_running_loop(), self.buffer_size
+        )
+
+        with self._lock:
+            if last_event_id:
+                epoch, _, seq = last_event_id.partition("-")
+                last_seq = int(seq) if epoch == self.epoch and seq.isdigit() else None
+
+                if last_seq is None or last_seq < self._evicted.get(
+                    owner_id, self._forgotten
+                ):
+                    subscription.reset = True
+                else:
+                    subscription.backlog = [
+                        event
+                        for event in self._history.get(owner_id, ())
+                        if event.seq > last_seq
+                    ]
+
+            self._subscribers.setdefault(owner_id, set()).add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.owner_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.owner_id]
+
+
+task_events = EventBus(
+    Config.EVENT_BUFFER_SIZE, Config.EVENT_HISTORY_SIZE, Config.EVENT_HISTORY_TTL_S
+)
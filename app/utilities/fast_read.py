@@ -0,0 +1,182 @@
+from typing import Any, Iterator, Optional, Sequence
+
+from sqlalchemy import ColumnElement, Connection, Row, lambda_stmt
+from sqlmodel import Session, select
+
+from app.models.task import Task
+from app.models.user import User
+from app.utilities.config import Config
+
+# Column projections in `ReadUser` / `ReadTask` field order
+_user_columns = (
+    User.id,
+    User.full_name,
+    User.email_id,
+    User.phone_no,
+    User.role,
+    User.version,
+    User.created_at,
+    User.updated_at,
+)
+_user_fields = tuple(column.key for column in _user_columns)
+
+_task_columns = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.note,
+    Task.status,
+    Task.version,
+    Task.created_at,
+    Task.updated_at,
+)
+
+_task_summary_columns = (Task.id, Task.title, Task.status, Task.updated_at)
+_task_summary_fields = tuple(column.key for column in _task_summary_columns)
+
+_task_report_columns = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.note,
+    Task.status,
+    Task.updated_at,
+)
+_task_report_fields = tuple(column.key for column in _task_report_columns)
+
+_task_export_columns = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.note,
+    Task.status,
+    Task.version,
+    Task.is_active,
+    Task.created_at,
+    Task.updated_at,
+)
+task_export_fields = tuple(column.key for column in _task_export_columns)
+
+
+def use_fast_read(route_name: str) -> bool:
+    """
+    Whether a list route serves from the Core read path (see `Config.FAST_READ_ROUTES`).
+    """
+    return route_name in Config.FAST_READ_ROUTES
+
+
+def read_user_rows(
+    db_session: Session, *criteria: ColumnElement[bool]
+) -> list[dict[str, Any]]:
+    """
+    Fetch users as `ReadUser`-shaped dicts with a column-projected Core select.
+
+    Rows never become ORM instances, so nothing is hydrated or tracked by
+    the session's identity map.
+    """
+    statement = select(*_user_columns).where(*criteria).order_by(User.id)
+    result = db_session.connection().execute(statement)
+    return [dict(zip(_user_fields, row)) for row in result]
+
+
+def _task_row(row: Any) -> dict[str, Any]:
+    return {
+        "id": row[0],
+        "title": row[1],
+        "description": row[2],
+        "note": row[3],
+        "status": row[4],
+        "version": row[5],
+        "owner": dict(zip(_user_fields, row[len(_task_columns) :])),
+        "created_at": row[6],
+        "updated_at": row[7],
+    }
+
+
+def read_task_rows(
+    db_session: Session, *criteria: ColumnElement[bool]
+) -> list[dict[str, Any]]:
+    """
+    Fetch tasks with their owner as `ReadTask`-shaped dicts with a single
+    column-projected Core select.
+    """
+    statement = (
+        select(*_task_columns, *_user_columns)
+        .join(User, Task.owner_id == User.id)
+        .where(*criteria)
+        .order_by(Task.id)
+    )
+    result = db_session.connection().execute(statement)
+    return [_task_row(row) for row in result]
+
+
+def read_active_task_rows(db_session: Session, owner_id: int) -> list[dict[str, Any]]:
+    """
+    `read_task_rows` for an owner's active tasks, as a lambda statement:
+    the task listing is hot enough to skip rebuilding the join every call.
+    """
+    statement = lambda_stmt(
+        lambda: select(*_task_columns, *_user_columns)
+        .join(User, Task.owner_id == User.id)
+        .where(Task.owner_id == owner_id, Task.is_active == True)  # noqa
+        .order_by(Task.id)
+    )
+    result = db_session.connection().execute(statement)
+    return [_task_row(row) for row in result]
+
+
+def read_task_changes(
+    db_session: Session, *criteria: ColumnElement[bool], limit: Optional[int] = None
+) -> list[tuple[bool, dict[str, Any]]]:
+    """
+    Fetch tasks in `(updated_at, id)` order as `(is_active, ReadTask dict)` pairs.
+    """
+    statement = (
+        select(*_task_columns, *_user_columns, Task.is_active)
+        .join(User, Task.owner_id == User.id)
+        .where(*criteria)
+        .order_by(Task.updated_at, Task.id)
+        .limit(limit)
+    )
+    result = db_session.connection().execute(statement)
+    return [(row[-1], _task_row(row[:-1])) for row in result]
+
+
+def read_task_summaries(
+    db_session: Session, *criteria: ColumnElement[bool]
+) -> list[dict[str, Any]]:
+    """
+    Fetch `ReadTaskSummary`-shaped dicts, leaving the text columns and the
+    owner row untouched.
+    """
+    statement = select(*_task_summary_columns).where(*criteria).order_by(Task.id)
+    result = db_session.connection().execute(statement)
+    return [dict(zip(_task_summary_fields, row)) for row in result]
+
+
+def read_task_report_rows(
+    db_session: Session, *criteria: ColumnElement[bool]
+) -> list[dict[str, Any]]:
+    """
+    Fetch the columns a rendered report needs, oldest change first.
+    """
+    statement = (
+        select(*_task_report_columns)
+        .where(*criteria)
+        .order_by(Task.updated_at, Task.id)
+    )
+    result = db_session.connection().execute(statement)
+    return [dict(zip(_task_report_fields, row)) for row in result]
+
+
+def iter_task_export(
+    connection: Connection, batch_size: int, *criteria: ColumnElement[bool]
+) -> Iterator[Sequence[Row]]:
+    """
+    Yield tasks (all `task_export_fields`, deleted ones included) in id order,
+    `batch_size` rows at a time from a single streaming cursor, so memory
+    stays flat however many rows match.
+    """
+    statement = select(*_task_export_columns).where(*criteria).order_by(Task.id)
+    result = connection.execution_options(yield_per=batch_size).execute(statement)
+    yield from result.partitions()
@@ -0,0 +1,140 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable
+
+from sqlalchemy import Connection, Engine, delete, insert, text
+from sqlmodel import Session, select
+
+from app.models.task import TaskEvent, TaskStatus
+
+# Field diffs are never rewritten; rows only leave a shard when their owner moves
+append_only_trigger = """
+CREATE TRIGGER IF NOT EXISTS task_events_append_only BEFORE UPDATE ON task_events
+BEGIN SELECT RAISE(ABORT, 'task_events is append-only'); END
+"""
+
+
+def _json_value(column: str) -> str:
+    # The JSON form `field_changes` gives a column's stored value
+    if column == "status":
+        cases = " ".join(
+            f"WHEN '{status.name}' THEN '{status.value}'" for status in TaskStatus
+        )
+        return f"CASE {{row}}.status {cases} END"
+    if column == "is_active":
+        return "json(CASE WHEN {row}.is_active THEN 'true' ELSE 'false' END)"
+    return f"{{row}}.{column}"
+
+
+def _diff(column: str) -> str:
+    value = _json_value(column)
+    return (
+        f"SELECT '{column}' AS name, "
+        f"json_array({value.format(row='OLD')}, {value.format(row='NEW')}) AS value "
+        f"WHERE OLD.{column} IS NOT NEW.{column}"
+    )
+
+
+history_fields = ("title", "description", "note", "status", "is_active")
+_diffs = "\n                UNION ALL ".join(_diff(column) for column in history_fields)
+
+# Every versioned UPDATE of a task (single or bulk) logs its diff in the same
+# statement, from the old and new rows, so no write has to read the row first
+update_trigger = f"""
+CREATE TRIGGER IF NOT EXISTS task_events_record_update AFTER UPDATE ON tasks
+WHEN OLD.version IS NOT NEW.version
+BEGIN
+    INSERT INTO task_events (task_id, owner_id, version, type, changes, created_at)
+    VALUES (
+        NEW.id,
+        NEW.owner_id,
+        NEW.version,
+        CASE
+            WHEN OLD.is_active AND NOT NEW.is_active THEN 'task.deleted'
+            WHEN NEW.is_active AND NOT OLD.is_active THEN 'task.activated'
+            WHEN OLD.status IS NOT NEW.status THEN 'task.status'
+            ELSE 'task.updated'
+        END,
+        (
+            SELECT json_group_object(name, json(value))
+            FROM ({_diffs})
+        ),
+        NEW.updated_at
+    );
+END
+"""
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def field_changes(fields: Iterable[str], before: Any, after: Any) -> dict[str, list]:
+    """
+    `{field: [old, new]}` for the fields whose value differs, JSON-ready.
+
+    Args:
+        fields (Iterable[str]): Field names, in the order of `before`'s columns.
+        before: Row of the old values, or None if unknown.
+        after: Object or mapping holding the new values.
+    """
+    changes = {}
+    for index, name in enumerate(fields):
+        old = before[index] if before is not None else None
+        new = after[name] if isinstance(after, dict) else getattr(after, name)
+        if old != new:
+            changes[name] = [_plain(old), _plain(new)]
+    return changes
+
+
+def install_history(engine: Engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(text(append_only_trigger))
+        connection.execute(text(update_trigger))
+
+
+def append_events(db_session: Session, rows: list[dict[str, Any]]) -> int:
+    """
+    Log events that no UPDATE trigger sees (creates and restores) in the
+    caller's write transaction, so they are ordered with the updates.
+    """
+    db_session.connection().execute(insert(TaskEvent), rows)
+    return len(rows)
+
+
+def move_task_events(source: Connection, target: Connection, owner_id: int) -> None:
+    """
+    Append an owner's events to another shard, in order, and drop them from the source.
+    """
+    columns = [column for column in TaskEvent.__table__.columns if column.key != "seq"]  # noqa
+    rows = [
+        dict(row)
+        for row in source.execute(
+            select(*columns)
+            .where(TaskEvent.owner_id == owner_id)
+            .order_by(TaskEvent.seq)
+        ).mappings()
+    ]
+    if rows:
+        target.execute(insert(TaskEvent), rows)
+        source.execute(delete(TaskEvent).where(TaskEvent.owner_id == owner_id))
+
+
+def read_task_history(
+    db_session: Session, task_id: int, after: int, limit: int
+) -> list[TaskEvent]:
+    """
+    A task's events with `seq > after`, oldest first, walking `(task_id, seq)`.
+    """
+    return list(
+        db_session.exec(
+            select(TaskEvent)
+            .where(TaskEvent.task_id == task_id, TaskEvent.seq > after)
+            .order_by(TaskEvent.seq)
+            .limit(limit)
+        ).all()
+    )
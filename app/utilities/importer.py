@@ -0,0 +1,185 @@
+import codecs
+import csv
+import json
+from typing import Any, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from app.models.task import Task, TaskStatus
+from app.schemas.task import CreateTask, ImportRowError
+from app.utilities.helper import get_utc_now
+from app.utilities.rollup import record_created
+from app.utilities.shard import allocate_task_ids
+
+
+class TaskImporter:
+    """
+    Incrementally parse and validate an uploaded CSV or NDJSON body.
+
+    Body chunks of any size are fed in as they arrive; only the current
+    partial record (a partial line, or the lines of a quoted CSV field
+    spanning several) is carried between calls, and each character is
+    scanned once. Each complete record is validated against `CreateTask`
+    and turned into an insert-ready dict; failures are counted and the
+    first `max_errors` kept with their 1-based row number (CSV header
+    excluded).
+
+    A record growing past `max_record_chars` (e.g. behind an unbalanced
+    quote) is a failed row; parsing resumes at the next line.
+    """
+
+    def __init__(
+        self, import_format: str, owner_id: int, max_errors: int, max_record_chars: int
+    ):
+        self.import_format = import_format
+        self.owner_id = owner_id
+        self.max_errors = max_errors
+        self.max_record_chars = max_record_chars
+        self.processed = 0
+        self.failed = 0
+        self.errors: list[ImportRowError] = []
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._header: Optional[list[str]] = None
+        self._tail: list[str] = []  # pieces of the current, unterminated line
+        self._lines: list[str] = []  # lines of an open quoted CSV record
+        self._quotes = 0
+        self._size = 0
+        self._skipping = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> list[dict[str, Any]]:
+        """
+        Consume a body chunk and return the valid rows it completed.
+        """
+        rows = []
+        for record in self._records(self._decoder.decode(chunk, final), final):
+            if (
+                self.import_format == "csv"
+                and self._header is None
+                and record is not None
+            ):
+                self._header = [name.strip() for name in next(csv.reader([record]))]
+                continue
+
+            self.processed += 1
+            try:
+                if record is None:
+                    raise ValueError(
+                        f"Record longer than {self.max_record_chars} characters"
+                    )
+                rows.append(self._task_values(self._parse(record)))
+            except (ValueError, ValidationError) as exc:
+                self._fail(exc)
+        return rows
+
+    def close(self) -> list[dict[str, Any]]:
+        return self.feed(b"", final=True)
+
+    def _records(self, text: str, final: bool) -> list[Optional[str]]:
+        """
+        Split decoded text into complete records; None stands for an oversized one.
+        """
+        records = []
+        pieces = text.split("\n")
+        last = len(pieces) - 1
+        for index, piece in enumerate(pieces):
+            terminated = final or index < last
+            if self._skipping:
+                # Drop the rest of an oversized line
+                self._skipping = not terminated
+                continue
+
+            self._size += len(piece)
+            if self._size > self.max_record_chars:
+                records.append(None)
+                self._tail, self._lines = [], []
+                self._quotes = self._size = 0
+                self._skipping = not terminated
+                continue
+
+            if not terminated:
+                self._tail.append(piece)
+                continue
+            if self._tail:
+                piece = "".join(self._tail) + piece
+                self._tail = []
+
+            if self.import_format == "csv":
+                # A quoted CSV field may span lines: a record is complete once its quotes balance
+                quotes = piece.count('"')
+                if self._lines or quotes % 2:
+                    self._lines.append(piece)
+                    self._quotes += quotes
+                    if self._quotes % 2 and not (final and index == last):
+                        continue
+                    piece = "\n".join(self._lines)
+                    self._lines = []
+                    self._quotes = 0
+
+            self._size = 0
+            if piece.strip():
+                records.append(piece)
+
+        return records
+
+    def _parse(self, record: str) -> dict[str, Any]:
+        if self.import_format != "csv":
+            data = json.loads(record)
+            if not isinstance(data, dict):
+                raise ValueError("Expected a JSON object")
+            return data
+
+        values = next(csv.reader([record]))
+        if len(values) != len(self._header):
+            raise ValueError(f"Expected {len(self._header)} columns, got {len(values)}")
+        return {name: value or None for name, value in zip(self._header, values)}
+
+    def _task_values(self, data: dict[str, Any]) -> dict[str, Any]:
+        task = CreateTask.model_validate(data)
+        return {
+            "title": task.title.strip(),
+            "description": task.description.strip() if task.description else None,
+            "note": task.note.strip() if task.note else None,
+            "status": TaskStatus.PENDING,
+            "is_active": True,
+            "owner_id": self.owner_id,
+        }
+
+    def _fail(self, exc: Exception) -> None:
+        self.failed += 1
+        if len(self.errors) >= self.max_errors:
+            return
+
+        if isinstance(exc, ValidationError):
+            detail = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in exc.errors()
+            )
+        else:
+            detail = str(exc)
+        self.errors.append(ImportRowError(row=self.processed, detail=detail))
+
+
+def insert_tasks(db_session: Session, shard: int, rows: list[dict[str, Any]]) -> int:
+    """
+    Insert a chunk of one owner's rows with a single executemany on the shard's writer.
+
+    The rows are stamped here, inside the write transaction, so a chunk that
+    queued behind others cannot commit older than a sync token already
+    handed out.
+    """
+    connection = db_session.connection()
+    now = get_utc_now()
+    ids = allocate_task_ids(db_session, shard, len(rows))
+    if ids is None:
+        rows = [{**row, "created_at": now, "updated_at": now} for row in rows]
+    else:
+        rows = [
+            {**row, "id": task_id, "created_at": now, "updated_at": now}
+            for row, task_id in zip(rows, ids)
+        ]
+
+    connection.execute(insert(Task), rows)
+    record_created(db_session, rows[0]["owner_id"], len(rows), now)
+    return len(rows)
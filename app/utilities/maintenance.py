@@ -0,0 +1,231 @@
+import argparse
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import Engine
+
+from app.schemas.maintenance import DatabaseFile, MaintenanceRun
+from app.utilities.config import Config
+from app.utilities.helper import get_utc_now
+from app.utilities.logger import get_logger
+from app.utilities.shard import Shard, get_shard, shard_indexes
+from app.utilities.write_batch import coordinator_for
+
+logger = get_logger(__name__)
+
+_auto_vacuum_modes = {0: "none", 1: "full", 2: "incremental"}
+
+
+def maintain(
+    engine: Engine,
+    budget_s: float,
+    vacuum_pages: int,
+    analysis_limit: int,
+    may_continue: Callable[[], bool] = lambda: True,
+) -> MaintenanceRun:
+    """
+    One maintenance pass over a database's `main` schema on its writer connection.
+
+    Refreshes planner statistics (a bounded `ANALYZE` the first time,
+    `PRAGMA optimize` after that), reclaims free pages with
+    `incremental_vacuum` in steps of `vacuum_pages` until the free list is
+    empty, `budget_s` is spent or `may_continue()` turns false, then
+    truncates the WAL. The writer connection is released between steps
+    so queued writes are not held up for more than one step.
+
+    Args:
+        engine (Engine): A single-connection write engine.
+        budget_s (float): Time after which no further vacuum steps are started.
+        vacuum_pages (int): Free pages reclaimed per vacuum step.
+        analysis_limit (int): Rows sampled per index by `ANALYZE`.
+        may_continue (Callable, optional): Checked before every vacuum step.
+    """
+    started = time.monotonic()
+    deadline = started + budget_s
+
+    with engine.connect() as connection:
+        db = connection.connection.driver_connection
+        db.execute(f"PRAGMA analysis_limit={int(analysis_limit)}")
+        has_stats = db.execute(
+            "SELECT 1 FROM main.sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        db.execute("PRAGMA main.optimize" if has_stats else "ANALYZE main")
+        incremental = db.execute("PRAGMA main.auto_vacuum").fetchone()[0] == 2
+
+    vacuumed = 0
+    while incremental and time.monotonic() < deadline and may_continue():
+        with engine.connect() as connection:
+            db = connection.connection.driver_connection
+            free = db.execute("PRAGMA main.freelist_count").fetchone()[0]
+            if not free:
+                break
+            step = min(free, vacuum_pages)
+            # executescript steps the pragma to completion; execute() frees a single page
+            db.executescript(f"PRAGMA main.incremental_vacuum({int(step)})")
+            vacuumed += step
+
+    with engine.connect() as connection:
+        db = connection.connection.driver_connection
+        busy, _, _ = db.execute("PRAGMA main.wal_checkpoint(TRUNCATE)").fetchone()
+
+    return MaintenanceRun(
+        finished_at=get_utc_now(),
+        duration_ms=round((time.monotonic() - started) * 1000, 1),
+        analyzed=not has_stats,
+        vacuumed_pages=vacuumed,
+        checkpointed=not busy,
+    )
+
+
+def database_file(
+    shard: Shard, last_run: Optional[MaintenanceRun] = None
+) -> DatabaseFile:
+    """
+    Page, free list and WAL sizes of a shard's database file.
+    """
+    with shard.read_engine.connect() as connection:
+        db = connection.connection.driver_connection
+        page_size, page_count, freelist_count, auto_vacuum = (
+            db.execute(f"PRAGMA main.{pragma}").fetchone()[0]
+            for pragma in ("page_size", "page_count", "freelist_count", "auto_vacuum")
+        )
+
+    wal_path = f"{shard.path}-wal"
+    return DatabaseFile(
+        shard=shard.index,
+        page_size=page_size,
+        page_count=page_count,
+        freelist_count=freelist_count,
+        auto_vacuum=_auto_vacuum_modes.get(auto_vacuum, str(auto_vacuum)),
+        file_bytes=os.path.getsize(shard.path),
+        wal_bytes=os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+        last_maintenance=last_run,
+    )
+
+
+class Maintainer:
+    """
+    Background thread that maintains every shard's database file.
+
+    Every `interval_s` it runs a `maintain` pass on each shard whose write
+    coordinator has been idle for at least `idle_ms`, so maintenance only
+    happens in quiet moments. Vacuuming stops early as soon as writes
+    arrive; a shard that stays busy is picked up on a later round.
+    """
+
+    def __init__(
+        self,
+        interval_s: float,
+        idle_ms: float,
+        budget_ms: float,
+        vacuum_pages: int,
+        analysis_limit: int,
+    ):
+        self.interval_s = interval_s
+        self.idle_s = idle_ms / 1000
+        self.budget_s = budget_ms / 1000
+        self.vacuum_pages = vacuum_pages
+        self.analysis_limit = analysis_limit
+        self.last_runs: dict[int, MaintenanceRun] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="db-maintenance", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def run_once(self, force: bool = False) -> dict[int, MaintenanceRun]:
+        """
+        Maintain every shard that is idle, or every shard if `force` is set.
+
+        Returns:
+            dict: The pass of every shard maintained, by shard index.
+        """
+        runs = {}
+        for index in shard_indexes():
+            coordinator = coordinator_for(index)
+
+            def quiet() -> bool:
+                return not self._stop.is_set() and coordinator.idle_s() >= self.idle_s
+
+            if not force and not quiet():
+                continue
+
+            run = maintain(
+                get_shard(index).write_engine,
+                self.budget_s,
+                self.vacuum_pages,
+                self.analysis_limit,
+                (lambda: not self._stop.is_set()) if force else quiet,
+            )
+            if not run.checkpointed:
+                logger.warning(
+                    f"WAL checkpoint of shard {index} was blocked by readers"
+                )
+            self.last_runs[index] = runs[index] = run
+
+        return runs
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Database maintenance failed")
+
+
+maintainer = Maintainer(
+    Config.MAINTENANCE_INTERVAL_S,
+    Config.MAINTENANCE_IDLE_MS,
+    Config.MAINTENANCE_BUDGET_MS,
+    Config.MAINTENANCE_VACUUM_PAGES,
+    Config.MAINTENANCE_ANALYSIS_LIMIT,
+)
+
+
+def main():
+    from app.utilities.database import init_table
+    from app.utilities.shard import init_shards
+
+    parser = argparse.ArgumentParser(description="Maintain the database files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("run", help="Run a maintenance pass on every shard now")
+    commands.add_parser(
+        "vacuum",
+        help="Rebuild every shard with VACUUM, enabling incremental vacuum on old databases",
+    )
+    args = parser.parse_args()
+
+    init_table()
+    init_shards()
+
+    if args.command == "vacuum":
+        for index in shard_indexes():
+            with get_shard(index).write_engine.connect() as connection:
+                connection.connection.driver_connection.execute("VACUUM main")
+    else:
+        maintainer.run_once(force=True)
+
+    for index in shard_indexes():
+        print(
+            database_file(
+                get_shard(index), maintainer.last_runs.get(index)
+            ).model_dump_json()
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from typing import NamedTuple, Optional, Tuple
+
+from app.models.user import User, UserRole
+from app.utilities.config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process locking only
+    fcntl = None
+
+_MAGIC = b"WRPC"
+_HEADER = struct.Struct("<4sII4x")  # magic, layout version, slot count
+_SLOT = struct.Struct("<QqBBHI")  # seq, user id, role, is_active, shard, token_version
+_SEQ = struct.Struct("<Q")
+_LAYOUT_VERSION = 2
+_ROLES = list(UserRole)
+
+
+class Principal(NamedTuple):
+    id: int
+    role: UserRole
+    is_active: bool
+    token_version: int
+    shard: int
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(user.id, user.role, user.is_active, user.token_version, user.shard)
+
+
+class PrincipalCache:
+    """
+    Fixed-size principal records in an mmap-backed file shared by all workers.
+
+    Slots are direct-mapped by user id. Each slot is guarded by a seqlock:
+    writers (serialized by an exclusive file lock) make the sequence odd,
+    write the record and make it even again; readers never lock and retry
+    until they observe the same even sequence before and after the read.
+    """
+
+    def __init__(self, path: str, slots: int, read_retries: int = 64):
+        self.path = path
+        self.slots = slots
+        self.read_retries = read_retries
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        size = _HEADER.size + slots * _SLOT.size
+        with self._write_lock():
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            header = os.read(self._fd, _HEADER.size)
+            expected = _HEADER.pack(_MAGIC, _LAYOUT_VERSION, slots)
+            if header != expected or os.fstat(self._fd).st_size != size:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, expected)
+
+        self._mm = mmap.mmap(self._fd, size)
+
+    @contextmanager
+    def _write_lock(self):
+        with self._thread_lock:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, user_id: int) -> int:
+        return _HEADER.size + (user_id % self.slots) * _SLOT.size
+
+    def _write(
+        self,
+        offset: int,
+        user_id: int,
+        role: int,
+        is_active: int,
+        shard: int,
+        version: int,
+    ) -> None:
+        (seq,) = _SEQ.unpack_from(self._mm, offset)
+        _SEQ.pack_into(self._mm, offset, seq + 1)
+        _SLOT.pack_into(
+            self._mm, offset, seq + 1, user_id, role, is_active, shard, version
+        )
+        _SEQ.pack_into(self._mm, offset, seq + 2)
+
+    def lookup(self, user_id: int) -> Tuple[int, Optional[Principal]]:
+        """
+        Read a slot without locking.
+
+        Returns:
+            tuple: The slot sequence observed (-1 if the slot stayed busy) and
+            the principal, or None on a miss.
+        """
+        offset = self._offset(user_id)
+        for _ in range(self.read_retries):
+            seq, slot_id, role, is_active, shard, version = _SLOT.unpack_from(
+                self._mm, offset
+            )
+            if seq & 1:
+                continue
+            (seq_after,) = _SEQ.unpack_from(self._mm, offset)
+            if seq_after != seq:
+                continue
+            if slot_id != user_id or seq == 0:
+                return seq, None
+            return seq, Principal(
+                slot_id, _ROLES[role], bool(is_active), version, shard
+            )
+
+        return -1, None
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        return self.lookup(user_id)[1]
+
+    def put(self, principal: Principal) -> None:
+        """
+        Publish a principal after a committed change to the user.
+        """
+        with self._write_lock():
+            self._put(principal)
+
+    def fill(self, principal: Principal, seen_seq: int) -> None:
+        """
+        Populate a slot after a miss, unless it was written since `seen_seq`.
+
+        This keeps a slow database read from overwriting a newer revocation
+        published by another worker.
+        """
+        offset = self._offset(principal.id)
+        with self._write_lock():
+            (seq,) = _SEQ.unpack_from(self._mm, offset)
+            if seq == seen_seq:
+                self._put(principal)
+
+    def _put(self, principal: Principal) -> None:
+        self._write(
+            self._offset(principal.id),
+            principal.id,
+            _ROLES.index(principal.role),
+            int(principal.is_active),
+            principal.shard,
+            principal.token_version,
+        )
+
+    def invalidate(self, user_id: int) -> None:
+        offset = self._offset(user_id)
+        with self._write_lock():
+            slot_id = _SLOT.unpack_from(self._mm, offset)[1]
+            if slot_id == user_id:
+                self._write(offset, 0, 0, 0, 0, 0)
+
+    def clear(self) -> None:
+        """
+        Drop every record. Only ever causes misses, so it is safe to call
+        from one worker while the others are serving requests.
+        """
+        with self._write_lock():
+            for slot in range(self.slots):
+                offset = _HEADER.size + slot * _SLOT.size
+                slot_id = _SLOT.unpack_from(self._mm, offset)[1]
+                if slot_id:
+                    self._write(offset, 0, 0, 0, 0, 0)
+
+
+os.makedirs(Config.DATABASE_DIR, exist_ok=True)
+principal_cache_path = f"{Config.DATABASE_DIR}/{Config.PRINCIPAL_CACHE_FILE}"
+principal_cache = PrincipalCache(principal_cache_path, Config.PRINCIPAL_CACHE_SLOTS)
@@ -0,0 +1,124 @@
+import html
+import threading
+from datetime import date
+from typing import Any, Iterable
+
+import markdown
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
+
+from app.models.task import TaskStatus
+from app.schemas.report import ReportSummary
+from app.utilities.cache import MemoryCache
+from app.utilities.config import Config
+
+fragment_cache = MemoryCache(
+    Config.RENDER_CACHE_MAX_BYTES, Config.RENDER_CACHE_MAX_ENTRIES
+)
+
+_local = threading.local()
+
+_safe_schemes = ("http:", "https:", "mailto:")
+
+
+class _SafeLinks(Treeprocessor):
+    """
+    Drop link and image URLs with a scheme other than http(s) or mailto,
+    e.g. `javascript:`.
+    """
+
+    def run(self, root):
+        for element in root.iter():
+            for attribute in ("href", "src"):
+                url = element.get(attribute)
+                if url is None:
+                    continue
+                scheme, colon, _ = url.strip().partition(":")
+                if (
+                    colon
+                    and "/" not in scheme
+                    and f"{scheme.lower()}:" not in _safe_schemes
+                ):
+                    element.set(attribute, "")
+
+
+class _SafeLinksExtension(Extension):
+    def extendMarkdown(self, md):  # noqa
+        md.treeprocessors.register(_SafeLinks(md), "safe_links", 0)
+
+
+def _to_html(text: str) -> str:
+    # Markdown instances are not thread-safe, so each threadpool worker keeps its own
+    converter = getattr(_local, "converter", None)
+    if converter is None:
+        converter = _local.converter = markdown.Markdown(
+            extensions=[_SafeLinksExtension()], output_format="html"
+        )
+    return converter.reset().convert(text)
+
+
+def _escape(text: str) -> str:
+    # Task text is user input: escape it so raw HTML is not passed through by Markdown
+    return html.escape(text, quote=False)
+
+
+def task_markdown(task: dict[str, Any]) -> str:
+    parts = [
+        f"### {_escape(task['title'])}",
+        f"*#{task['id']} · updated {task['updated_at']:%Y-%m-%d %H:%M} UTC*",
+    ]
+    if task["description"]:
+        parts.append(_escape(task["description"]))
+    if task["note"]:
+        parts.append(f"> **Note:** {_escape(task['note'])}")
+    return "\n\n".join(parts)
+
+
+def render_task(task: dict[str, Any]) -> str:
+    """
+    HTML fragment for one task, cached by `(id, updated_at)`: every mutation
+    bumps `updated_at`, so a changed task is simply rendered under a new key.
+    """
+    key = f"{task['id']}:{task['updated_at'].isoformat()}"
+
+    fragment = fragment_cache.get(key)
+    if fragment is None:
+        fragment = _to_html(task_markdown(task)).encode()
+        fragment_cache.set(key, fragment)
+
+    return fragment.decode()
+
+
+def render_report(
+    summary: ReportSummary, tasks: Iterable[dict[str, Any]], title: str, today: date
+) -> str:
+    """
+    HTML work report: the period's totals from the rollups, then every task
+    touched in the period grouped by status.
+    """
+    by_status: dict[TaskStatus, list[dict[str, Any]]] = {
+        status: [] for status in TaskStatus
+    }
+    for task in tasks:
+        by_status[task["status"]].append(task)
+
+    header = "\n\n".join(
+        [
+            f"# {_escape(title)}",
+            f"**{summary.from_date:%d %b %Y} – {summary.to_date:%d %b %Y}**",
+            f"- Tasks created: **{summary.created}**\n- Tasks closed: **{summary.closed}**",
+        ]
+    )
+    body = [_to_html(header)]
+    for status, status_tasks in by_status.items():
+        if status_tasks:
+            body.append(_to_html(f"## {status.value} ({len(status_tasks)})"))
+            body.extend(render_task(task) for task in status_tasks)
+    body.append(_to_html(f"*Generated {today:%d %b %Y}*"))
+
+    return (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{html.escape(title)}</title>\n</head>\n<body>\n"
+        + "\n".join(body)
+        + "\n</body>\n</html>\n"
+    )
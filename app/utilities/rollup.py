@@ -0,0 +1,195 @@
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable
+
+from sqlalchemy import Connection, delete
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, select
+
+from app.models.report import RollupBucket, TaskRollup, TaskTransitionRollup
+from app.models.task import TaskStatus
+from app.schemas.report import ReportPeriod, ReportSummary, StatusTransition
+
+rollup_tables = [TaskRollup.__table__, TaskTransitionRollup.__table__]  # noqa
+
+
+def period_start(day: date, bucket: RollupBucket) -> date:
+    if bucket == RollupBucket.WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _add(
+    connection: Connection, model: Any, rows: list[dict[str, Any]], columns: list[str]
+) -> None:
+    """
+    Insert rollup rows, adding `columns` onto rows that already exist.
+    """
+    if not rows:
+        return
+    statement = insert(model).values(rows)
+    keys = [column.name for column in model.__table__.primary_key]
+    connection.execute(
+        statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                name: getattr(model, name) + statement.excluded[name]
+                for name in columns
+            },
+        )
+    )
+
+
+def record_created(
+    db_session: Session, owner_id: int, count: int, at: datetime
+) -> None:
+    """
+    Count newly created tasks into the owner's day and week. Not committed.
+    """
+    _add(
+        db_session.connection(),
+        TaskRollup,
+        [
+            {
+                "owner_id": owner_id,
+                "bucket": bucket,
+                "period_start": period_start(at.date(), bucket),
+                "created": count,
+                "closed": 0,
+            }
+            for bucket in RollupBucket
+        ],
+        ["created"],
+    )
+
+
+def record_transitions(
+    db_session: Session,
+    owner_id: int,
+    transitions: Iterable[tuple[TaskStatus, TaskStatus]],
+    at: datetime,
+) -> None:
+    """
+    Count status transitions (and the closes among them) into the owner's
+    day and week. Not committed.
+    """
+    counts = Counter(transitions)
+    if not counts:
+        return
+
+    closed = sum(
+        count
+        for (_, to_status), count in counts.items()
+        if to_status == TaskStatus.CLOSED
+    )
+    connection = db_session.connection()
+
+    for bucket in RollupBucket:
+        start = period_start(at.date(), bucket)
+        _add(
+            connection,
+            TaskRollup,
+            [
+                {
+                    "owner_id": owner_id,
+                    "bucket": bucket,
+                    "period_start": start,
+                    "created": 0,
+                    "closed": closed,
+                }
+            ],
+            ["closed"],
+        )
+        _add(
+            connection,
+            TaskTransitionRollup,
+            [
+                {
+                    "owner_id": owner_id,
+                    "bucket": bucket,
+                    "period_start": start,
+                    "from_status": from_status,
+                    "to_status": to_status,
+                    "count": count,
+                }
+                for (from_status, to_status), count in counts.items()
+            ],
+            ["count"],
+        )
+
+
+def move_rollups(source: Connection, target: Connection, owner_id: int) -> None:
+    """
+    Merge an owner's rollups from one shard into another and drop them from the source.
+    """
+    for model, columns in (
+        (TaskRollup, ["created", "closed"]),
+        (TaskTransitionRollup, ["count"]),
+    ):
+        rows = [
+            dict(row)
+            for row in source.execute(
+                select(model.__table__).where(model.owner_id == owner_id)
+            ).mappings()
+        ]
+        _add(target, model, rows, columns)
+        source.execute(delete(model).where(model.owner_id == owner_id))
+
+
+def read_report_summary(
+    db_session: Session,
+    owner_id: int,
+    bucket: RollupBucket,
+    from_date: date,
+    to_date: date,
+) -> ReportSummary:
+    """
+    An owner's rollups for the periods starting between `from_date` (snapped
+    to its period) and `to_date`, in order. Periods without activity are omitted.
+    """
+    from_date = period_start(from_date, bucket)
+    connection = db_session.connection()
+
+    def in_range(model: Any) -> list:
+        return [
+            model.owner_id == owner_id,
+            model.bucket == bucket,
+            model.period_start >= from_date,
+            model.period_start <= to_date,
+        ]
+
+    transitions: dict[date, list[StatusTransition]] = {}
+    for start, from_status, to_status, count in connection.execute(
+        select(
+            TaskTransitionRollup.period_start,
+            TaskTransitionRollup.from_status,
+            TaskTransitionRollup.to_status,
+            TaskTransitionRollup.count,
+        ).where(*in_range(TaskTransitionRollup))
+    ):
+        transitions.setdefault(start, []).append(
+            StatusTransition(from_status=from_status, to_status=to_status, count=count)
+        )
+
+    periods = [
+        ReportPeriod(
+            period_start=start,
+            created=created,
+            closed=closed,
+            transitions=transitions.get(start, []),
+        )
+        for start, created, closed in connection.execute(
+            select(TaskRollup.period_start, TaskRollup.created, TaskRollup.closed)
+            .where(*in_range(TaskRollup))
+            .order_by(TaskRollup.period_start)
+        )
+    ]
+
+    return ReportSummary(
+        bucket=bucket,
+        from_date=from_date,
+        to_date=to_date,
+        created=sum(period.created for period in periods),
+        closed=sum(period.closed for period in periods),
+        periods=periods,
+    )
@@ -1,17 +1,19 @@
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import bcrypt
 import jwt
 from fastapi import Depends, HTTPException, Header
 from fastapi.security import HTTPBearer
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from app.models.user import User, UserRole
 from app.utilities.config import Config
-from app.utilities.database import get_db_session
+from app.utilities.database import get_read_db_session
 from app.utilities.helper import get_utc_now
 from app.utilities.logger import get_logger
+from app.utilities.principal_cache import Principal, principal_cache
+from app.utilities.statements import user_by_id
 
 logger = get_logger(__name__)
 security = HTTPBearer()
@@ -48,19 +50,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
-def create_token(user_id: str, expires_delta: timedelta) -> str:
+def create_token(user_id: str, expires_delta: timedelta, token_version: int = 0) -> str:
     """
     Create a JWT token with a specific expiration.
 
     Args:
         user_id (str): User identifier to include in token.
         expires_delta (timedelta): Token expiration duration.
+        token_version (int, optional): User's token version; bumping it revokes the token.
 
     Returns:
         str: Encoded JWT token.
     """
     expire = get_utc_now() + expires_delta
-    to_encode: Dict[str, Any] = {"sub": user_id, "exp": expire}
+    to_encode: Dict[str, Any] = {"sub": user_id, "exp": expire, "ver": token_version}
     token = jwt.encode(to_encode, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
     return token
 
@@ -99,22 +102,48 @@ def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=detail)
 
 
-def get_current_user(
-    x_api_token: str = Header(...), db: Session = Depends(get_db_session)
-) -> User:
+def load_principal(user_id: int, db: Session) -> Optional[Principal]:
+    """
+    Load a principal from the database and publish it to the shared cache.
+    """
+    seen_seq, principal = principal_cache.lookup(user_id)
+    if principal is not None:
+        return principal
+
+    row = db.exec(
+        select(
+            User.id, User.role, User.is_active, User.token_version, User.shard
+        ).where(User.id == user_id)
+    ).first()
+
+    if not row:
+        return None
+
+    principal = Principal(*row)
+    principal_cache.fill(principal, seen_seq)
+    return principal
+
+
+def get_current_principal(
+    x_api_token: str = Header(...), db: Session = Depends(get_read_db_session)
+) -> Principal:
     """
-    Authenticate and return the current user based on the provided JWT token.
+    Authenticate the request and return the caller's principal record.
+
+    The record is served from the cross-worker principal cache, so revocations
+    and role changes are seen by every worker without a database query.
 
     Args:
         x_api_token (str): The access token provided in the request header.
-        db (Session): Database session dependency.
+        db (Session): Database session dependency, used only on a cache miss.
 
     Returns:
-        User: The authenticated user retrieved from the database.
+        Principal: The authenticated principal.
 
     Raises:
         HTTPException:
-            - 401 if the token is missing, invalid, expired, or user does not exist.
+            - 401 if the token is missing, invalid, expired or revoked,
+              or the user does not exist or is inactive.
             - 500 if an unexpected error occurs during authentication.
     """
     try:
@@ -131,7 +160,54 @@ def get_current_user(
             logger.error(detail)
             raise HTTPException(status_code=401, detail=detail)
 
-        user = db.get(User, user_id)
+        principal = load_principal(int(user_id), db)
+
+        if not principal:
+            detail = "User not found"
+            logger.error(detail)
+            raise HTTPException(status_code=401, detail=detail)
+
+        if not principal.is_active:
+            detail = "User is inactive"
+            logger.error(detail)
+            raise HTTPException(status_code=401, detail=detail)
+
+        if payload.get("ver", 0) != principal.token_version:
+            detail = "Access token revoked"
+            logger.error(detail)
+            raise HTTPException(status_code=401, detail=detail)
+
+        return principal
+
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error during user authentication")
+        raise HTTPException(status_code=500, detail="Failed to authenticate user")
+
+
+def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_read_db_session),
+) -> User:
+    """
+    Return the full user row of the authenticated principal.
+
+    Args:
+        principal (Principal): The authenticated principal.
+        db (Session): Database session dependency.
+
+    Returns:
+        User: The authenticated user retrieved from the database.
+
+    Raises:
+        HTTPException:
+            - 401 if the user does not exist.
+            - 500 if an unexpected error occurs during authentication.
+    """
+    try:
+        # hashed_password is only loaded when accessed (password change)
+        user = db.exec(user_by_id(principal.id)).scalars().first()
 
         if not user:
             detail = "User not found"
@@ -147,12 +223,12 @@ def get_current_user(
         raise HTTPException(status_code=500, detail="Failed to authenticate user")
 
 
-def has_admin_role(user: User = Depends(get_current_user)) -> bool:
+def has_admin_role(user: Principal = Depends(get_current_principal)) -> bool:
     """
     Verify that the authenticated user has admin privileges.
 
     Args:
-        user (User): The authenticated user obtained from `get_current_user`.
+        user (Principal): The authenticated principal obtained from `get_current_principal`.
 
     Returns:
         bool: True if the user has admin role.
@@ -0,0 +1,110 @@
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable, Sequence
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from app.schemas.task import ReadTask
+from app.schemas.user import ReadUser
+
+task_list_adapter = TypeAdapter(list[ReadTask])
+user_list_adapter = TypeAdapter(list[ReadUser])
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded by pydantic-core instead of the stdlib `json` module.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def read_task(task: Any) -> ReadTask:
+    """
+    Convert a task ORM row into its response schema.
+    """
+    return ReadTask.model_validate(task, from_attributes=True)
+
+
+def read_user(user: Any) -> ReadUser:
+    """
+    Convert a user ORM row into its response schema.
+    """
+    return ReadUser.model_validate(user, from_attributes=True)
+
+
+def dump_tasks(tasks: Iterable[Any]) -> bytes:
+    """
+    Serialize task ORM rows to `list[ReadTask]` JSON bytes in a single pass.
+    """
+    return task_list_adapter.dump_json(
+        task_list_adapter.validate_python(tasks, from_attributes=True)
+    )
+
+
+def dump_users(users: Iterable[Any]) -> bytes:
+    """
+    Serialize user ORM rows to `list[ReadUser]` JSON bytes in a single pass.
+    """
+    return user_list_adapter.dump_json(
+        user_list_adapter.validate_python(users, from_attributes=True)
+    )
+
+
+def dump_rows(rows: Iterable[Any]) -> bytes:
+    """
+    Serialize plain row dicts (see `app.utilities.fast_read`) to JSON bytes.
+    """
+    return to_json(list(rows))
+
+
+def dump_task_batch(tasks: list[dict[str, Any]], missing: list[int]) -> bytes:
+    """
+    Serialize a `ReadTaskBatch` built from plain task row dicts.
+    """
+    return to_json({"tasks": tasks, "missing": missing})
+
+
+def dump_task_changes(
+    tasks: list[dict[str, Any]], deleted: list[int], next_token: str, has_more: bool
+) -> bytes:
+    """
+    Serialize a `TaskChanges` page built from plain task row dicts.
+    """
+    return to_json(
+        {
+            "tasks": tasks,
+            "deleted": deleted,
+            "next_token": next_token,
+            "has_more": has_more,
+        }
+    )
+
+
+def encode_ndjson(fields: Sequence[str], rows: Iterable[Sequence[Any]]) -> bytes:
+    """
+    Encode rows as newline-delimited JSON objects keyed by `fields`.
+    """
+    return b"".join(to_json(dict(zip(fields, row))) + b"\n" for row in rows)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_csv(rows: Iterable[Sequence[Any]]) -> bytes:
+    """
+    Encode rows as CSV lines, with enums as their values and ISO timestamps.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
@@ -0,0 +1,423 @@
+import argparse
+import bisect
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional, TypeVar
+
+from fastapi import Depends
+from sqlalchemy import Connection, Engine, delete, func, insert, update
+from sqlmodel import Session, SQLModel, select
+
+from app.models.task import Task, TaskArchive, TaskCounter, TaskEvent, TaskIdSequence
+from app.models.user import User
+from app.utilities.config import Config
+from app.utilities.database import (
+    add_missing_columns,
+    convert_epoch_columns,
+    create_read_engine,
+    create_write_engine,
+    database_path,
+    drop_undeclared_indexes,
+    init_table,
+    read_engine,
+    write_engine,
+)
+from app.utilities.history import install_history, move_task_events
+from app.utilities.logger import get_logger
+from app.utilities.principal_cache import Principal, principal_cache
+from app.utilities.rollup import move_rollups, rollup_tables
+from app.utilities.security import get_current_principal
+from app.utilities.task_stats import install_counters
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Tables that live in every shard file; users stay in the primary database
+shard_tables = [
+    Task.__table__,  # noqa
+    TaskArchive.__table__,  # noqa
+    TaskIdSequence.__table__,  # noqa
+    TaskCounter.__table__,  # noqa
+    TaskEvent.__table__,  # noqa
+    *rollup_tables,
+]
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ShardRouter:
+    """
+    Consistent-hash ring mapping owners to shards.
+
+    Each shard owns `vnodes` points on the ring, so growing from N to N+1
+    shards only reassigns roughly 1/(N+1) of the owners.
+    """
+
+    def __init__(self, shards: int, vnodes: int = 64):
+        self.shards = shards
+        ring = sorted(
+            (_hash(f"shard-{shard}-{vnode}"), shard)
+            for shard in range(shards)
+            for vnode in range(vnodes)
+        )
+        self._points = [point for point, _ in ring]
+        self._owners = [shard for _, shard in ring]
+
+    def shard_for(self, owner_id: int) -> int:
+        if self.shards == 1:
+            return 0
+        index = bisect.bisect(self._points, _hash(str(owner_id))) % len(self._points)
+        return self._owners[index]
+
+
+class Shard(NamedTuple):
+    index: int
+    path: str
+    read_engine: Engine
+    write_engine: Engine
+
+
+def shard_path(index: int) -> str:
+    """
+    Shard 0 is the primary database; shard N lives next to it as `<name>.shardN.db`.
+    """
+    if index == 0:
+        return database_path
+    stem, suffix = os.path.splitext(database_path)
+    return f"{stem}.shard{index}{suffix}"
+
+
+_shards: dict[int, Shard] = {}
+_shards_lock = threading.Lock()
+
+
+def get_shard(index: int) -> Shard:
+    with _shards_lock:
+        shard = _shards.get(index)
+        if shard is None:
+            if index == 0:
+                shard = Shard(0, database_path, read_engine, write_engine)
+            else:
+                path = shard_path(index)
+                shard = Shard(
+                    index,
+                    path,
+                    create_read_engine(
+                        f"sqlite:///file:{path}?mode=ro&uri=true", home=database_path
+                    ),
+                    create_write_engine(
+                        f"sqlite:///file:{path}?uri=true", home=database_path
+                    ),
+                )
+            _shards[index] = shard
+        return shard
+
+
+shard_router = ShardRouter(Config.DATABASE_SHARDS)
+
+
+def shard_indexes() -> range:
+    """
+    Every shard that may hold rows: the configured ones plus any a user
+    is still assigned to after the shard count was lowered.
+    """
+    with read_engine.connect() as connection:
+        highest = connection.execute(select(func.max(User.shard))).scalar()
+    return range(max(Config.DATABASE_SHARDS, (highest or 0) + 1))
+
+
+def scatter_gather(
+    fn: Callable[[Shard], T], indexes: Optional[range] = None
+) -> list[T]:
+    """
+    Run `fn` against every shard in parallel and return the results in shard order.
+    """
+    shards = [get_shard(index) for index in indexes or shard_indexes()]
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        return list(pool.map(fn, shards))
+
+
+def create_shard_tables(shard: Shard) -> None:
+    SQLModel.metadata.create_all(shard.write_engine, tables=shard_tables)
+    add_missing_columns(shard.write_engine, shard_tables)
+    drop_undeclared_indexes(shard.write_engine, shard_tables)
+    convert_epoch_columns(shard.write_engine, shard_tables)
+    install_counters(shard.write_engine)
+    install_history(shard.write_engine)
+
+
+def check_id_stride(shards: int) -> None:
+    """
+    Task ids are `value * SHARD_ID_STRIDE + shard`, so ids from different
+    shards only stay distinct while every shard index is below the stride.
+
+    Raises:
+        ValueError: If `shards` shards would not fit in the stride.
+    """
+    if shards > Config.SHARD_ID_STRIDE:
+        raise ValueError(
+            f"SHARD_ID_STRIDE ({Config.SHARD_ID_STRIDE}) must be at least "
+            f"the number of shards ({shards}), or task ids collide across shards"
+        )
+
+
+def init_shards():
+    """
+    Create the task tables and triggers in every shard file and
+    seed the id sequences above the highest task id in any shard.
+    """
+    indexes = shard_indexes()
+    check_id_stride(len(indexes))
+    install_counters(write_engine)
+    install_history(write_engine)
+    for index in indexes[1:]:
+        create_shard_tables(get_shard(index))
+
+    if Config.DATABASE_SHARDS == 1:
+        return
+
+    def max_task_id(shard: Shard) -> int:
+        with shard.read_engine.connect() as connection:
+            return connection.execute(select(func.max(Task.id))).scalar() or 0
+
+    floor = max(scatter_gather(max_task_id, indexes)) // Config.SHARD_ID_STRIDE + 1
+    for index in indexes:
+        with get_shard(index).write_engine.begin() as connection:
+            value = connection.execute(
+                select(TaskIdSequence.value).where(TaskIdSequence.id == 1)
+            ).scalar()
+            if value is None:
+                connection.execute(insert(TaskIdSequence).values(id=1, value=floor))
+            elif value < floor:
+                connection.execute(
+                    update(TaskIdSequence)
+                    .where(TaskIdSequence.id == 1)
+                    .values(value=floor)
+                )
+
+
+def allocate_task_id(db_session: Session, shard: int) -> Optional[int]:
+    """
+    Next task id for a shard, unique across all shards (`value * stride + shard`).
+
+    Returns None for shard 0 when it is the only configured shard, leaving
+    the id to SQLite.
+    """
+    ids = allocate_task_ids(db_session, shard, 1)
+    return ids[0] if ids else None
+
+
+def allocate_task_ids(
+    db_session: Session, shard: int, count: int
+) -> Optional[list[int]]:
+    """
+    Reserve `count` consecutive sequence values for a shard in one statement.
+
+    Returns None for shard 0 when it is the only configured shard, leaving
+    the ids to SQLite. A leftover shard still reachable after scaling down
+    keeps getting strided ids, as its rowids could collide with shard 0's.
+    """
+    if shard == 0 and Config.DATABASE_SHARDS == 1:
+        return None
+
+    value = (
+        db_session.connection()
+        .execute(
+            update(TaskIdSequence)
+            .where(TaskIdSequence.id == 1)
+            .values(value=TaskIdSequence.value + count)
+            .returning(TaskIdSequence.value)
+        )
+        .scalar_one()
+    )
+    return [
+        (value - offset) * Config.SHARD_ID_STRIDE + shard
+        for offset in range(count - 1, -1, -1)
+    ]
+
+
+def get_task_read_session(user: Principal = Depends(get_current_principal)):
+    """
+    Read-only session on the shard holding the authenticated user's tasks.
+    """
+    with Session(get_shard(user.shard).read_engine) as session:
+        yield session
+
+
+def _assign(connection: Connection, owner_id: int, shard: int) -> None:
+    connection.execute(update(User).where(User.id == owner_id).values(shard=shard))
+
+
+def _publish(owner_id: int) -> None:
+    with Session(read_engine) as session:
+        user = session.get(User, owner_id)
+        if user is not None:
+            principal_cache.put(Principal.from_user(user))
+
+
+def move_owner(owner_id: int, source: int, target: int, reassign: bool = True) -> int:
+    """
+    Move all of an owner's tasks (archived ones too) from one shard to another
+    while the app runs.
+
+    The source shard's write lock is held for the whole move, so writes to
+    it queue behind the copy. Rows are committed on the target first, then
+    the owner is re-pointed and published to the principal cache, and only
+    then deleted from the source. A move interrupted at any step can simply
+    be run again; the exceptions are the report rollups and task history,
+    which are added onto the target's and so are duplicated if the move
+    stops between the two commits.
+
+    Returns:
+        int: Number of tasks moved.
+    """
+    table = Task.__table__  # noqa
+    archive = TaskArchive.__table__  # noqa
+    published = False
+
+    with get_shard(source).write_engine.begin() as connection:
+        rows = [
+            dict(row)
+            for row in connection.execute(
+                select(table).where(table.c.owner_id == owner_id)
+            ).mappings()
+        ]
+
+        with get_shard(target).write_engine.begin() as target_connection:
+            if rows:
+                clash = target_connection.execute(
+                    select(table.c.id).where(
+                        table.c.id.in_([row["id"] for row in rows]),
+                        table.c.owner_id != owner_id,
+                    )
+                ).first()
+                if clash:
+                    raise RuntimeError(
+                        f"Task id {clash[0]} already exists in shard {target}"
+                    )
+                target_connection.execute(insert(table).prefix_with("OR IGNORE"), rows)
+
+            archived = [
+                dict(row)
+                for row in connection.execute(
+                    select(archive).where(archive.c.owner_id == owner_id)
+                ).mappings()
+            ]
+            if archived:
+                target_connection.execute(
+                    insert(archive).prefix_with("OR IGNORE"), archived
+                )
+
+            move_rollups(connection, target_connection, owner_id)
+            move_task_events(connection, target_connection, owner_id)
+
+        if reassign:
+            if source == 0:
+                # Shard 0 is the primary; its single writer connection is ours
+                _assign(connection, owner_id, target)
+            else:
+                with write_engine.begin() as primary:
+                    _assign(primary, owner_id, target)
+                _publish(owner_id)
+                published = True
+
+        connection.execute(delete(table).where(table.c.owner_id == owner_id))
+        connection.execute(delete(archive).where(archive.c.owner_id == owner_id))
+
+    if reassign and not published:
+        _publish(owner_id)
+
+    logger.info(
+        f"Moved {len(rows)} tasks of user {owner_id} from shard {source} to {target}"
+    )
+    return len(rows)
+
+
+def rebalance(router: ShardRouter = shard_router) -> int:
+    """
+    Move every user whose shard differs from the router's choice, then
+    sweep rows written to a user's old shard while it was being moved.
+
+    Returns:
+        int: Number of users moved.
+    """
+    with read_engine.connect() as connection:
+        assigned = dict(connection.execute(select(User.id, User.shard)).all())
+
+    moved = 0
+    for user_id, current in assigned.items():
+        target = router.shard_for(user_id)
+        if target != current:
+            move_owner(user_id, current, target)
+            assigned[user_id] = target
+            moved += 1
+
+    sweep_strays(assigned)
+    return moved
+
+
+def sweep_strays(assigned: dict[int, int], owner_id: Optional[int] = None) -> int:
+    """
+    Move rows left on a shard other than their owner's shard in `assigned`
+    to the owner's shard. Requests authenticated with a principal cached
+    before a move can still write to the old shard. Owners missing from
+    `assigned` belong on shard 0. With `owner_id`, only that owner is swept.
+
+    Returns:
+        int: Number of tasks moved.
+    """
+    swept = 0
+    for index in shard_indexes():
+        tasks = select(Task.owner_id)
+        events = select(TaskEvent.owner_id)
+        if owner_id is not None:
+            tasks = tasks.where(Task.owner_id == owner_id)
+            events = events.where(TaskEvent.owner_id == owner_id)
+        with get_shard(index).read_engine.connect() as connection:
+            owners = connection.execute(tasks.union(events)).scalars().all()
+
+        for owner in owners:
+            target = assigned.get(owner, 0)
+            if target != index:
+                swept += move_owner(owner, index, target, reassign=False)
+
+    return swept
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Move users' tasks between shards online."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "rebalance", help="Move every user to the shard chosen by DATABASE_SHARDS"
+    )
+    move = commands.add_parser("move", help="Move a single user to a given shard")
+    move.add_argument("--user", type=int, required=True)
+    move.add_argument("--to", type=int, required=True)
+    args = parser.parse_args()
+
+    init_table()
+    init_shards()
+
+    if args.command == "rebalance":
+        print(f"Moved {rebalance()} users")
+    else:
+        with read_engine.connect() as connection:
+            current = connection.execute(
+                select(User.shard).where(User.id == args.user)
+            ).scalar_one()
+        if args.to:
+            create_shard_tables(get_shard(args.to))
+        moved = move_owner(args.user, current, args.to)
+        moved += sweep_strays({args.user: args.to}, args.user)
+        print(f"Moved {moved} tasks")
+
+
+if __name__ == "__main__":
+    main()
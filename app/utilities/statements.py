@@ -0,0 +1,43 @@
+from sqlalchemy import StatementLambdaElement, lambda_stmt
+from sqlalchemy.orm import defer
+from sqlmodel import select
+
+from app.models.task import Task
+from app.models.user import User
+
+# Hot-path queries as lambda statements: the expression tree and its cache key
+# are built once per call site, then every call only binds its parameters.
+# Results are rows, not scalars; use `.scalars()` to get the ORM objects.
+
+
+def active_task(owner_id: int, task_id: int) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(Task).where(
+            Task.owner_id == owner_id,
+            Task.id == task_id,
+            Task.is_active == True,  # noqa
+        )
+    )
+
+
+def active_tasks(owner_id: int) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(Task)
+        .where(Task.owner_id == owner_id, Task.is_active == True)  # noqa
+        .order_by(Task.id)
+    )
+
+
+def user_by_email(email_id: str) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(User).where(User.email_id == email_id))
+
+
+def user_by_id(user_id: int) -> StatementLambdaElement:
+    """
+    The user row without `hashed_password`, which is only loaded when accessed.
+    """
+    return lambda_stmt(
+        lambda: select(User)
+        .where(User.id == user_id)
+        .options(defer(User.hashed_password))
+    )
@@ -0,0 +1,116 @@
+import argparse
+
+from sqlalchemy import Connection, Engine, delete, func, insert, text
+from sqlmodel import Session, select
+
+from app.models.task import Task, TaskCounter, TaskStatus
+from app.schemas.task import TaskStats
+from app.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+_bump = (
+    "INSERT INTO task_counters (owner_id, status, is_active, count) "
+    "VALUES ({row}.owner_id, {row}.status, {row}.is_active, {delta}) "
+    "ON CONFLICT (owner_id, status, is_active) DO UPDATE SET count = count + {delta};"
+)
+
+# Every write path (ORM, executemany imports, bulk updates, shard moves) goes through these
+counter_triggers = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_count_insert AFTER INSERT ON tasks
+    BEGIN {_bump.format(row="NEW", delta=1)} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_count_delete AFTER DELETE ON tasks
+    BEGIN {_bump.format(row="OLD", delta=-1)} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_count_update
+    AFTER UPDATE OF owner_id, status, is_active ON tasks
+    WHEN OLD.owner_id IS NOT NEW.owner_id
+      OR OLD.status IS NOT NEW.status
+      OR OLD.is_active IS NOT NEW.is_active
+    BEGIN
+        {_bump.format(row="OLD", delta=-1)}
+        {_bump.format(row="NEW", delta=1)}
+    END
+    """,
+]
+
+
+def rebuild_counters(connection: Connection) -> int:
+    """
+    Recompute every counter from the tasks table.
+
+    Returns:
+        int: Number of counter rows written.
+    """
+    connection.execute(delete(TaskCounter))
+    result = connection.execute(
+        insert(TaskCounter).from_select(
+            ["owner_id", "status", "is_active", "count"],
+            select(Task.owner_id, Task.status, Task.is_active, func.count()).group_by(
+                Task.owner_id, Task.status, Task.is_active
+            ),
+        )
+    )
+    return result.rowcount
+
+
+def install_counters(engine: Engine) -> None:
+    """
+    Create the counter triggers, seeding the counters for existing tasks
+    the first time they are installed.
+    """
+    with engine.begin() as connection:
+        for trigger in counter_triggers:
+            connection.execute(text(trigger))
+
+        seeded = connection.execute(select(TaskCounter.owner_id).limit(1)).first()
+        if seeded is None and connection.execute(select(Task.id).limit(1)).first():
+            logger.info(f"Seeded {rebuild_counters(connection)} task counters")
+
+
+def read_task_stats(db_session: Session, owner_id: int) -> TaskStats:
+    """
+    An owner's task counts, from at most one counter row per status and activity.
+    """
+    rows = db_session.connection().execute(
+        select(TaskCounter.status, TaskCounter.is_active, TaskCounter.count).where(
+            TaskCounter.owner_id == owner_id
+        )
+    )
+
+    statuses = dict.fromkeys(TaskStatus, 0)
+    deleted = 0
+    for status, is_active, count in rows:
+        if is_active:
+            statuses[status] += count
+        else:
+            deleted += count
+
+    return TaskStats(total=sum(statuses.values()), deleted=deleted, statuses=statuses)
+
+
+def main():
+    from app.utilities.database import init_table
+    from app.utilities.shard import get_shard, init_shards, shard_indexes
+
+    parser = argparse.ArgumentParser(
+        description="Maintain the per-owner task counters."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("repair", help="Rebuild every shard's counters from its tasks")
+    parser.parse_args()
+
+    init_table()
+    init_shards()
+
+    for index in shard_indexes():
+        with get_shard(index).write_engine.begin() as connection:
+            print(f"Shard {index}: rebuilt {rebuild_counters(connection)} counters")
+
+
+if __name__ == "__main__":
+    main()
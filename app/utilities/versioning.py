@@ -0,0 +1,183 @@
+from typing import Any, Optional, Sequence
+
+from fastapi import Header, HTTPException, Response
+from sqlalchemy import ColumnElement, Row, update
+from sqlmodel import Session, select
+
+from app.schemas.bulk import BulkOutcome, BulkResult
+from app.utilities.config import Config
+from app.utilities.helper import get_utc_now
+
+
+def get_if_match(if_match: Optional[str] = Header(default=None)) -> Optional[int]:
+    """
+    Expected row version from an `If-Match: "<version>"` header.
+
+    Returns:
+        int | None: The version, or None when the header is absent or `*`.
+
+    Raises:
+        HTTPException: 400 if the header is not a version ETag.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    tag = if_match.strip().removeprefix("W/").strip('"')
+    try:
+        return int(tag)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid If-Match header")
+
+
+def set_etag(response: Response, version: int) -> None:
+    response.headers["ETag"] = f'"{version}"'
+
+
+def conditional_update(
+    db_session: Session,
+    model: Any,
+    criteria: Sequence[ColumnElement[bool]],
+    values: dict[str, Any],
+    expected_version: Optional[int] = None,
+    guards: Sequence[tuple[ColumnElement[bool], HTTPException]] = (),
+    not_found: str = "Not found",
+) -> Any:
+    """
+    Apply `values` to the row matching `criteria` with a single
+    `UPDATE ... RETURNING`, bumping its version and `updated_at`.
+
+    Args:
+        db_session (Session): Session to run the statement in. Not committed.
+        model: Versioned table model (`Task` or `User`).
+        criteria (Sequence): Conditions identifying the row.
+        values (dict): Column values to set.
+        expected_version (int, optional): Only update this version of the row.
+        guards (Sequence, optional): Extra conditions, each with the error to
+            raise when it is the reason the row was not updated.
+        not_found (str, optional): Detail of the 404 raised when nothing
+            matches `criteria`.
+
+    Returns:
+        The updated ORM row.
+
+    Raises:
+        HTTPException: 404 if no row matches `criteria`, 412 if the row's
+        version differs from `expected_version`, or a failing guard's error.
+    """
+    statement = (
+        update(model)
+        .where(*criteria, *(condition for condition, _ in guards))
+        .values(**values, version=model.version + 1, updated_at=get_utc_now())
+        .returning(model)
+    )
+    if expected_version is not None:
+        statement = statement.where(model.version == expected_version)
+
+    row = db_session.exec(statement).scalars().one_or_none()  # noqa
+    if row is not None:
+        return row
+
+    # Nothing updated: find out why, without affecting the success path
+    current = (
+        db_session.connection()
+        .execute(
+            select(model.version, *(condition for condition, _ in guards)).where(
+                *criteria
+            )
+        )
+        .first()
+    )
+
+    if current is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    if expected_version is not None and current[0] != expected_version:
+        raise HTTPException(
+            status_code=412, detail=f"Version mismatch, current version is {current[0]}"
+        )
+    for passed, (_, error) in zip(current[1:], guards):
+        if not passed:
+            raise error
+
+    raise HTTPException(status_code=409, detail="Concurrent update, please retry")
+
+
+def selected_ids(ids: Optional[list[int]], has_filter: bool) -> Optional[list[int]]:
+    """
+    Validate a bulk selection: explicit ids (de-duplicated, in order) or a filter.
+
+    Raises:
+        HTTPException: 400 if neither or both are given, or too many ids.
+    """
+    if (ids is None) == (not has_filter):
+        raise HTTPException(status_code=400, detail="Provide either ids or a filter")
+    if ids is None:
+        return None
+    if len(ids) > Config.BULK_MAX_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {Config.BULK_MAX_IDS} ids per request"
+        )
+    return list(dict.fromkeys(ids))
+
+
+def bulk_update(
+    db_session: Session,
+    model: Any,
+    scope: Sequence[ColumnElement[bool]],
+    criteria: Sequence[ColumnElement[bool]],
+    values: dict[str, Any],
+    ids: Optional[list[int]] = None,
+    returning: Sequence[Any] = (),
+) -> tuple[list[Row], BulkResult]:
+    """
+    Apply `values` to many rows with a single `UPDATE ... RETURNING`,
+    bumping each row's version and `updated_at`.
+
+    Args:
+        db_session (Session): Session to run the statements in. Not committed.
+        model: Versioned table model (`Task` or `User`).
+        scope (Sequence): Conditions for a row to be visible at all, e.g. its owner.
+        criteria (Sequence): Conditions for a visible row to need the change;
+            rows failing them are reported as "unchanged".
+        values (dict): Column values to set.
+        ids (list[int], optional): Explicit row ids; ids outside `scope` are
+            reported as "not_found". Without ids only updated rows are reported.
+        returning (Sequence, optional): Extra columns returned per updated row.
+
+    Returns:
+        tuple: The updated rows (id first) and the per-id outcomes.
+    """
+    statement = (
+        update(model)
+        .where(*scope, *criteria)
+        .values(**values, version=model.version + 1, updated_at=get_utc_now())
+        .returning(model.id, *returning)
+    )
+    if ids is not None:
+        statement = statement.where(model.id.in_(ids))
+
+    connection = db_session.connection()
+    rows = connection.execute(statement).all()
+    updated = {row[0] for row in rows}
+
+    if ids is None:
+        outcomes = [
+            BulkOutcome(id=row_id, outcome="updated") for row_id in sorted(updated)
+        ]
+        return rows, BulkResult(updated=len(rows), results=outcomes)
+
+    remaining = [row_id for row_id in ids if row_id not in updated]
+    visible = set()
+    if remaining:
+        visible = set(
+            connection.execute(
+                select(model.id).where(*scope, model.id.in_(remaining))
+            ).scalars()
+        )
+
+    def outcome(row_id: int) -> str:
+        if row_id in updated:
+            return "updated"
+        return "unchanged" if row_id in visible else "not_found"
+
+    outcomes = [BulkOutcome(id=row_id, outcome=outcome(row_id)) for row_id in ids]
+    return rows, BulkResult(updated=len(rows), results=outcomes)
@@ -0,0 +1,173 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app.utilities.config import Config
+from app.utilities.logger import get_logger
+from app.utilities.shard import get_shard
+
+logger = get_logger(__name__)
+
+
+class _Write:
+    __slots__ = ("op", "render", "future")
+
+    def __init__(self, op: Callable[[Session], Any], render: Callable[[Any], Any]):
+        self.op = op
+        self.render = render
+        self.future: Future = Future()
+
+
+class WriteCoordinator:
+    """
+    Group-commit concurrent writes into a single transaction.
+
+    Writes queued within `window_ms` of the first one (up to `max_ops`) are
+    applied by a single writer thread, each inside its own SAVEPOINT, and
+    committed together. Every caller still receives its own result or
+    exception; a failing write only rolls back its own savepoint.
+    """
+
+    def __init__(self, engine: Engine, window_ms: float, max_ops: int):
+        self.engine = engine
+        self.window = window_ms / 1000
+        self.max_ops = max_ops
+        self._queue: "queue.Queue[Optional[_Write]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._last_commit = 0.0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="write-coordinator", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def submit(
+        self,
+        op: Callable[[Session], Any],
+        render: Callable[[Any], Any] = lambda value: value,
+    ) -> Future:
+        """
+        Queue a write.
+
+        Args:
+            op (Callable): Applies the write to the batch session and returns
+                its ORM result. Must not commit.
+            render (Callable, optional): Converts the result after the batch
+                commits, e.g. into a response schema. ORM objects must not
+                leave the writer thread.
+
+        Returns:
+            Future: Resolves to the rendered result or the write's exception.
+        """
+        self.start()
+        write = _Write(op, render)
+        self._queue.put(write)
+        return write.future
+
+    def idle_s(self) -> float:
+        """
+        Seconds since the last batch was committed, or 0 while writes are queued.
+        """
+        if not self._queue.empty():
+            return 0.0
+        return time.monotonic() - self._last_commit
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            deadline = time.monotonic() + self.window
+            stopping = False
+            while len(batch) < self.max_ops:
+                timeout = deadline - time.monotonic()
+                try:
+                    if timeout > 0:
+                        write = self._queue.get(timeout=timeout)
+                    else:
+                        write = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if write is None:
+                    stopping = True
+                    break
+                batch.append(write)
+
+            self._commit(batch)
+            self._last_commit = time.monotonic()
+            if stopping:
+                return
+
+    def _commit(self, batch: list[_Write]) -> None:
+        outcomes = []
+
+        try:
+            with Session(self.engine, expire_on_commit=False) as session:
+                for write in batch:
+                    try:
+                        with session.begin_nested():
+                            outcomes.append((write, write.op(session), None))
+                    except Exception as exc:
+                        outcomes.append((write, None, exc))
+
+                session.commit()
+
+                for write, value, error in outcomes:
+                    if error is not None:
+                        write.future.set_exception(error)
+                        continue
+                    try:
+                        write.future.set_result(write.render(value))
+                    except Exception as exc:
+                        write.future.set_exception(exc)
+
+        except Exception as exc:
+            logger.exception(f"Failed to commit write batch of {len(batch)}")
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(exc)
+
+
+_coordinators: dict[int, WriteCoordinator] = {}
+_coordinators_lock = threading.Lock()
+
+
+def coordinator_for(shard: int) -> WriteCoordinator:
+    """
+    The write coordinator for a shard's single writer connection.
+    """
+    with _coordinators_lock:
+        coordinator = _coordinators.get(shard)
+        if coordinator is None:
+            coordinator = WriteCoordinator(
+                get_shard(shard).write_engine,
+                Config.WRITE_BATCH_WINDOW_MS,
+                Config.WRITE_BATCH_MAX_OPS,
+            )
+            _coordinators[shard] = coordinator
+        return coordinator
+
+
+def stop_coordinators() -> None:
+    with _coordinators_lock:
+        coordinators = list(_coordinators.values())
+    for coordinator in coordinators:
+        coordinator.stop()
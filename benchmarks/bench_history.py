@@ -0,0 +1,150 @@
+"""
+Measure what task history costs on the write path: no history, the
+`task_events_record_update` trigger, and reading the old values first and
+appending the events afterwards in one batched executemany.
+
+Each setup is timed twice: concurrent requests through the group-committing
+write coordinator, and back-to-back updates in one transaction, which shows
+the per-update cost without the commit window around it.
+
+Usage:
+    uv run python -m benchmarks.bench_history [writes] [threads]
+"""
+
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import insert, select
+from sqlmodel import Session, SQLModel
+
+from app.models.task import Task, TaskEvent
+from app.models.user import User  # noqa
+from app.utilities.config import Config
+from app.utilities.database import create_write_engine
+from app.utilities.history import field_changes, install_history
+from app.utilities.versioning import conditional_update
+from app.utilities.write_batch import WriteCoordinator
+
+TASKS = 100
+BATCH_SIZE = 500  # what the background history writer flushed at once
+fields = ("title", "note")
+
+
+def setup(directory: str, label: str, trigger: bool) -> WriteCoordinator:
+    engine = create_write_engine(f"sqlite:///{directory}/{label}.db")
+    SQLModel.metadata.create_all(engine)
+    if trigger:
+        install_history(engine)
+    with Session(engine) as session:
+        session.add_all(Task(id=i, title=f"Task {i}", owner_id=1) for i in range(TASKS))
+        session.commit()
+    return WriteCoordinator(
+        engine, Config.WRITE_BATCH_WINDOW_MS, Config.WRITE_BATCH_MAX_OPS
+    )
+
+
+def update(session: Session, index: int, read_first: bool):
+    criteria = (Task.id == index % TASKS, Task.owner_id == 1)
+    values = {"title": f"Title {index}", "note": f"Note {index}"}
+    before = None
+    if read_first:
+        before = (
+            session.connection()
+            .execute(select(Task.title, Task.note).where(*criteria))
+            .first()
+        )
+    task = conditional_update(session, Task, criteria, values)
+    return task.id, task.version, task.updated_at, field_changes(fields, before, values)
+
+
+def run(
+    label: str,
+    coordinator: WriteCoordinator,
+    writes: int,
+    threads: int,
+    batched: bool = False,
+):
+    def write(index: int):
+        return coordinator.submit(
+            lambda session: update(session, index, batched)
+        ).result()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        events = list(pool.map(write, range(writes)))
+    requests = time.perf_counter() - start
+
+    if batched:
+        rows = [
+            {
+                "task_id": task_id,
+                "owner_id": 1,
+                "version": version,
+                "type": "task.updated",
+                "changes": changes,
+                "created_at": updated_at,
+            }
+            for task_id, version, updated_at, changes in events
+        ]
+        for offset in range(0, len(rows), BATCH_SIZE):
+            chunk = rows[offset : offset + BATCH_SIZE]
+            coordinator.submit(
+                lambda session: session.connection().execute(insert(TaskEvent), chunk)
+            ).result()
+    total = time.perf_counter() - start
+    coordinator.stop()
+
+    print(
+        f"{label:<16} {writes} writes: requests {requests:7.3f} s "
+        f"{writes / requests:9.0f} writes/s, with events {total:7.3f} s"
+    )
+
+
+def statement_cost(
+    label: str, coordinator: WriteCoordinator, writes: int, batched=False
+):
+    def apply(session: Session) -> float:
+        start = time.perf_counter()
+        events = [update(session, index, batched) for index in range(writes)]
+        if batched:
+            session.connection().execute(
+                insert(TaskEvent),
+                [
+                    {
+                        "task_id": task_id,
+                        "owner_id": 1,
+                        "version": version,
+                        "type": "task.updated",
+                        "changes": changes,
+                        "created_at": updated_at,
+                    }
+                    for task_id, version, updated_at, changes in events
+                ],
+            )
+        return time.perf_counter() - start
+
+    elapsed = coordinator.submit(apply).result()
+    coordinator.stop()
+    print(f"{label:<16} {writes} updates: {elapsed / writes * 1e6:7.1f} us/update")
+
+
+def main():
+    writes = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    with tempfile.TemporaryDirectory() as directory:
+        run("no history", setup(directory, "none", False), writes, threads)
+        run("trigger", setup(directory, "trigger", True), writes, threads)
+        run("read + batched", setup(directory, "batched", False), writes, threads, True)
+
+        statement_cost("no history", setup(directory, "none-1", False), writes)
+        statement_cost("trigger", setup(directory, "trigger-1", True), writes)
+        statement_cost(
+            "read + batched", setup(directory, "batched-1", False), writes, True
+        )
+
+
+if __name__ == "__main__":
+    main()
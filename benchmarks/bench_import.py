@@ -0,0 +1,77 @@
+"""
+Measure task import throughput: incremental CSV parsing and validation
+plus chunked executemany inserts through the write coordinator.
+
+Usage:
+    uv run python -m benchmarks.bench_import [rows] [chunk_rows]
+"""
+
+import sys
+import tempfile
+import time
+
+from sqlmodel import SQLModel
+
+from app.models.task import Task  # noqa
+from app.models.user import User  # noqa
+from app.utilities.config import Config
+from app.utilities.database import create_write_engine
+from app.utilities.importer import TaskImporter, insert_tasks
+from app.utilities.write_batch import WriteCoordinator
+
+
+def csv_body(rows: int, read_size: int = 64 * 1024):
+    text = "title,description,note\n" + "".join(
+        f'Task {index},"Imported, row {index}",\n' for index in range(rows)
+    )
+    data = text.encode()
+    for start in range(0, len(data), read_size):
+        yield data[start : start + read_size]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    chunk_rows = int(sys.argv[2]) if len(sys.argv) > 2 else Config.IMPORT_CHUNK_ROWS
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_write_engine(f"sqlite:///{directory}/bench.db")
+        SQLModel.metadata.create_all(engine)
+        coordinator = WriteCoordinator(
+            engine, Config.WRITE_BATCH_WINDOW_MS, Config.WRITE_BATCH_MAX_OPS
+        )
+
+        importer = TaskImporter(
+            "csv", 1, Config.IMPORT_MAX_ERRORS, Config.IMPORT_MAX_RECORD_CHARS
+        )
+        pending, chunk, inserted = None, [], 0
+
+        def flush() -> None:
+            nonlocal pending, chunk, inserted
+            if pending is not None:
+                inserted += pending.result()
+            pending = None
+            if chunk:
+                rows_, chunk = chunk, []
+                pending = coordinator.submit(
+                    lambda session: insert_tasks(session, 0, rows_)
+                )
+
+        start = time.perf_counter()
+        for body in csv_body(rows):
+            chunk += importer.feed(body)
+            if len(chunk) >= chunk_rows:
+                flush()
+        chunk += importer.close()
+        flush()
+        flush()
+        elapsed = time.perf_counter() - start
+        coordinator.stop()
+
+    print(
+        f"import {inserted} rows (chunks of {chunk_rows}): "
+        f"{elapsed:7.3f} s  {inserted / elapsed:9.0f} rows/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
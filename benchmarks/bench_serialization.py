@@ -0,0 +1,75 @@
+"""
+Compare the default FastAPI response path with the pre-built serializers.
+
+Usage:
+    uv run python -m benchmarks.bench_serialization [rows] [repeat]
+"""
+
+import json
+import sys
+import timeit
+
+from starlette.responses import JSONResponse
+
+from app.models.task import Task, TaskStatus
+from app.models.user import User
+from app.utilities.helper import get_utc_now
+from app.utilities.serializer import FastJSONResponse, dump_tasks, task_list_adapter
+
+
+def build_tasks(rows: int) -> list[Task]:
+    owner = User(
+        id=1,
+        full_name="Benchmark User",
+        email_id="benchmark@example.com",
+        hashed_password="x",
+    )
+    tasks = []
+    for index in range(rows):
+        task = Task(
+            id=index + 1,
+            title=f"Task {index}",
+            description="Compile sales data from CRM and generate the monthly report.",
+            note="Include charts and year-to-date comparison.",
+            status=TaskStatus.IN_PROGRESS,
+            owner_id=owner.id,
+            created_at=get_utc_now(),
+            updated_at=get_utc_now(),
+        )
+        task.owner = owner
+        tasks.append(task)
+    return tasks
+
+
+def current_path(tasks: list[Task]) -> bytes:
+    # What FastAPI does for `response_model=list[ReadTask]`: validate, dump to
+    # JSON-compatible Python objects, then encode with the stdlib json module.
+    value = task_list_adapter.validate_python(tasks, from_attributes=True)
+    content = task_list_adapter.dump_python(value, mode="json")
+    return JSONResponse(content).body
+
+
+def default_response_path(tasks: list[Task]) -> bytes:
+    value = task_list_adapter.validate_python(tasks, from_attributes=True)
+    content = task_list_adapter.dump_python(value, mode="json")
+    return FastJSONResponse(content).body
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    tasks = build_tasks(rows)
+
+    assert json.loads(current_path(tasks)) == json.loads(dump_tasks(tasks))
+
+    for name, fn in [
+        ("current (json.dumps)", current_path),
+        ("FastJSONResponse", default_response_path),
+        ("dump_tasks", dump_tasks),
+    ]:
+        best = min(timeit.repeat(lambda: fn(tasks), number=1, repeat=repeat))
+        print(f"{name:<22} {rows} rows: {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
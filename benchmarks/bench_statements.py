@@ -0,0 +1,113 @@
+"""
+Compare per-request Python overhead of the hot-path queries built as
+expression trees on every call against their lambda statements.
+
+Each call opens a fresh session, as a request does, against a small
+database, so the time is dominated by SQLAlchemy rather than SQLite.
+
+Usage:
+    uv run python -m benchmarks.bench_statements [calls]
+"""
+
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from sqlalchemy import and_
+from sqlalchemy.orm import defer
+from sqlmodel import Session, SQLModel, select
+
+from app.models.task import Task
+from app.models.user import User
+from app.utilities import statements
+from app.utilities.database import create_write_engine
+from app.utilities.fast_read import read_active_task_rows, read_task_rows
+
+EMAIL = "benchmark@example.com"
+
+
+def get_task_built(session: Session):
+    return session.exec(
+        select(Task).where(
+            and_(Task.owner_id == 1, Task.id == 7, Task.is_active == True)  # noqa
+        )
+    ).one_or_none()
+
+
+def get_task_lambda(session: Session):
+    return session.exec(statements.active_task(1, 7)).scalars().one_or_none()
+
+
+def list_tasks_built(session: Session):
+    return read_task_rows(session, and_(Task.owner_id == 1, Task.is_active == True))  # noqa
+
+
+def list_tasks_lambda(session: Session):
+    return read_active_task_rows(session, 1)
+
+
+def login_built(session: Session):
+    return session.exec(select(User).where(User.email_id == EMAIL)).first()
+
+
+def login_lambda(session: Session):
+    return session.exec(statements.user_by_email(EMAIL)).scalars().first()
+
+
+def current_user_built(session: Session):
+    return session.get(User, 1, options=[defer(User.hashed_password)])
+
+
+def current_user_lambda(session: Session):
+    return session.exec(statements.user_by_id(1)).scalars().first()
+
+
+def time_calls(engine, query: Callable[[Session], object], calls: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            with Session(engine) as session:
+                query(session)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_write_engine(f"sqlite:///{directory}/bench.db")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(
+                User(
+                    id=1,
+                    full_name="Benchmark User",
+                    email_id=EMAIL,
+                    hashed_password="x",
+                )
+            )
+            session.add_all(
+                Task(id=index, title=f"Task {index}", owner_id=1)
+                for index in range(1, 21)
+            )
+            session.commit()
+
+        for name, built, cached in (
+            ("get_task_by_id", get_task_built, get_task_lambda),
+            ("list_tasks (20 rows)", list_tasks_built, list_tasks_lambda),
+            ("login lookup", login_built, login_lambda),
+            ("get_current_user", current_user_built, current_user_lambda),
+        ):
+            before = time_calls(engine, built, calls)
+            after = time_calls(engine, cached, calls)
+            print(
+                f"{name:22s} built {before * 1e6:7.1f} us  lambda {after * 1e6:7.1f} us  "
+                f"({(1 - after / before) * 100:4.1f}% less)"
+            )
+
+
+if __name__ == "__main__":
+    main()
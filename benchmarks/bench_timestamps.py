@@ -0,0 +1,131 @@
+"""
+Compare timestamp storage as ISO text (`DateTime`) against integer
+microseconds (`EpochMicros`): index size, and indexed one-hour range
+queries (one row per second) counting rows or loading them as datetimes.
+
+Usage:
+    uv run python -m benchmarks.bench_timestamps [rows] [queries]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    func,
+    insert,
+    select,
+)
+
+from app.models.types import EpochMicros
+from app.utilities.database import create_write_engine
+
+START = datetime(2024, 1, 1)
+
+
+def page_count(connection) -> int:
+    return connection.exec_driver_sql("PRAGMA page_count").scalar()
+
+
+def build(engine, column_type, rows: int) -> tuple[Table, int]:
+    """
+    Create and fill a table of timestamps; returns it with its index size in bytes.
+    """
+    table = Table(
+        f"tasks_{column_type.__name__.lower()}",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("updated_at", column_type, nullable=False),
+    )
+    with engine.begin() as connection:
+        table.create(connection)
+        connection.execute(
+            insert(table),
+            [
+                {
+                    "id": row,
+                    "updated_at": START
+                    + timedelta(seconds=row, microseconds=row % 997),
+                }
+                for row in range(rows)
+            ],
+        )
+        before = page_count(connection)
+        Index(f"ix_{table.name}_updated_at", table.c.updated_at).create(connection)
+        page_size = connection.exec_driver_sql("PRAGMA page_size").scalar()
+        return table, (page_count(connection) - before) * page_size
+
+
+def time_queries(engine, statement, column, rows: int, queries: int) -> float:
+    """
+    Seconds per query of `statement` over one-hour windows spread across the table.
+    """
+    window = timedelta(hours=1)
+    step = timedelta(seconds=rows) / queries
+    with engine.connect() as connection:
+        start = time.perf_counter()
+        for query in range(queries):
+            since = START + step * query
+            connection.execute(
+                statement.where(column >= since, column < since + window)
+            ).all()
+        return (time.perf_counter() - start) / queries
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rounds = 5
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_write_engine(f"sqlite:///{directory}/bench.db")
+        tables = {
+            column_type: build(engine, column_type, rows)
+            for column_type in (DateTime, EpochMicros)
+        }
+
+        # Interleave the rounds and keep the best, so cache warmth favours neither type
+        counted = {column_type: float("inf") for column_type in tables}
+        loaded = dict(counted)
+        for _ in range(rounds):
+            for column_type, (table, _) in tables.items():
+                column = table.c.updated_at
+                counted[column_type] = min(
+                    counted[column_type],
+                    time_queries(
+                        engine,
+                        select(func.count()).select_from(table),
+                        column,
+                        rows,
+                        queries,
+                    ),
+                )
+                loaded[column_type] = min(
+                    loaded[column_type],
+                    time_queries(
+                        engine,
+                        select(table.c.id, column).order_by(column),
+                        column,
+                        rows,
+                        queries,
+                    ),
+                )
+
+    for column_type, (_, index_bytes) in tables.items():
+        print(
+            f"{column_type.__name__:12s} index {index_bytes / 1024:8.0f} KiB "
+            f"({index_bytes / rows:5.1f} B/row)  "
+            f"count {counted[column_type] * 1e6:7.1f} us/query  "
+            f"load {loaded[column_type] * 1e6:8.1f} us/query"
+        )
+
+
+if __name__ == "__main__":
+    main()
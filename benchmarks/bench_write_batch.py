@@ -0,0 +1,70 @@
+"""
+Compare per-request commits with group-committed task writes.
+
+Usage:
+    uv run python -m benchmarks.bench_write_batch [writes] [threads]
+"""
+
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlmodel import Session, SQLModel
+
+from app.models.task import Task
+from app.models.user import User  # noqa
+from app.utilities.config import Config
+from app.utilities.database import create_write_engine
+from app.utilities.write_batch import WriteCoordinator
+
+
+def new_task(index: int) -> Task:
+    return Task(title=f"Task {index}", description="Benchmark", owner_id=1)
+
+
+def run(label: str, write, writes: int, threads: int) -> None:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(write, range(writes)))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<16} {writes} writes: {elapsed:7.3f} s  {writes / elapsed:9.0f} writes/s"
+    )
+
+
+def main():
+    writes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_write_engine(f"sqlite:///{directory}/bench.db")
+        SQLModel.metadata.create_all(engine)
+
+        def per_request(index: int) -> None:
+            for _ in range(100):
+                try:
+                    with Session(engine) as session:
+                        session.add(new_task(index))
+                        session.commit()
+                    return
+                except Exception:  # database is locked
+                    time.sleep(0.001)
+
+        coordinator = WriteCoordinator(
+            engine, Config.WRITE_BATCH_WINDOW_MS, Config.WRITE_BATCH_MAX_OPS
+        )
+
+        def batched(index: int) -> None:
+            def apply(session: Session) -> None:
+                session.add(new_task(index))
+
+            coordinator.submit(apply).result()
+
+        run("per-request", per_request, writes, threads)
+        run("group commit", batched, writes, threads)
+        coordinator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import json
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session, SQLModel, select
+
+from app.models.task import Task, TaskArchive
+from app.models.user import User, UserRole
+from app.routes.task import encode_sync_token, list_task_changes
+from app.utilities.archive import archive_batch, archive_cutoff, restore_tasks
+from app.utilities.database import create_write_engine
+from app.utilities.helper import get_utc_now
+from app.utilities.principal_cache import Principal
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_write_engine(f"sqlite:///{tmp_path / 'archive.db'}")
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def add_tasks(engine, *tasks):
+    with Session(engine) as session:
+        session.add_all(tasks)
+        session.commit()
+
+
+def test_archive_moves_old_deleted_tasks(engine):
+    old = get_utc_now() - timedelta(days=40)
+    add_tasks(
+        engine,
+        Task(id=1, title="old deleted", owner_id=1, is_active=False, updated_at=old),
+        Task(id=2, title="recently deleted", owner_id=1, is_active=False),
+        Task(id=3, title="old active", owner_id=1, updated_at=old),
+        Task(
+            id=4,
+            title="old deleted, highest id",
+            owner_id=1,
+            is_active=False,
+            updated_at=old,
+        ),
+    )
+
+    with Session(engine) as session:
+        assert (
+            archive_batch(session, get_utc_now() - timedelta(days=30), batch_size=10)
+            == 1
+        )
+        session.commit()
+
+    with Session(engine) as session:
+        assert session.exec(select(Task.id).order_by(Task.id)).all() == [2, 3, 4]
+        archived = session.exec(select(TaskArchive)).one()
+        assert (archived.id, archived.title, archived.version) == (1, "old deleted", 1)
+
+
+def test_restore_brings_task_back_deleted_with_new_version(engine):
+    old = get_utc_now() - timedelta(days=40)
+    add_tasks(
+        engine,
+        Task(id=1, title="old deleted", owner_id=5, is_active=False, updated_at=old),
+        Task(id=2, title="newest", owner_id=5),
+    )
+
+    with Session(engine) as session:
+        archive_batch(session, get_utc_now(), batch_size=10)
+        assert restore_tasks(session, [1, 99]) == [(1, 5, 2)]
+        session.commit()
+
+    with Session(engine) as session:
+        task = session.get(Task, 1)
+        assert (task.title, task.is_active, task.version) == ("old deleted", False, 2)
+        assert task.updated_at > old.replace(tzinfo=None)
+        assert session.exec(select(TaskArchive)).all() == []
+
+
+def test_sync_tokens_older_than_the_archive_need_a_resync(engine):
+    old = get_utc_now() - timedelta(days=40)
+    add_tasks(
+        engine,
+        User(
+            id=1, full_name="Owner", email_id="owner@example.com", hashed_password="x"
+        ),
+        Task(id=1, title="old deleted", owner_id=1, is_active=False, updated_at=old),
+        Task(
+            id=2,
+            title="newest",
+            owner_id=1,
+            updated_at=get_utc_now() - timedelta(hours=1),
+        ),
+    )
+    user = Principal(1, UserRole.USER, True, 0, 0)
+
+    with Session(engine) as session:
+        archive_batch(session, archive_cutoff(), batch_size=10)
+        session.commit()
+
+        # Issued before the delete: the tombstone is gone, so the client must start over
+        stale = encode_sync_token(old - timedelta(days=1), 0)
+        with pytest.raises(HTTPException) as error:
+            list_task_changes(since=stale, limit=10, db_session=session, user=user)
+        assert error.value.status_code == 410
+
+        recent = encode_sync_token(archive_cutoff() + timedelta(minutes=1), 0)
+        response = list_task_changes(
+            since=recent, limit=10, db_session=session, user=user
+        )
+        assert [task["id"] for task in json.loads(response.body)["tasks"]] == [2]
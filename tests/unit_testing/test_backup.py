@@ -0,0 +1,125 @@
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from app.utilities import backup
+from app.schemas.backup import BackupJobState
+from app.utilities.backup import (
+    BackupRunner,
+    backup_file,
+    create_backup,
+    list_backups,
+    verify_backup,
+)
+from app.utilities.database import create_write_engine
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    path = str(tmp_path / "live.db")
+    engine = create_write_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+        )
+        connection.execute(
+            text("INSERT INTO notes (body) VALUES (:body)"),
+            [{"body": "x" * 200} for _ in range(5000)],
+        )
+
+    monkeypatch.setattr(backup, "shard_indexes", lambda: range(1))
+    monkeypatch.setattr(backup, "shard_path", lambda index: path)
+    return engine, path
+
+
+def count_notes(path):
+    db = sqlite3.connect(path)
+    try:
+        return db.execute("SELECT count(*) FROM notes").fetchone()[0]
+    finally:
+        db.close()
+
+
+def test_backup_copies_one_snapshot_while_writes_continue(database, tmp_path):
+    engine, path = database
+    stop = threading.Event()
+
+    def write():
+        while not stop.is_set():
+            with engine.begin() as connection:
+                connection.execute(text("INSERT INTO notes (body) VALUES ('y')"))
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        copy = str(tmp_path / "copy.db")
+        backup_file(path, copy, step_pages=8, step_sleep_s=0.001)
+    finally:
+        stop.set()
+        writer.join()
+
+    assert 5000 <= count_notes(copy) <= count_notes(path)
+    db = sqlite3.connect(copy)
+    assert db.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+    assert db.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+    db.close()
+
+
+def test_snapshots_are_rotated_and_verified(database, tmp_path):
+    backup_dir = str(tmp_path / "backups")
+    names = [
+        create_backup(backup_dir, keep=2, step_pages=64, step_sleep_ms=0).name
+        for _ in range(3)
+    ]
+
+    assert [snapshot.name for snapshot in list_backups(backup_dir)] == names[:0:-1]
+    assert [check.detail for check in verify_backup(names[-1], backup_dir)] == ["ok"]
+
+    # Flip a byte in the copy
+    copy = tmp_path / "backups" / names[-1] / "live.db"
+    data = bytearray(copy.read_bytes())
+    data[-1] ^= 0xFF
+    copy.write_bytes(bytes(data))
+
+    check = verify_backup(names[-1], backup_dir)[0]
+    assert (check.ok, check.detail) == (False, "checksum mismatch")
+
+    with pytest.raises(ValueError):
+        verify_backup("../live.db", backup_dir)
+
+
+def test_backup_jobs_run_in_the_background(database, tmp_path, monkeypatch):
+    backup_dir = str(tmp_path / "backups")
+    release = threading.Event()
+
+    def slow_backup():
+        release.wait()
+        return create_backup(backup_dir, keep=2, step_pages=64, step_sleep_ms=0)
+
+    monkeypatch.setattr(backup, "create_backup", slow_backup)
+    runner = BackupRunner()
+
+    job = runner.start()
+    assert job.state == BackupJobState.RUNNING
+    assert runner.start() is None  # one job at a time
+
+    release.set()
+    runner.stop()
+    assert runner.job.state == BackupJobState.SUCCEEDED
+    assert runner.job.finished_at >= job.started_at
+    assert [snapshot.name for snapshot in list_backups(backup_dir)] == [
+        runner.job.snapshot.name
+    ]
+
+    # A failed job is reported, and the next one can start
+    monkeypatch.setattr(backup, "create_backup", lambda: 1 / 0)
+    runner.start()
+    runner.stop()
+    assert (runner.job.state, runner.job.error) == (
+        BackupJobState.FAILED,
+        "division by zero",
+    )
+    assert runner.start() is not None
+    runner.stop()
@@ -0,0 +1,61 @@
+import pytest
+
+from app.utilities.cache import MemoryCache, SharedCounters, VersionedCache
+
+
+def test_memory_cache_is_bounded():
+    cache = MemoryCache(max_bytes=10, max_entries=3)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.get("a")
+    cache.set("c", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.size <= 10
+
+
+def test_versioned_cache_bump_invalidates():
+    cache = VersionedCache("users", MemoryCache(max_bytes=1024, max_entries=16))
+    loads = []
+
+    def load():
+        loads.append(1)
+        return b"[]"
+
+    cache.get_or_load("/user/list", load)
+    cache.get_or_load("/user/list", load)
+    assert len(loads) == 1
+
+    cache.bump()
+    cache.get_or_load("/user/list", load)
+    assert len(loads) == 2
+
+
+def test_generation_is_shared_through_the_backend(tmp_path):
+    loads = []
+
+    def load():
+        loads.append(1)
+        return b"[]"
+
+    # Two workers' caches over one shared backend
+    backend = MemoryCache(max_bytes=1024, max_entries=16)
+    first, second = VersionedCache("users", backend), VersionedCache("users", backend)
+    first.get_or_load("/user/list", load)
+    second.bump()
+    first.get_or_load("/user/list", load)
+    assert len(loads) == 2 and first.generation == second.generation == 1
+
+    # Per-worker memory backends still share generations through the counter file
+    path = str(tmp_path / "generations.cache")
+    first = VersionedCache("users", MemoryCache(1024, 16, SharedCounters(path)))
+    second = VersionedCache("users", MemoryCache(1024, 16, SharedCounters(path)))
+    first.get_or_load("/user/list", load)
+    second.bump()
+    first.get_or_load("/user/list", load)
+    assert len(loads) == 4 and first.generation == second.generation == 1
+
+
+if __name__ == "__main__":
+    pytest.main()
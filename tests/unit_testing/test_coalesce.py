@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from app.utilities.coalesce import SingleFlight
+
+
+def test_single_flight_shares_result():
+    flight = SingleFlight()
+    calls = []
+    results = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return b"[]"
+
+    def worker():
+        results.append(flight.do(("/task/list", 1, ()), load))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [b"[]"] * 8
+
+
+def test_single_flight_propagates_error():
+    flight = SingleFlight()
+
+    def load():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", load)
+
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_single_flight_ttl():
+    flight = SingleFlight(ttl_ms=10_000)
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 1
+
+
+def test_single_flight_waiters_get_their_own_error():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def load():
+        started.set()
+        release.wait()
+        raise ValueError("boom")
+
+    def worker():
+        try:
+            flight.do("key", load)
+        except ValueError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert [str(error) for error in errors] == ["boom"] * 4
+    assert len({id(error) for error in errors}) == 4
+
+
+def test_single_flight_is_bounded_by_max_keys():
+    flight = SingleFlight(ttl_ms=10_000, max_keys=3)
+    for key in range(5):
+        assert flight.do(key, lambda: key) == key
+    assert list(flight._calls) == [2, 3, 4]
+
+    # Every slot in flight: a new key runs on its own and is not tracked
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait()
+
+    flight = SingleFlight(max_keys=1)
+    thread = threading.Thread(target=flight.do, args=("slow", slow))
+    thread.start()
+    started.wait()
+    assert flight.do("other", lambda: "ran") == "ran"
+    assert list(flight._calls) == ["slow"]
+    release.set()
+    thread.join()
+
+
+if __name__ == "__main__":
+    pytest.main()
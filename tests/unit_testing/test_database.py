@@ -0,0 +1,107 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    create_engine,
+    inspect,
+    text,
+)
+from sqlalchemy.exc import OperationalError
+
+from app.utilities import database
+from app.utilities.config import Config
+from app.utilities.database import (
+    begin_immediate,
+    create_read_engine,
+    create_write_engine,
+    drop_undeclared_indexes,
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "live.db")
+    with create_write_engine(f"sqlite:///{path}").begin() as connection:
+        connection.execute(
+            text("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+        )
+    return path
+
+
+def test_read_engine_rejects_writes(path):
+    read_engine = create_read_engine(f"sqlite:///file:{path}?mode=ro&uri=true")
+
+    with read_engine.connect() as connection:
+        assert connection.execute(text("PRAGMA query_only")).scalar() == 1
+        assert connection.execute(text("SELECT count(*) FROM notes")).scalar() == 0
+        with pytest.raises(OperationalError, match="readonly|read-only"):
+            connection.execute(text("INSERT INTO notes (body) VALUES ('x')"))
+
+
+def test_begin_immediate_retries_then_gives_up(path, monkeypatch):
+    monkeypatch.setattr(Config, "DB_LOCK_RETRIES", 3)
+    monkeypatch.setattr(Config, "DB_LOCK_BACKOFF_MS", 1)
+
+    # Another writer holds the lock; fail fast instead of waiting out the busy timeout
+    holder = sqlite3.connect(path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    engine = create_engine(f"sqlite:///{path}", connect_args={"timeout": 0})
+
+    sleeps = []
+    monkeypatch.setattr(database.time, "sleep", sleeps.append)
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError, match="locked"):
+            begin_immediate(connection)
+    assert sleeps == [0.001, 0.002, 0.004]
+
+    # Released during the first backoff: the retry takes the lock
+    def release(seconds):
+        sleeps.append(seconds)
+        holder.execute("COMMIT")
+
+    sleeps.clear()
+    monkeypatch.setattr(database.time, "sleep", release)
+    with engine.connect() as connection:
+        begin_immediate(connection)
+        connection.exec_driver_sql("INSERT INTO notes (body) VALUES ('x')")
+        connection.exec_driver_sql("COMMIT")
+    assert sleeps == [0.001]
+
+    holder.close()
+    assert sqlite3.connect(path).execute("SELECT count(*) FROM notes").fetchone() == (
+        1,
+    )
+
+
+def test_only_undeclared_ix_indexes_are_dropped(path):
+    engine = create_write_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        for ddl in [
+            "CREATE INDEX ix_notes_body ON notes (body)",
+            "CREATE INDEX ix_notes_stale ON notes (id, body)",
+            "CREATE INDEX notes_by_hand ON notes (body, id)",
+        ]:
+            connection.execute(text(ddl))
+
+    notes = Table(
+        "notes",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("body", Text),
+        Index("ix_notes_body", "body"),
+    )
+    drop_undeclared_indexes(engine, [notes])
+
+    with engine.connect() as connection:
+        names = {index["name"] for index in inspect(connection).get_indexes("notes")}
+    assert names == {"ix_notes_body", "notes_by_hand"}
+
+
+if __name__ == "__main__":
+    pytest.main()
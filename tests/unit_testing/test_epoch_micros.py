@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, insert, select, text
+from sqlalchemy.exc import IntegrityError
+
+from app.models.task import Task, TaskEvent
+from app.models.user import User  # noqa
+from app.utilities.database import convert_epoch_columns, create_write_engine
+from app.utilities.history import append_only_trigger
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return create_write_engine(f"sqlite:///{tmp_path / 'epoch.db'}")
+
+
+def test_timestamps_are_stored_as_integer_microseconds(engine):
+    Task.__table__.create(engine)  # noqa
+    aware = datetime(
+        2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone(timedelta(hours=2))
+    )
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Task),
+            [
+                {
+                    "id": 1,
+                    "title": "a",
+                    "owner_id": 1,
+                    "created_at": aware,
+                    "updated_at": aware,
+                },
+                {
+                    "id": 2,
+                    "title": "b",
+                    "owner_id": 1,
+                    "created_at": datetime(1969, 12, 31, 23, 59, 59, 999999),
+                    "updated_at": datetime(2025, 3, 1, 10, 30, 15, 123457),
+                },
+            ],
+        )
+
+    with engine.connect() as connection:
+        stored = connection.execute(
+            text("SELECT created_at, updated_at FROM tasks ORDER BY id")
+        )
+        assert stored.all() == [
+            (1740825015123456, 1740825015123456),
+            (-1, 1740825015123457),
+        ]
+
+        # Loaded back as naive UTC, and compared as integers
+        loaded = connection.execute(
+            select(Task.id, Task.updated_at).where(
+                Task.updated_at > datetime(2025, 3, 1, 10, 30, 15, 123456)
+            )
+        ).all()
+        assert loaded == [(2, datetime(2025, 3, 1, 10, 30, 15, 123457))]
+
+
+def test_text_timestamps_are_converted_in_place(engine):
+    # `tasks` as an older version of the app created it
+    old = Table(
+        "tasks",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("title", Integer),
+        Column("owner_id", Integer),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+    )
+    old.create(engine)
+    created = datetime(2024, 2, 29, 23, 59, 58, 654321)
+    updated = datetime(2024, 3, 1, 0, 0, 1)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(old),
+            [{"id": 7, "owner_id": 1, "created_at": created, "updated_at": updated}],
+        )
+
+    convert_epoch_columns(engine, [Task.__table__])  # noqa
+    convert_epoch_columns(engine, [Task.__table__])  # noqa
+
+    with engine.connect() as connection:
+        assert connection.execute(
+            text("SELECT typeof(created_at), typeof(updated_at) FROM tasks")
+        ).one() == ("integer", "integer")
+        assert connection.execute(select(Task.created_at, Task.updated_at)).one() == (
+            created,
+            updated,
+        )
+
+
+def test_append_only_events_are_converted(engine):
+    # `task_events` with its old DATETIME column and the append-only guard
+    old = Table(
+        "task_events",
+        MetaData(),
+        Column("seq", Integer, primary_key=True),
+        Column("created_at", DateTime),
+    )
+    old.create(engine)
+    created = datetime(2025, 6, 1, 8, 0, 0, 1)
+    with engine.begin() as connection:
+        connection.execute(text(append_only_trigger))
+        connection.execute(insert(old), [{"seq": 1, "created_at": created}])
+
+    convert_epoch_columns(engine, [TaskEvent.__table__])  # noqa
+
+    with engine.connect() as connection:
+        assert connection.execute(select(TaskEvent.created_at)).scalar() == created
+
+        # The guard is back
+        with pytest.raises(IntegrityError, match="append-only"):
+            connection.execute(text("UPDATE task_events SET created_at = 0"))
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from app.utilities import events
+from app.utilities.events import EventBus
+
+
+def test_event_bus_fans_out_per_owner_and_resumes():
+    async def scenario():
+        bus = EventBus(buffer_size=8, history_size=2, history_ttl_s=600)
+        mine = bus.subscribe(1)
+        other = bus.subscribe(2)
+
+        bus.publish(1, "task.created", {"id": 10})
+        bus.publish(1, "task.deleted", {"id": 10})
+        await asyncio.sleep(0)
+
+        first = await mine.queue.get()
+        assert (first.type, first.data) == ("task.created", '{"id":10}')
+        assert other.queue.empty()
+
+        resumed = bus.subscribe(1, bus.event_id(first))
+        assert [event.type for event in resumed.backlog] == ["task.deleted"]
+
+        bus.publish(1, "task.created", {"id": 11})  # evicts only the event already seen
+        assert not bus.subscribe(1, bus.event_id(first)).reset
+
+        bus.publish(1, "task.created", {"id": 12})  # now a missed event is gone too
+        assert bus.subscribe(1, bus.event_id(first)).reset
+        assert bus.subscribe(1, "other-epoch-1").reset
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_is_reset_instead_of_growing():
+    async def scenario():
+        bus = EventBus(buffer_size=2, history_size=8, history_ttl_s=600)
+        subscription = bus.subscribe(1)
+
+        for task_id in range(5):
+            bus.publish(1, "task.created", {"id": task_id})
+        await asyncio.sleep(0)
+
+        assert subscription.reset
+        assert subscription.queue.qsize() == 1
+        assert await subscription.queue.get() is None
+
+        bus.unsubscribe(subscription)
+        bus.publish(1, "task.created", {"id": 99})
+
+    asyncio.run(scenario())
+
+
+def test_idle_owners_without_streams_are_forgotten(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(events.time, "monotonic", lambda: now[0])
+
+    async def scenario():
+        bus = EventBus(buffer_size=8, history_size=4, history_ttl_s=60)
+        watched = bus.subscribe(1)
+        for owner_id in range(1, 101):
+            bus.publish(owner_id, "task.created", {"id": owner_id})
+            if owner_id == 2:
+                seen = bus.current_id()
+        assert len(bus._history) == 100
+
+        now[0] += 61
+        bus.publish(200, "task.created", {"id": 200})
+
+        # Only the streamed owner and the one just published are kept
+        assert sorted(bus._history) == [1, 200]
+        assert [event.seq for event in bus._history[1]] == [1]
+
+        # Whether a forgotten owner's client missed anything is unknown, so it is reset
+        assert bus.subscribe(2, seen).reset
+        bus.publish(2, "task.created", {"id": 2})
+        assert bus.subscribe(2, seen).reset
+        assert not bus.subscribe(2, bus.current_id()).reset
+        bus.unsubscribe(watched)
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    pytest.main()
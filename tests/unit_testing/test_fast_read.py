@@ -0,0 +1,131 @@
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.task import Task, TaskStatus
+from app.models.user import User, UserRole
+from app.utilities.fast_read import (
+    iter_task_export,
+    read_active_task_rows,
+    read_task_changes,
+    read_task_rows,
+    read_task_summaries,
+    read_user_rows,
+    task_export_fields,
+)
+from app.utilities.serializer import (
+    dump_rows,
+    dump_tasks,
+    dump_users,
+    encode_csv,
+    encode_ndjson,
+)
+from app.utilities.statements import active_task, active_tasks, user_by_email
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        owner = User(
+            full_name="Fast Reader", email_id="fast@example.com", hashed_password="x"
+        )
+        admin = User(
+            full_name="Admin Reader",
+            email_id="admin@example.com",
+            phone_no="+91 0000000000",
+            hashed_password="x",
+            role=UserRole.ADMIN,
+            is_active=False,
+        )
+        session.add_all([owner, admin])
+        session.commit()
+
+        for index, status in enumerate(TaskStatus):
+            session.add(
+                Task(
+                    title=f"Task {index}",
+                    description="Description" if index % 2 else None,
+                    note="Note",
+                    status=status,
+                    is_active=index != 2,
+                    owner_id=owner.id,
+                )
+            )
+        session.commit()
+
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.mark.parametrize("is_active", [True, False])
+def test_task_rows_match_orm_path(db_session, is_active):
+    criteria = (Task.is_active == is_active,)
+    orm_tasks = db_session.exec(select(Task).where(*criteria).order_by(Task.id)).all()
+
+    fast = dump_rows(read_task_rows(db_session, *criteria))
+    assert fast == dump_tasks(orm_tasks)
+    assert len(json.loads(fast)) == len(orm_tasks)
+
+
+def test_lambda_statements_bind_their_arguments_on_every_call(db_session):
+    # Same call sites with different arguments: cached statements must not reuse old values
+    assert dump_rows(read_active_task_rows(db_session, 1)) == dump_tasks(
+        db_session.exec(active_tasks(1)).scalars().all()
+    )
+    assert read_active_task_rows(db_session, 2) == []
+
+    assert db_session.exec(active_task(1, 1)).scalars().one().title == "Task 0"
+    assert db_session.exec(active_task(1, 3)).scalars().one_or_none() is None
+    assert db_session.exec(active_task(2, 1)).scalars().one_or_none() is None
+
+    for email_id, user_id in (("fast@example.com", 1), ("admin@example.com", 2)):
+        assert db_session.exec(user_by_email(email_id)).scalars().one().id == user_id
+
+
+@pytest.mark.parametrize("is_active", [True, False])
+def test_user_rows_match_orm_path(db_session, is_active):
+    criteria = (User.is_active == is_active,)
+    orm_users = db_session.exec(select(User).where(*criteria).order_by(User.id)).all()
+
+    assert dump_rows(read_user_rows(db_session, *criteria)) == dump_users(orm_users)
+
+
+def test_task_summaries_project_only_summary_columns(db_session):
+    summaries = read_task_summaries(db_session, Task.is_active == True)  # noqa
+
+    assert len(summaries) == len(TaskStatus) - 1
+    assert set(summaries[0]) == {"id", "title", "status", "updated_at"}
+
+
+def test_task_changes_ordered_by_update_with_tombstones(db_session):
+    db_session.get(Task, 1).updated_at = datetime(2100, 1, 1)
+    db_session.commit()
+
+    changes = read_task_changes(db_session, limit=10)
+
+    assert [task["id"] for _, task in changes] == [2, 3, 4, 5, 1]
+    assert [is_active for is_active, _ in changes] == [True, False, True, True, True]
+    assert dump_rows([changes[0][1]]) == dump_tasks([db_session.get(Task, 2)])
+
+
+def test_task_export_streams_in_batches(db_session):
+    batches = list(iter_task_export(db_session.connection(), 2, Task.owner_id == 1))
+
+    assert [len(rows) for rows in batches] == [2, 2, 1]
+    rows = [row for rows in batches for row in rows]
+
+    first = json.loads(encode_ndjson(task_export_fields, rows).splitlines()[0])
+    assert (first["id"], first["status"], first["is_active"]) == (1, "Pending", True)
+    assert encode_csv(rows[2:3]).decode().split(",")[4:7] == ["Closed", "1", "False"]
+
+
+if __name__ == "__main__":
+    pytest.main()
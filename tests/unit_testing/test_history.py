@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, text
+
+from app.models.task import TaskStatus
+from app.utilities.database import create_write_engine
+from app.utilities.history import field_changes, install_history, read_task_history
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_write_engine(f"sqlite:///{tmp_path / 'history.db'}")
+    SQLModel.metadata.create_all(engine)
+    install_history(engine)
+    return engine
+
+
+def test_field_changes_only_reports_differences():
+    before = ("Draft", None, TaskStatus.PENDING)
+    after = {"title": "Final", "note": None, "status": TaskStatus.CLOSED}
+
+    assert field_changes(["title", "note", "status"], before, after) == {
+        "title": ["Draft", "Final"],
+        "status": ["Pending", "Closed"],
+    }
+    assert field_changes(["title"], None, after) == {"title": [None, "Final"]}
+
+
+def test_updates_log_their_diff(engine):
+    with Session(engine) as session:
+        session.exec(
+            text(
+                "INSERT INTO tasks (id, title, note, status, is_active, owner_id, version, "
+                "created_at, updated_at) VALUES "
+                "(7, 'Draft', NULL, 'PENDING', 1, 1, 1, 0, 0), "
+                "(8, 'Other', NULL, 'PENDING', 1, 1, 1, 0, 0)"
+            )
+        )
+        for step in [
+            "title = 'Final', note = 'a \"quoted\" note', version = 2, updated_at = 2",
+            "status = 'CLOSED', version = 3, updated_at = 3",
+            "is_active = 0, version = 4, updated_at = 4",
+            "note = 'x'",  # an unversioned rewrite is not a change
+        ]:
+            session.exec(text(f"UPDATE tasks SET {step} WHERE id = 7"))
+
+        # One bulk statement logs one event per row
+        session.exec(
+            text("UPDATE tasks SET status = 'IN_PROGRESS', version = version + 1")
+        )
+        session.commit()
+
+        events = read_task_history(session, 7, after=0, limit=10)
+        assert [(event.type, event.version, event.changes) for event in events] == [
+            (
+                "task.updated",
+                2,
+                {"title": ["Draft", "Final"], "note": [None, 'a "quoted" note']},
+            ),
+            ("task.status", 3, {"status": ["Pending", "Closed"]}),
+            ("task.deleted", 4, {"is_active": [True, False]}),
+            ("task.status", 5, {"status": ["Closed", "In Progress"]}),
+        ]
+        assert events[0].created_at == datetime(1970, 1, 1, 0, 0, 0, 2)
+        assert [event.version for event in read_task_history(session, 8, 0, 10)] == [2]
+
+
+def test_events_are_append_only(engine):
+    with Session(engine) as session:
+        session.exec(
+            text(
+                "INSERT INTO task_events (task_id, owner_id, version, type, changes, created_at) "
+                "VALUES (1, 1, 1, 'task.created', '{}', 0)"
+            )
+        )
+        session.commit()
+
+        with pytest.raises(IntegrityError):
+            session.exec(text("UPDATE task_events SET type = 'task.updated'"))
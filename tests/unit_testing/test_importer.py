@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException, Request
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+from app.models.task import Task, TaskStatus
+from app.models.user import User, UserRole
+from app.routes import task as task_routes
+from app.utilities.config import Config
+from app.utilities.database import create_write_engine
+from app.utilities.helper import get_utc_now
+from app.utilities.importer import TaskImporter, insert_tasks
+from app.utilities.principal_cache import Principal
+from app.utilities.write_batch import WriteCoordinator
+
+
+def feed_in_pieces(importer: TaskImporter, body: bytes, size: int) -> list[dict]:
+    rows = []
+    for start in range(0, len(body), size):
+        rows += importer.feed(body[start : start + size])
+    return rows + importer.close()
+
+
+@pytest.mark.parametrize("size", [1, 5, 1024])
+def test_csv_rows_split_across_chunks(size):
+    body = 'title,description,note\nA,"two\nlines, quoted",\n,missing title,\nB,,n\nC,x\n'.encode()
+    importer = TaskImporter("csv", 7, max_errors=10, max_record_chars=1000)
+
+    rows = feed_in_pieces(importer, body, size)
+
+    assert [(row["title"], row["description"], row["note"]) for row in rows] == [
+        ("A", "two\nlines, quoted", None),
+        ("B", None, "n"),
+    ]
+    assert all(
+        row["owner_id"] == 7 and row["status"] == TaskStatus.PENDING for row in rows
+    )
+    assert (importer.processed, importer.failed) == (4, 2)
+    assert [error.row for error in importer.errors] == [2, 4]
+
+
+def test_ndjson_errors_are_capped():
+    body = b'{"title": "ok"}\n\n[1]\nnot json\n{"title": 3}\n{"title": " spaced "}'
+    importer = TaskImporter("ndjson", 1, max_errors=2, max_record_chars=1000)
+
+    rows = feed_in_pieces(importer, body, 4)
+
+    assert [row["title"] for row in rows] == ["ok", "spaced"]
+    assert importer.failed == 3
+    assert [(error.row, error.detail) for error in importer.errors] == [
+        (2, "Expected a JSON object"),
+        (3, "Expecting value: line 1 column 1 (char 0)"),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 7, 1024])
+def test_oversized_records_fail_and_parsing_resumes(size):
+    # An unbalanced quote would otherwise swallow the rest of the body
+    body = ('title,note\nA,"never closed\n' + "x,y\n" * 20 + "B,n\n").encode()
+    importer = TaskImporter("csv", 1, max_errors=10, max_record_chars=50)
+
+    rows = feed_in_pieces(importer, body, size)
+
+    assert [row["title"] for row in rows][-1] == "B"
+    assert importer.errors[0].row == 1
+    assert importer.errors[0].detail == "Record longer than 50 characters"
+
+    # So would a line that never ends
+    importer = TaskImporter("ndjson", 1, max_errors=10, max_record_chars=50)
+    body = b'{"title": "' + b"x" * 200 + b'"}\n{"title": "ok"}'
+    rows = feed_in_pieces(importer, body, size)
+    assert [row["title"] for row in rows] == ["ok"]
+    assert (importer.processed, importer.failed) == (2, 1)
+
+
+def test_insert_tasks_chunk():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(
+            User(
+                full_name="Importer", email_id="import@example.com", hashed_password="x"
+            )
+        )
+        session.commit()
+
+        importer = TaskImporter("ndjson", 1, max_errors=10, max_record_chars=1000)
+        rows = importer.feed(b'{"title": "one"}\n{"title": "two", "note": "n"}\n')
+        before = get_utc_now().replace(tzinfo=None)
+        assert insert_tasks(session, 0, rows) == 2
+        session.commit()
+
+        # Stamped when inserted, not when parsed
+        tasks = session.exec(select(Task).order_by(Task.id)).all()
+        assert [(task.title, task.note, task.version) for task in tasks] == [
+            ("one", None, 1),
+            ("two", "n", 1),
+        ]
+        assert all(task.created_at == task.updated_at >= before for task in tasks)
+
+
+def test_bad_utf8_after_a_chunk_reports_the_rows_imported(tmp_path, monkeypatch):
+    engine = create_write_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    SQLModel.metadata.create_all(engine)
+    coordinator = WriteCoordinator(engine, window_ms=5, max_ops=64)
+    monkeypatch.setattr(task_routes, "coordinator_for", lambda shard: coordinator)
+    monkeypatch.setattr(Config, "IMPORT_CHUNK_ROWS", 2)
+
+    # The first body fills a chunk, which is still in flight when the second fails to decode
+    messages = [
+        {
+            "type": "http.request",
+            "body": b"title\none\ntwo\nthree\n",
+            "more_body": True,
+        },
+        {"type": "http.request", "body": b"f\xffour\n", "more_body": False},
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    request = Request(
+        {"type": "http", "method": "POST", "headers": [(b"content-type", b"text/csv")]},
+        receive,
+    )
+    user = Principal(1, UserRole.USER, True, 0, 0)
+    try:
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(
+                task_routes.import_tasks(request, import_format=None, user=user)
+            )
+    finally:
+        coordinator.stop()
+
+    assert error.value.status_code == 400
+    assert error.value.detail == "Import body must be UTF-8, 3 rows were imported"
+    with Session(engine) as session:
+        assert session.exec(select(func.count()).select_from(Task)).one() == 3
@@ -0,0 +1,37 @@
+import pytest
+
+from app.models.user import UserRole
+from app.utilities.principal_cache import Principal, PrincipalCache
+
+
+def test_principal_cache_shared_between_mappings(tmp_path):
+    path = str(tmp_path / "principals.cache")
+    writer = PrincipalCache(path, slots=16)
+    reader = PrincipalCache(path, slots=16)
+
+    assert reader.get(3) is None
+
+    writer.put(Principal(3, UserRole.ADMIN, True, 2, 0))
+    assert reader.get(3) == Principal(3, UserRole.ADMIN, True, 2, 0)
+
+    # Slot collision: a different user id in the same slot is a miss
+    assert reader.get(19) is None
+
+    writer.invalidate(3)
+    assert reader.get(3) is None
+
+
+def test_principal_cache_fill_does_not_overwrite_newer_write(tmp_path):
+    cache = PrincipalCache(str(tmp_path / "principals.cache"), slots=16)
+
+    seen_seq, principal = cache.lookup(5)
+    assert principal is None
+
+    cache.put(Principal(5, UserRole.USER, False, 0, 1))
+    cache.fill(Principal(5, UserRole.USER, True, 0, 1), seen_seq)
+
+    assert cache.get(5).is_active is False
+
+
+if __name__ == "__main__":
+    pytest.main()
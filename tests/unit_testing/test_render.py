@@ -0,0 +1,87 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.models.report import RollupBucket
+from app.models.task import TaskStatus
+from app.schemas.report import ReportSummary
+from app.utilities import render
+from app.utilities.cache import MemoryCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(
+        render, "fragment_cache", MemoryCache(max_bytes=4096, max_entries=100)
+    )
+
+
+def task(task_id: int, updated_at: datetime, **fields) -> dict:
+    return {
+        "id": task_id,
+        "title": "Task",
+        "description": None,
+        "note": None,
+        "status": TaskStatus.OPEN,
+        "updated_at": updated_at,
+        **fields,
+    }
+
+
+def test_fragments_are_cached_by_updated_at(monkeypatch):
+    calls = []
+    to_html = render._to_html
+    monkeypatch.setattr(
+        render, "_to_html", lambda text: calls.append(text) or to_html(text)
+    )
+
+    first = task(1, datetime(2026, 10, 19, 9), title="Write report")
+    assert "<h3>Write report</h3>" in render.render_task(first)
+    render.render_task(first)
+    assert len(calls) == 1
+
+    edited = {
+        **first,
+        "title": "Write the report",
+        "updated_at": datetime(2026, 10, 19, 10),
+    }
+    assert "<h3>Write the report</h3>" in render.render_task(edited)
+    assert len(calls) == 2
+
+
+def test_user_text_cannot_inject_markup():
+    fragment = render.render_task(
+        task(
+            2,
+            datetime(2026, 10, 19),
+            title="<img src=x onerror=alert(1)>",
+            description="[click](javascript:alert(1)) and [docs](https://example.com)",
+        )
+    )
+    assert "<img" not in fragment
+    assert 'href=""' in fragment
+    assert 'href="https://example.com"' in fragment
+
+
+def test_report_groups_tasks_by_status():
+    summary = ReportSummary(
+        bucket=RollupBucket.DAY,
+        from_date=date(2026, 10, 1),
+        to_date=date(2026, 10, 31),
+        created=3,
+        closed=1,
+        periods=[],
+    )
+    tasks = [
+        task(1, datetime(2026, 10, 2), title="Done", status=TaskStatus.CLOSED),
+        task(2, datetime(2026, 10, 3), title="Doing"),
+        task(3, datetime(2026, 10, 4), title="Also doing"),
+    ]
+
+    page = render.render_report(summary, tasks, "Work report: Jo", date(2026, 10, 31))
+
+    assert page.startswith("<!DOCTYPE html>")
+    assert "<title>Work report: Jo</title>" in page
+    assert page.index("<h2>Open (2)</h2>") < page.index("<h2>Closed (1)</h2>")
+    assert "Tasks created: <strong>3</strong>" in page
+    assert "Blocked" not in page
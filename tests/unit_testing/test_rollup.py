@@ -0,0 +1,84 @@
+from datetime import date, datetime
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.report import RollupBucket
+from app.models.task import TaskStatus
+from app.utilities.rollup import (
+    move_rollups,
+    period_start,
+    read_report_summary,
+    record_created,
+    record_transitions,
+    rollup_tables,
+)
+
+PENDING, OPEN, CLOSED = TaskStatus.PENDING, TaskStatus.OPEN, TaskStatus.CLOSED
+
+
+def new_engine():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=rollup_tables)
+    return engine
+
+
+def test_period_start_snaps_weeks_to_monday():
+    assert period_start(date(2026, 10, 22), RollupBucket.WEEK) == date(2026, 10, 19)
+    assert period_start(date(2026, 10, 22), RollupBucket.DAY) == date(2026, 10, 22)
+
+
+def test_rollups_accumulate_per_bucket():
+    with Session(new_engine()) as session:
+        record_created(session, 1, 3, datetime(2026, 10, 19, 9))
+        record_created(session, 1, 2, datetime(2026, 10, 21, 9))
+        record_created(session, 2, 7, datetime(2026, 10, 21, 9))
+        record_transitions(
+            session, 1, [(PENDING, OPEN), (PENDING, OPEN)], datetime(2026, 10, 21)
+        )
+        record_transitions(session, 1, [(OPEN, CLOSED)], datetime(2026, 10, 26))
+        record_transitions(session, 1, [], datetime(2026, 10, 27))
+
+        daily = read_report_summary(
+            session, 1, RollupBucket.DAY, date(2026, 10, 20), date(2026, 10, 31)
+        )
+        assert [(p.period_start.day, p.created, p.closed) for p in daily.periods] == [
+            (21, 2, 0),
+            (26, 0, 1),
+        ]
+        assert [
+            (t.from_status, t.to_status, t.count) for t in daily.periods[0].transitions
+        ] == [(PENDING, OPEN, 2)]
+
+        weekly = read_report_summary(
+            session, 1, RollupBucket.WEEK, date(2026, 10, 21), date(2026, 10, 31)
+        )
+        assert weekly.from_date == date(2026, 10, 19)
+        assert [(p.period_start.day, p.created, p.closed) for p in weekly.periods] == [
+            (19, 5, 0),
+            (26, 0, 1),
+        ]
+        assert (weekly.created, weekly.closed) == (5, 1)
+
+
+def test_move_rollups_merges_into_target():
+    source, target = new_engine(), new_engine()
+    at = datetime(2026, 10, 19)
+
+    with Session(source) as session:
+        record_created(session, 1, 4, at)
+        record_transitions(session, 1, [(OPEN, CLOSED)], at)
+        session.commit()
+    with Session(target) as session:
+        record_created(session, 1, 1, at)
+        session.commit()
+
+    with source.begin() as source_connection, target.begin() as target_connection:
+        move_rollups(source_connection, target_connection, 1)
+
+    day = date(2026, 10, 19)
+    with Session(source) as session:
+        assert read_report_summary(session, 1, RollupBucket.DAY, day, day).periods == []
+    with Session(target) as session:
+        summary = read_report_summary(session, 1, RollupBucket.DAY, day, day)
+        assert (summary.created, summary.closed) == (5, 1)
+        assert len(summary.periods[0].transitions) == 1
@@ -0,0 +1,103 @@
+from collections import Counter
+
+import pytest
+from sqlmodel import Session, SQLModel
+
+from app.models.task import Task, TaskIdSequence
+from app.models.user import User  # noqa
+from app.utilities import shard
+from app.utilities.config import Config
+from app.utilities.database import create_write_engine
+from app.utilities.shard import (
+    Shard,
+    ShardRouter,
+    allocate_task_ids,
+    check_id_stride,
+    sweep_strays,
+)
+
+
+def test_shard_router_is_stable_and_balanced():
+    router = ShardRouter(4)
+    owners = range(1, 4001)
+
+    assignments = [router.shard_for(owner_id) for owner_id in owners]
+    assert assignments == [ShardRouter(4).shard_for(owner_id) for owner_id in owners]
+
+    counts = Counter(assignments)
+    assert set(counts) == {0, 1, 2, 3}
+    assert min(counts.values()) > 500
+
+
+def test_shard_router_growth_moves_few_owners():
+    before, after = ShardRouter(4), ShardRouter(5)
+    owners = range(1, 4001)
+
+    moved = [o for o in owners if before.shard_for(o) != after.shard_for(o)]
+
+    # Only owners claimed by the new shard move
+    assert all(after.shard_for(owner_id) == 4 for owner_id in moved)
+    assert len(moved) < len(owners) * 0.35
+
+
+def test_single_shard_router():
+    assert ShardRouter(1).shard_for(12345) == 0
+
+
+def test_id_stride_must_cover_every_shard(monkeypatch):
+    monkeypatch.setattr(Config, "SHARD_ID_STRIDE", 4)
+    check_id_stride(4)
+
+    # Shard 4's ids would be shard 0's ids one sequence value later
+    with pytest.raises(ValueError, match="SHARD_ID_STRIDE"):
+        check_id_stride(5)
+
+
+def shard_file(tmp_path, index: int, *rows) -> Shard:
+    engine = create_write_engine(f"sqlite:///{tmp_path / f'shard-{index}.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(rows)
+        session.commit()
+    return Shard(index, str(tmp_path / f"shard-{index}.db"), engine, engine)
+
+
+def test_leftover_shards_keep_strided_ids(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "DATABASE_SHARDS", 1)
+    monkeypatch.setattr(Config, "SHARD_ID_STRIDE", 4)
+    leftover = shard_file(tmp_path, 2, TaskIdSequence(id=1, value=10))
+
+    with Session(leftover.write_engine) as session:
+        assert allocate_task_ids(session, 0, 2) is None
+        assert allocate_task_ids(session, 2, 2) == [11 * 4 + 2, 12 * 4 + 2]
+
+
+def test_sweep_moves_only_the_given_owners_strays(tmp_path, monkeypatch):
+    shards = [
+        shard_file(
+            tmp_path,
+            0,
+            Task(id=1, title="a", owner_id=1),
+            Task(id=4, title="b", owner_id=2),
+        ),
+        shard_file(tmp_path, 1, Task(id=5, title="late write", owner_id=1)),
+    ]
+    moves = []
+    monkeypatch.setattr(shard, "shard_indexes", lambda: range(2))
+    monkeypatch.setattr(shard, "get_shard", lambda index: shards[index])
+    monkeypatch.setattr(
+        shard, "move_owner", lambda *args, **kwargs: moves.append((args, kwargs)) or 1
+    )
+
+    # User 1 was moved to shard 1; a request with a stale principal still wrote to shard 0
+    assert sweep_strays({1: 1}, owner_id=1) == 1
+    assert moves == [((1, 0, 1), {"reassign": False})]
+
+    # Without an owner every row is checked; unknown owners belong on shard 0
+    moves.clear()
+    assert sweep_strays({1: 0}) == 1
+    assert moves == [((1, 1, 0), {"reassign": False})]
+
+
+if __name__ == "__main__":
+    pytest.main()
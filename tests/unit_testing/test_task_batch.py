@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.task import Task
+from app.models.user import User, UserRole
+from app.routes.task import get_task_batch, post_task_batch
+from app.schemas.task import TaskBatch
+from app.utilities.config import Config
+from app.utilities.principal_cache import Principal
+
+OWNER = Principal(1, UserRole.USER, True, 0, 0)
+OTHER = Principal(2, UserRole.USER, True, 0, 0)
+
+
+def memory_session(tables: bool = True) -> Session:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    if tables:
+        SQLModel.metadata.create_all(engine)
+    return Session(engine)
+
+
+@pytest.fixture
+def db_session():
+    with memory_session() as session:
+        session.add_all(
+            [
+                User(
+                    id=1,
+                    full_name="Owner",
+                    email_id="owner@example.com",
+                    hashed_password="x",
+                ),
+                User(
+                    id=2,
+                    full_name="Other",
+                    email_id="other@example.com",
+                    hashed_password="x",
+                ),
+                Task(id=1, title="First", owner_id=1),
+                Task(id=2, title="Second", owner_id=1),
+                Task(id=3, title="Deleted", owner_id=1, is_active=False),
+                Task(id=4, title="Not mine", owner_id=2),
+            ]
+        )
+        session.commit()
+        yield session
+
+
+def batch(response) -> tuple[list[int], list[int]]:
+    data = json.loads(response.body)
+    return [task["id"] for task in data["tasks"]], data["missing"]
+
+
+def test_batch_returns_tasks_in_request_order(db_session):
+    # Comma-separated and repeated ids, with a duplicate
+    response = get_task_batch(ids=["2,1", "2", "99"], db_session=db_session, user=OWNER)
+    assert response.media_type == "application/json"
+    assert batch(response) == ([2, 1], [99])
+
+    response = post_task_batch(TaskBatch(ids=[1, 2]), db_session=db_session, user=OWNER)
+    assert batch(response) == ([1, 2], [])
+
+
+def test_batch_only_returns_the_callers_active_tasks(db_session):
+    # Another owner's task and a soft-deleted one are reported missing, not leaked
+    response = post_task_batch(
+        TaskBatch(ids=[4, 3, 1]), db_session=db_session, user=OWNER
+    )
+    assert batch(response) == ([1], [4, 3])
+
+    response = post_task_batch(TaskBatch(ids=[4, 1]), db_session=db_session, user=OTHER)
+    assert batch(response) == ([4], [1])
+
+
+def test_batch_rejects_bad_requests(db_session, monkeypatch):
+    with pytest.raises(HTTPException) as error:
+        get_task_batch(ids=["1,two"], db_session=db_session, user=OWNER)
+    assert error.value.status_code == 400
+
+    monkeypatch.setattr(Config, "BULK_MAX_IDS", 2)
+    with pytest.raises(HTTPException) as error:
+        post_task_batch(TaskBatch(ids=[1, 2, 3]), db_session=db_session, user=OWNER)
+    assert error.value.status_code == 400
+
+
+def test_batch_reports_database_errors_as_500():
+    with memory_session(tables=False) as session:
+        with pytest.raises(HTTPException) as error:
+            post_task_batch(TaskBatch(ids=[1]), db_session=session, user=OWNER)
+    assert error.value.status_code == 500
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,67 @@
+from sqlalchemy import delete, update
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.task import Task, TaskCounter, TaskStatus
+from app.models.user import User
+from app.utilities.task_stats import install_counters, read_task_stats, rebuild_counters
+
+
+def counters(session: Session) -> set[tuple]:
+    rows = session.exec(
+        select(
+            TaskCounter.owner_id,
+            TaskCounter.status,
+            TaskCounter.is_active,
+            TaskCounter.count,
+        )
+    ).all()
+    return {tuple(row) for row in rows if row[3]}
+
+
+def test_counters_follow_every_write(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/stats.db")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(
+            User(
+                full_name="Stats Owner",
+                email_id="stats@example.com",
+                hashed_password="x",
+            )
+        )
+        session.add_all([Task(title=f"Task {index}", owner_id=1) for index in range(3)])
+        session.commit()
+
+    # Installing on a database with tasks seeds the counters
+    install_counters(engine)
+
+    with Session(engine) as session:
+        assert counters(session) == {(1, TaskStatus.OPEN, True, 3)}
+
+        session.exec(update(Task).where(Task.id == 1).values(status=TaskStatus.CLOSED))
+        session.exec(update(Task).where(Task.id == 2).values(is_active=False))
+        session.exec(update(Task).where(Task.id == 3).values(title="Renamed"))
+        session.add(Task(title="Blocked", status=TaskStatus.BLOCKED, owner_id=1))
+        session.commit()
+
+        stats = read_task_stats(session, 1)
+        assert (stats.total, stats.deleted) == (3, 1)
+        assert stats.statuses[TaskStatus.OPEN] == 1
+        assert stats.statuses[TaskStatus.CLOSED] == 1
+        assert stats.statuses[TaskStatus.BLOCKED] == 1
+        assert stats.statuses[TaskStatus.PENDING] == 0
+
+        session.exec(delete(Task).where(Task.id == 4))
+        session.commit()
+        assert read_task_stats(session, 1).statuses[TaskStatus.BLOCKED] == 0
+
+        maintained = counters(session)
+
+    with engine.begin() as connection:
+        connection.execute(delete(TaskCounter))
+        rebuild_counters(connection)
+
+    with Session(engine) as session:
+        assert counters(session) == maintained
+        assert read_task_stats(session, 2).total == 0
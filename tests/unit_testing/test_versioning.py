@@ -0,0 +1,124 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.task import Task, TaskStatus
+from app.models.user import User
+from app.utilities.versioning import (
+    bulk_update,
+    conditional_update,
+    get_if_match,
+    selected_ids,
+)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(
+            User(full_name="Versioned", email_id="v@example.com", hashed_password="x")
+        )
+        session.commit()
+        session.add(Task(title="Task", status=TaskStatus.PENDING, owner_id=1))
+        session.commit()
+        yield session
+
+
+def update_status(db_session, status, expected_version=None):
+    same = HTTPException(status_code=400, detail="same")
+    return conditional_update(
+        db_session,
+        Task,
+        (Task.id == 1, Task.owner_id == 1),
+        {"status": status},
+        expected_version,
+        guards=((Task.status != status, same),),
+        not_found="missing",
+    )
+
+
+def test_conditional_update_bumps_version(db_session):
+    task = update_status(db_session, TaskStatus.OPEN, expected_version=1)
+    assert (task.status, task.version) == (TaskStatus.OPEN, 2)
+
+    task = update_status(db_session, TaskStatus.CLOSED)
+    assert task.version == 3
+
+
+@pytest.mark.parametrize(
+    "status, expected_version, status_code",
+    [
+        (TaskStatus.OPEN, 7, 412),
+        (TaskStatus.PENDING, None, 400),
+        (TaskStatus.PENDING, 7, 412),
+    ],
+)
+def test_conditional_update_reports_why_nothing_changed(
+    db_session, status, expected_version, status_code
+):
+    with pytest.raises(HTTPException) as error:
+        update_status(db_session, status, expected_version)
+    assert error.value.status_code == status_code
+
+
+def test_conditional_update_not_found(db_session):
+    with pytest.raises(HTTPException) as error:
+        conditional_update(
+            db_session, Task, (Task.id == 2,), {"title": "x"}, not_found="missing"
+        )
+    assert (error.value.status_code, error.value.detail) == (404, "missing")
+
+
+@pytest.mark.parametrize(
+    "header, version", [(None, None), ("*", None), ('"3"', 3), ('W/"4"', 4), ("5", 5)]
+)
+def test_get_if_match(header, version):
+    assert get_if_match(header) == version
+
+
+def test_get_if_match_rejects_garbage():
+    with pytest.raises(HTTPException):
+        get_if_match('"abc"')
+
+
+def test_bulk_update_reports_per_id_outcomes(db_session):
+    db_session.add(Task(title="Other", status=TaskStatus.CLOSED, owner_id=1))
+    db_session.add(Task(title="Not mine", status=TaskStatus.PENDING, owner_id=2))
+    db_session.commit()
+
+    rows, result = bulk_update(
+        db_session,
+        Task,
+        (Task.owner_id == 1,),
+        (Task.status != TaskStatus.CLOSED,),
+        {"status": TaskStatus.CLOSED},
+        ids=[3, 1, 2, 99],
+    )
+
+    assert [row[0] for row in rows] == [1]
+    assert result.updated == 1
+    assert [(item.id, item.outcome) for item in result.results] == [
+        (3, "not_found"),
+        (1, "updated"),
+        (2, "unchanged"),
+        (99, "not_found"),
+    ]
+    assert db_session.get(Task, 1).version == 2
+
+
+def test_selected_ids_requires_ids_or_filter():
+    assert selected_ids([3, 1, 3], False) == [3, 1]
+    assert selected_ids(None, True) is None
+    for ids, has_filter in [(None, False), ([1], True)]:
+        with pytest.raises(HTTPException):
+            selected_ids(ids, has_filter)
+
+
+if __name__ == "__main__":
+    pytest.main()
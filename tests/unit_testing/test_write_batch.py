@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlmodel import Session, SQLModel, func, select
+
+from app.models.task import Task
+from app.models.user import User  # noqa
+from app.utilities.database import create_write_engine
+from app.utilities.write_batch import WriteCoordinator
+
+
+@pytest.fixture
+def coordinator(tmp_path):
+    engine = create_write_engine(f"sqlite:///{tmp_path / 'batch.db'}")
+    SQLModel.metadata.create_all(engine)
+    coordinator = WriteCoordinator(engine, window_ms=20, max_ops=64)
+    yield coordinator
+    coordinator.stop()
+
+
+def test_write_batch_isolates_failures(coordinator):
+    def insert(index):
+        def apply(session):
+            task = Task(title=f"Task {index}", owner_id=1)
+            session.add(task)
+            session.flush()
+            if index == 3:
+                raise ValueError("rejected")
+            return task
+
+        return coordinator.submit(apply, lambda task: task.id)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = list(pool.map(insert, range(8)))
+
+    with pytest.raises(ValueError):
+        futures[3].result()
+
+    ids = [future.result() for index, future in enumerate(futures) if index != 3]
+    assert len(set(ids)) == 7
+
+    with Session(coordinator.engine) as session:
+        assert session.exec(select(func.count()).select_from(Task)).one() == 7
+
+
+if __name__ == "__main__":
+    pytest.main()